@@ -0,0 +1,33 @@
+"""email token empresa tipo unique
+
+Revision ID: 5d7b9e1f3a28
+Revises: 8c2e4b6a0d15
+Create Date: 2026-10-16 22:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d7b9e1f3a28'
+down_revision: Union[str, Sequence[str], None] = '8c2e4b6a0d15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Mantém só o token mais recente de cada (empresa, tipo) antes de criar a restrição
+    op.execute(
+        "DELETE FROM email_token a USING email_token b "
+        "WHERE a.id_empresa = b.id_empresa AND a.tipo = b.tipo AND a.id_email < b.id_email"
+    )
+    # O reenvio de token passa a ser INSERT ... ON CONFLICT (id_empresa, tipo) DO UPDATE
+    op.create_unique_constraint('uq_email_token_empresa_tipo', 'email_token', ['id_empresa', 'tipo'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_email_token_empresa_tipo', 'email_token', type_='unique')
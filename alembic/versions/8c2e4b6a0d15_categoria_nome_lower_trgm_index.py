@@ -0,0 +1,38 @@
+"""categoria nome lower trgm index
+
+Revision ID: 8c2e4b6a0d15
+Revises: 3f9a1c7d2b64
+Create Date: 2026-10-16 21:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2e4b6a0d15'
+down_revision: Union[str, Sequence[str], None] = '3f9a1c7d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A busca passa a ser lower(nome) LIKE; o índice trigram acompanha a expressão
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_categoria_nome_lower_trgm "
+            "ON categoria USING gin (lower(nome) gin_trgm_ops)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_categoria_nome_trgm")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_categoria_nome_trgm "
+            "ON categoria USING gin (nome gin_trgm_ops)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_categoria_nome_lower_trgm")
@@ -0,0 +1,35 @@
+"""subcategoria categoria nome unique
+
+Revision ID: 9b4d2f6e8a17
+Revises: 5d7b9e1f3a28
+Create Date: 2026-10-16 23:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4d2f6e8a17'
+down_revision: Union[str, Sequence[str], None] = '5d7b9e1f3a28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Bancos restaurados do dump já têm a restrição; só cria onde ela não existe
+    existing = sa.inspect(op.get_bind()).get_unique_constraints('subcategoria')
+    if any(sorted(c['column_names']) == ['id_categoria', 'nome'] for c in existing):
+        return
+    # A criação de subcategoria passa a ser INSERT ... ON CONFLICT (id_categoria, nome) DO NOTHING
+    op.create_unique_constraint(
+        'subcategoria_id_categoria_nome_key', 'subcategoria', ['id_categoria', 'nome']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('subcategoria_id_categoria_nome_key', 'subcategoria', type_='unique')
@@ -5,8 +5,20 @@ import time
 from typing import Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from loguru import logger
 
+# Sessão HTTP compartilhada: reaproveita conexões (keep-alive/TLS) entre downloads,
+# inclusive entre os workers paralelos do upload de planilha
+_http_session = requests.Session()
+_http_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_http_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Padrões de link do Drive compilados uma vez (chamados por imagem da planilha)
+_DRIVE_FILE_PATH_RE = re.compile(r'/file/d/([a-zA-Z0-9_-]+)')
+_DRIVE_ID_PARAM_RE = re.compile(r'[?&]id=([a-zA-Z0-9_-]+)')
+_DRIVE_DIRECT_RE = re.compile(r'uc\?export=download&id=([a-zA-Z0-9_-]+)')
+
 
 class DriveService:
     """Serviço para converter links do Google Drive e fazer download de imagens"""
@@ -36,13 +48,13 @@ class DriveService:
                 return google_drive_url
             
             # Padrão 1: /file/d/FILE_ID/
-            match = re.search(r'/file/d/([a-zA-Z0-9_-]+)', google_drive_url)
+            match = _DRIVE_FILE_PATH_RE.search(google_drive_url)
             if match:
                 file_id = match.group(1)
                 return f"https://drive.google.com/uc?export=download&id={file_id}"
             
             # Padrão 2: ?id=FILE_ID
-            match = re.search(r'[?&]id=([a-zA-Z0-9_-]+)', google_drive_url)
+            match = _DRIVE_ID_PARAM_RE.search(google_drive_url)
             if match:
                 file_id = match.group(1)
                 return f"https://drive.google.com/uc?export=download&id={file_id}"
@@ -69,17 +81,17 @@ class DriveService:
                 return None
 
             # Padrão 1: /file/d/FILE_ID/
-            match = re.search(r'/file/d/([a-zA-Z0-9_-]+)', url)
+            match = _DRIVE_FILE_PATH_RE.search(url)
             if match:
                 return match.group(1)
 
             # Padrão 2: ?id=FILE_ID (open?id= / uc?id=)
-            match = re.search(r'[?&]id=([a-zA-Z0-9_-]+)', url)
+            match = _DRIVE_ID_PARAM_RE.search(url)
             if match:
                 return match.group(1)
 
             # Padrão 3: uc?export=download&id=FILE_ID
-            match = re.search(r'uc\?export=download&id=([a-zA-Z0-9_-]+)', url)
+            match = _DRIVE_DIRECT_RE.search(url)
             if match:
                 return match.group(1)
 
@@ -111,12 +123,13 @@ class DriveService:
                 logger.info(f"[DRIVE] download attempt={attempt}/{max_attempts} url={url}")
 
                 # timeout como (connect, read)
-                resp = requests.get(url, headers=headers, timeout=(5, timeout), stream=True)
+                resp = _http_session.get(url, headers=headers, timeout=(5, timeout), stream=True)
                 resp.raise_for_status()
 
                 content_type = (resp.headers.get('Content-Type', '') or '').split(';')[0].strip().lower()
                 if not content_type.startswith('image/'):
                     logger.warning(f"[DRIVE] content_type_not_image content_type='{content_type}' url={url}")
+                    resp.close()
                     return None, None
 
                 size = 0
@@ -127,6 +140,7 @@ class DriveService:
                     size += len(chunk)
                     if size > max_bytes:
                         logger.error(f"[DRIVE] image_too_large bytes={size} limit={max_bytes} url={url}")
+                        resp.close()
                         return None, None
                     chunks.append(chunk)
 
@@ -0,0 +1,85 @@
+import queue
+import smtplib
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Tuple
+
+from loguru import logger
+
+
+class SmtpConnectionPool:
+    """
+    Pool limitado de conexões SMTP autenticadas, compartilhado pelos envios concorrentes.
+
+    Cada conexão é reaproveitada até max_messages envios e então encerrada; conexões
+    ociosas passam por um NOOP antes de voltar a ser usadas
+    """
+
+    def __init__(self, connect: Callable[[], smtplib.SMTP], max_size: int = 5, max_messages: int = 100):
+        self._connect = connect
+        self._max_messages = max_messages
+        self._idle: "queue.LifoQueue[Tuple[smtplib.SMTP, int]]" = queue.LifoQueue(maxsize=max_size)
+        # Limita o número de conexões abertas (em uso + ociosas) a max_size
+        self._slots = threading.BoundedSemaphore(max_size)
+
+    @contextmanager
+    def acquire(self) -> Iterator[smtplib.SMTP]:
+        """Empresta uma conexão; bloqueia se todas as max_size estiverem em uso"""
+        self._slots.acquire()
+        try:
+            server, sent = self._checkout()
+            try:
+                yield server
+            except BaseException:
+                # Conexão em estado desconhecido: descarta
+                self._quit(server)
+                raise
+            self._release(server, sent + 1)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Encerra todas as conexões ociosas"""
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._quit(server)
+
+    def _checkout(self) -> Tuple[smtplib.SMTP, int]:
+        while True:
+            try:
+                server, sent = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect(), 0
+            if self._is_alive(server):
+                return server, sent
+            self._quit(server)
+
+    def _release(self, server: smtplib.SMTP, sent: int) -> None:
+        if sent >= self._max_messages:
+            self._quit(server)
+            return
+        try:
+            self._idle.put_nowait((server, sent))
+        except queue.Full:
+            self._quit(server)
+
+    @staticmethod
+    def _is_alive(server: smtplib.SMTP) -> bool:
+        try:
+            return server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    @staticmethod
+    def _quit(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except Exception as e:
+            logger.debug(f"Erro ao encerrar conexão SMTP: {e}")
+            try:
+                server.close()
+            except Exception:
+                pass
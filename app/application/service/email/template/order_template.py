@@ -28,8 +28,8 @@ def order_html(
         HTML formatado do order
     """
     
-    # Constrói a tabela de itens
-    itens_html = ""
+    # Constrói a tabela de itens (linhas unidas com join no fim, sem concatenação a cada item)
+    linhas_itens = []
     for item in itens:
         codigo = item.get('codigo') or 'N/A'
         nome_produto = item.get('nome', 'Produto')
@@ -37,7 +37,7 @@ def order_html(
         preco_unitario = item.get('preco_unitario', 0.0)
         subtotal = item.get('subtotal', 0.0)
         
-        itens_html += f"""
+        linhas_itens.append(f"""
         <tr>
             <td style="padding: 12px; border-bottom: 1px solid #ddd;">{codigo}</td>
             <td style="padding: 12px; border-bottom: 1px solid #ddd;">{nome_produto}</td>
@@ -45,7 +45,8 @@ def order_html(
             <td style="padding: 12px; border-bottom: 1px solid #ddd; text-align: right;">R$ {preco_unitario:.2f}</td>
             <td style="padding: 12px; border-bottom: 1px solid #ddd; text-align: right;">R$ {subtotal:.2f}</td>
         </tr>
-        """
+        """)
+    itens_html = "".join(linhas_itens)
     
     # Seção de endereço
     endereco_html = ""
@@ -1,8 +1,10 @@
 import os
+import threading
 from typing import Optional, List
 from loguru import logger
 
 import envs
+from app.application.service.email.smtp_connection_pool import SmtpConnectionPool
 
 # Tenta importar Resend (recomendado para produção - funciona na Render)
 try:
@@ -25,9 +27,27 @@ class EmailService:
     
     Em produção (Render.com): usa Resend (HTTP) - funciona perfeitamente
     Em desenvolvimento local: pode usar SMTP como fallback
+
+    Singleton: as conexões SMTP (handshake TLS + AUTH) ficam num pool do processo e são
+    reutilizadas entre envios, em vez de uma conexão nova por email
     """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(EmailService, cls).__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
+        return cls._instance
     
     def __init__(self):
+        if self._initialized:
+            return
+
         # Configuração do Resend (recomendado para produção)
         self.resend_api_key = os.getenv("RESEND_API_KEY")
         
@@ -98,6 +118,13 @@ class EmailService:
             self.mail_server = envs.MAIL_SERVER
             self.mail_port = envs.MAIL_PORT
             self.use_tls = True
+            self._smtp_pool = SmtpConnectionPool(
+                self._connect_smtp,
+                max_size=envs.MAIL_SMTP_POOL_SIZE,
+                max_messages=envs.MAIL_SMTP_MAX_MESSAGES_PER_CONNECTION
+            )
+
+        self._initialized = True
 
     def send_email(
         self, 
@@ -189,20 +216,9 @@ class EmailService:
             msg.set_content("Seu cliente de email não suporta HTML.")
             msg.add_alternative(template_html, subtype="html")
 
-            # Contexto SSL
-            context = ssl.create_default_context()
-
-            # Decide entre SSL e TLS
-            if self.mail_port == 465:
-                with smtplib.SMTP_SSL(self.mail_server, self.mail_port, context=context) as server:
-                    server.login(self.username, self.password)
-                    server.send_message(msg)
-            else:
-                with smtplib.SMTP(self.mail_server, self.mail_port) as server:
-                    if self.use_tls:
-                        server.starttls(context=context)
-                    server.login(self.username, self.password)
-                    server.send_message(msg)
+            # Destinatário e cópias seguem na mesma transação SMTP (cabeçalhos To/Cc)
+            with self._smtp_pool.acquire() as server:
+                server.send_message(msg)
 
             if cc:
                 logger.info(f"✅ Email enviado via SMTP para {recipient} com cópia para {', '.join(cc)}")
@@ -230,3 +246,24 @@ class EmailService:
                 return None
             # Outros erros em desenvolvimento, levanta exceção
             raise
+
+    def _connect_smtp(self):
+        """Abre e autentica uma nova conexão SMTP (usado pelo pool)"""
+        # Contexto SSL
+        context = ssl.create_default_context()
+
+        # Decide entre SSL e TLS
+        if self.mail_port == 465:
+            server = smtplib.SMTP_SSL(self.mail_server, self.mail_port, context=context)
+        else:
+            server = smtplib.SMTP(self.mail_server, self.mail_port)
+            if self.use_tls:
+                server.starttls(context=context)
+        server.login(self.username, self.password)
+        return server
+
+    def close(self) -> None:
+        """Encerra as conexões SMTP do pool. Chamado no shutdown da aplicação."""
+        if self.use_resend:
+            return
+        self._smtp_pool.close()
@@ -1,10 +1,12 @@
 """Serviço para processamento completo de planilhas CSV e Excel com kits, regiões e prazos"""
 
+import json
+import numpy as np
 import pandas as pd
+from collections import namedtuple
 from decimal import Decimal
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Any, List, Optional
 import logging
-import re
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,26 @@ COLUMN_CANONICAL_MAP = {
     'imagens_url': 'imagens_url',
 }
 
+# Colunas aceitas para URLs de imagem, em ordem de prioridade
+IMAGE_URL_COLUMNS = [
+    'image_url', 'image_urls', 'imagem_url', 'imagens_url', 'url_imagem', 'url_imagens'
+]
+
+# Resultado do parse em colunas (structure of arrays): cada campo é um ndarray
+# alinhado por linha válida da planilha; row_numbers guarda o número da linha na planilha
+# (cabeçalho = linha 1), calculado antes de descartar linhas vazias. Para o Excel antigo, codigos ficam vazios
+# e categoria/subcategoria vêm por nome em `categorias`/`subcategorias`.
+LoaderResult = namedtuple(
+    'LoaderResult',
+    'format row_numbers codigos nomes descricoes valores quantidades image_urls_col cod_kits '
+    'id_categorias id_subcategorias categorias subcategorias'
+)
+
+
+def _object_array(values, size: int) -> np.ndarray:
+    """Materializa valores Python em ndarray de objetos (sem coerção numérica do pandas)"""
+    return np.fromiter(values, dtype=object, count=size)
+
 
 class ExcelLoaderService:
     """
@@ -151,37 +173,150 @@ class ExcelLoaderService:
             df = df.rename(columns=rename_map)
         return df
 
-    def validate_columns(self, df: pd.DataFrame, file_format: str = None) -> None:
-        """Valida se as colunas obrigatórias estão presentes"""
-        if file_format is None:
-            # Detecta formato pelas colunas presentes
-            has_csv_cols = all(col in df.columns for col in ['codigo', 'Nome'])
-            has_old_excel_cols = all(col in df.columns for col in ['PRODUTO', 'CATEGORIA'])
-            
-            if has_csv_cols:
-                file_format = 'csv'
-            elif has_old_excel_cols:
-                file_format = 'excel'
-            else:
-                raise ValueError(
-                    f"Formato não reconhecido. Colunas encontradas: {list(df.columns)}"
-                )
-        
-        # Se tiver colunas do CSV (novo formato), valida como CSV (funciona para Excel também)
-        if file_format == 'csv' or all(col in df.columns for col in ['codigo', 'Nome']):
-            missing = [c for c in REQUIRED_COLUMNS_CSV if c not in df.columns]
-            if missing:
-                raise ValueError(
-                    f"Colunas obrigatórias ausentes: {missing}. "
-                    f"Colunas disponíveis: {list(df.columns)}"
-                )
-        else:  # excel antigo
-            missing = [c for c in REQUIRED_COLUMNS_EXCEL if c not in df.columns]
-            if missing:
-                raise ValueError(
-                    f"Colunas obrigatórias ausentes no Excel: {missing}. "
-                    f"Colunas disponíveis: {list(df.columns)}"
-                )
+    def parse(self, df: pd.DataFrame) -> LoaderResult:
+        """
+        Detecta o formato, valida as colunas e extrai os dados em uma única passada.
+        Retorna um LoaderResult com as colunas já limpas como arrays NumPy.
+        """
+        present = set(df.columns) & {'codigo', 'Nome', 'PRODUTO', 'CATEGORIA'}
+        if {'codigo', 'Nome'} <= present:
+            file_format = 'csv'
+        elif {'PRODUTO', 'CATEGORIA'} <= present:
+            file_format = 'excel'
+        else:
+            # Default para CSV se não conseguir detectar
+            file_format = 'csv'
+            logger.warning(f"Formato não identificado claramente, usando processamento CSV. Colunas: {list(df.columns)}")
+
+        required = REQUIRED_COLUMNS_CSV if file_format == 'csv' else REQUIRED_COLUMNS_EXCEL
+        missing = [c for c in required if c not in df.columns]
+        if missing:
+            raise ValueError(
+                f"Colunas obrigatórias ausentes: {missing}. "
+                f"Colunas disponíveis: {list(df.columns)}"
+            )
+
+        # Número da linha na planilha (cabeçalho = 1), antes de qualquer filtro de linhas
+        row_numbers = pd.Series(np.arange(2, len(df) + 2), index=df.index)
+        if file_format == 'csv':
+            return self._parse_csv(df, row_numbers)
+        return self._parse_excel(df, row_numbers)
+
+    @staticmethod
+    def _clean_str_column(series: pd.Series) -> pd.Series:
+        """Converte a coluna para string sem espaços nas pontas ('' para vazios)"""
+        return series.fillna('').astype(str).str.strip()
+
+    @staticmethod
+    def _clean_optional_str_column(series: pd.Series) -> np.ndarray:
+        """Como _clean_str_column, mas mantém None nas células vazias (NaN)"""
+        cleaned = series.astype(str).str.strip().to_numpy(dtype=object)
+        cleaned[series.isna().to_numpy()] = None
+        return cleaned
+
+    @staticmethod
+    def _to_int_or_none(value: Any) -> Optional[int]:
+        if pd.isna(value):
+            return None
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def _parse_cod_kit(value: Any) -> Optional[str]:
+        """Normaliza o Codigo Amarração para string (pandas retorna 9089.0 como float)"""
+        if pd.isna(value) or value == '':
+            return None
+        try:
+            if isinstance(value, (int, float)):
+                return str(int(float(value)))
+            return str(value).strip() or None
+        except (ValueError, TypeError):
+            return None
+
+    def _parse_csv(self, df: pd.DataFrame, row_numbers: pd.Series) -> LoaderResult:
+        """Extrai as colunas do formato CSV (também usado pelo Excel novo)"""
+        codigos = self._clean_str_column(df['codigo'])
+        nomes = self._clean_str_column(df['Nome'])
+
+        valid = (codigos != '') | (nomes != '')
+        if not valid.all():
+            logger.debug(f"{int((~valid).sum())} linha(s) ignorada(s): sem código e nome")
+            df, codigos, nomes, row_numbers = df[valid], codigos[valid], nomes[valid], row_numbers[valid]
+
+        generated = 'PROD-' + nomes.str[:20].str.upper().str.replace(' ', '-', regex=False)
+        codigos = codigos.where(codigos != '', generated)
+
+        size = len(df)
+        descricoes = self._clean_optional_str_column(df['Descricao'])
+        valores = _object_array(
+            (self._parse_brazilian_decimal(u) or self._parse_brazilian_decimal(b)
+             for u, b in zip(df['Vlr Unitario'], df['Vlr Bruto'])),
+            size
+        )
+        quantidades = _object_array(
+            (1 if (q := self._to_int_or_none(v)) is None else q for v in df['Quantidade']), size
+        )
+        if 'Codigo Amarração' in df.columns:
+            cod_kits = _object_array((self._parse_cod_kit(v) for v in df['Codigo Amarração']), size)
+        else:
+            cod_kits = np.full(size, None, dtype=object)
+
+        image_cols = [c for c in IMAGE_URL_COLUMNS if c in df.columns]
+        if image_cols:
+            # Primeira coluna de imagem não vazia de cada linha
+            image_cells = df[image_cols].bfill(axis=1).iloc[:, 0]
+            image_urls_col = _object_array((self._parse_image_urls(v) for v in image_cells), size)
+        else:
+            image_urls_col = _object_array(([] for _ in range(size)), size)
+
+        return LoaderResult(
+            format='csv',
+            row_numbers=row_numbers.to_numpy(),
+            codigos=codigos.to_numpy(dtype=object),
+            nomes=nomes.to_numpy(dtype=object),
+            descricoes=descricoes,
+            valores=valores,
+            quantidades=quantidades,
+            image_urls_col=image_urls_col,
+            cod_kits=cod_kits,
+            id_categorias=_object_array((self._to_int_or_none(v) for v in df['id_categoria']), size),
+            id_subcategorias=_object_array((self._to_int_or_none(v) for v in df['id_subcategoria']), size),
+            categorias=None,
+            subcategorias=None,
+        )
+
+    def _parse_excel(self, df: pd.DataFrame, row_numbers: pd.Series) -> LoaderResult:
+        """Extrai as colunas do formato Excel antigo (categoria/subcategoria por nome)"""
+        nomes = self._clean_str_column(df['PRODUTO'])
+        valid = nomes != ''
+        if not valid.all():
+            logger.debug(f"{int((~valid).sum())} linha(s) ignorada(s): sem PRODUTO")
+            df, nomes, row_numbers = df[valid], nomes[valid], row_numbers[valid]
+
+        size = len(df)
+        descricoes = self._clean_optional_str_column(df['DESCRIÇÃO'])
+        valores = _object_array(
+            (self._parse_brazilian_decimal(v) for v in df['VALOR UNITÁRIO']), size
+        )
+        empty = np.full(size, None, dtype=object)
+
+        return LoaderResult(
+            format='excel',
+            row_numbers=row_numbers.to_numpy(),
+            codigos=np.full(size, '', dtype=object),  # Excel antigo não tem código
+            nomes=nomes.to_numpy(dtype=object),
+            descricoes=descricoes,
+            valores=valores,
+            quantidades=np.full(size, 1, dtype=object),
+            image_urls_col=_object_array(([] for _ in range(size)), size),
+            cod_kits=empty,
+            id_categorias=empty,
+            id_subcategorias=empty,
+            categorias=self._clean_str_column(df['CATEGORIA']).to_numpy(dtype=object),
+            subcategorias=self._clean_str_column(df['SUBCATEGORIA']).to_numpy(dtype=object),
+        )
 
     def _parse_brazilian_decimal(self, value: Any) -> Optional[Decimal]:
         """Converte valor brasileiro (vírgula como decimal) ou numérico para Decimal"""
@@ -201,126 +336,14 @@ class ExcelLoaderService:
         except Exception:
             return None
 
-    def extract_entities(self, df: pd.DataFrame, file_format: str = None) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]]]:
-        """
-        Retorna (produtos_list, kits_map)
-        - produtos_list: lista de dicionários com campos limpos
-        - kits_map: { kit_codigo: [produto_codigo, ...] }
-        """
-        # Detecta formato pelas colunas (CSV e Excel novos têm mesma estrutura)
-        has_csv_cols = all(col in df.columns for col in ['codigo', 'Nome'])
-        has_old_excel_cols = all(col in df.columns for col in ['PRODUTO', 'CATEGORIA'])
-        
-        if file_format is None:
-            if has_csv_cols:
-                file_format = 'csv'
-            elif has_old_excel_cols:
-                file_format = 'excel'
-            else:
-                file_format = 'csv'  # Default para novo formato
-
-        # Excel novo (mesma estrutura do CSV) usa método CSV
-        if file_format == 'csv' or has_csv_cols:
-            return self._extract_entities_csv(df)
-        else:
-            return self._extract_entities_excel(df)
-
-    def _extract_entities_csv(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]]]:
-        """Extrai entidades do formato CSV"""
-        produtos = []
-        kits_map = {}
-        
-        for idx, row in df.iterrows():
-            try:
-                codigo = str(row.get('codigo', '') or '').strip()
-                nome = str(row.get('Nome', '') or '').strip()
-                
-                if not codigo and not nome:
-                    logger.debug(f"Linha {idx+2} ignorada: sem código e nome")
-                    continue
-                
-                if not codigo:
-                    codigo = f"PROD-{nome[:20].upper().replace(' ', '-')}"
-                
-                id_categoria = row.get('id_categoria')
-                id_subcategoria = row.get('id_subcategoria')
-                quantidade = row.get('Quantidade', 1)
-                descricao = row.get('Descricao')
-                descricao = None if pd.isna(descricao) else str(descricao).strip()
-                
-                codigo_amarracao = row.get('Codigo Amarração')
-                # Trata valores numéricos do pandas (float64) e strings
-                # Mantém como string (mesmo tipo do codigo)
-                if pd.isna(codigo_amarracao) or codigo_amarracao == '':
-                    codigo_amarracao = None
-                else:
-                    # Converte para string (pandas retorna 9089.0 como float)
-                    try:
-                        if isinstance(codigo_amarracao, (int, float)):
-                            codigo_amarracao = str(int(float(codigo_amarracao)))
-                        else:
-                            codigo_amarracao = str(codigo_amarracao).strip()
-                        # Se ficou vazio após strip, retorna None
-                        if not codigo_amarracao:
-                            codigo_amarracao = None
-                    except (ValueError, TypeError):
-                        codigo_amarracao = None
-                
-                # Valores monetários
-                vlr_unitario = self._parse_brazilian_decimal(row.get('Vlr Unitario'))
-                vlr_bruto = self._parse_brazilian_decimal(row.get('Vlr Bruto'))
-                
-                # Se tem código amarração, é um kit do produto base
-                is_kit = codigo_amarracao is not None and codigo_amarracao != ''
-                
-                # Extrai image_url (pode vir em diferentes nomes de coluna)
-                image_urls = self._extract_image_urls(row)
-                
-                produto = {
-                    "codigo": codigo,
-                    "nome": nome,
-                    "descricao": descricao,
-                    "id_categoria": int(id_categoria) if pd.notna(id_categoria) else None,
-                    "id_subcategoria": int(id_subcategoria) if pd.notna(id_subcategoria) else None,
-                    "quantidade": int(quantidade) if pd.notna(quantidade) else 1,
-                    "valor_base": vlr_unitario or vlr_bruto,
-                    "codigo_amarracao": codigo_amarracao,
-                    "is_kit": is_kit,
-                    "image_urls": image_urls  # Array de URLs
-                }
-                
-                produtos.append(produto)
-                
-                # Registra no mapa de kits (código produto base -> lista de códigos kits)
-                if is_kit and codigo_amarracao:
-                    kits_map.setdefault(codigo_amarracao, []).append(codigo)
-                    
-            except Exception as e:
-                logger.warning(f"Erro parsing linha {idx+2}: {e}")
-                continue
-
-        return produtos, kits_map
-
-    def _extract_image_urls(self, row: pd.Series) -> List[str]:
-        """Extrai URLs de imagem do CSV. Suporta múltiplos formatos:
+    def _parse_image_urls(self, image_data: Any) -> List[str]:
+        """Converte a célula de imagens em lista de URLs. Suporta múltiplos formatos:
         - Array JSON: ["url1", "url2"]
         - Array sem aspas: [url1, url2]
         - Separado por vírgula: "url1,url2,url3"
         - Separado por ponto e vírgula: "url1;url2;url3"
         - String simples: "url1"
         """
-        import json
-        
-        # Tenta diferentes nomes de coluna
-        col_names = ['image_url', 'image_urls', 'imagem_url', 'imagens_url', 'url_imagem', 'url_imagens']
-        image_data = None
-        
-        for col_name in col_names:
-            if col_name in row.index:
-                image_data = row.get(col_name)
-                if pd.notna(image_data):
-                    break
-        
         if image_data is None or pd.isna(image_data):
             return []
         
@@ -361,54 +384,3 @@ class ExcelLoaderService:
         urls = [url.strip() for url in urls if url and url.strip()]
         
         return urls
-
-    def _extract_entities_excel(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]]]:
-        """Extrai entidades do formato Excel (método original)"""
-        produtos = []
-        kits_map = {}
-
-        for idx, row in df.iterrows():
-            try:
-                nome = str(row.get('PRODUTO') or "").strip()
-                if not nome:
-                    logger.debug(f"linha {idx+2} ignorada: sem PRODUTO")
-                    continue
-
-                categoria = str(row.get('CATEGORIA') or "").strip()
-                subcategoria = str(row.get('SUBCATEGORIA') or "").strip()
-                descricao = row.get('DESCRIÇÃO')
-                descricao = None if pd.isna(descricao) else str(descricao).strip()
-
-                regiao = str(row.get('REGIÃO') or "").strip()
-                prazo = str(row.get('PRAZO DE ENTREGA') or "").strip()
-
-                valor_raw = row.get('VALOR UNITÁRIO', None)
-                valor = None
-                if pd.notna(valor_raw):
-                    try:
-                        valor = Decimal(str(valor_raw)).quantize(Decimal("0.01"))
-                    except Exception:
-                        valor = None
-
-                kit_name = None
-                kit_val = row.get('KIT')
-                if pd.notna(kit_val):
-                    kit_name = str(kit_val).strip()
-                    kits_map.setdefault(kit_name, []).append(nome)
-
-                produto = {
-                    "nome": nome,
-                    "descricao": descricao,
-                    "categoria": categoria,
-                    "subcategoria": subcategoria,
-                    "regiao": regiao,
-                    "prazo": prazo,
-                    "valor_base": valor,
-                    "kit": kit_name,
-                }
-                produtos.append(produto)
-            except Exception as e:
-                logger.warning(f"Erro parsing linha {idx+2}: {e}")
-                continue
-
-        return produtos, kits_map
@@ -1,10 +1,30 @@
+import secrets
+import threading
 from passlib.context import CryptContext
-from datetime import datetime, timedelta
-import jwt
 from loguru import logger
 
 class HashService:
+    """
+    Singleton: o CryptContext e o hash de teste do backend bcrypt são criados uma única vez
+    por processo, e não a cada use case instanciado por requisição
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(HashService, cls).__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
+        return cls._instance
+
     def __init__(self):
+        if self._initialized:
+            return
+
         # Configuração do CryptContext com bcrypt
         # Versões fixas: passlib==1.7.4 e bcrypt==4.0.1 para evitar incompatibilidades
         try:
@@ -15,6 +35,7 @@ class HashService:
         except Exception as e:
             logger.error(f"❌ Erro ao inicializar HashService: {e}")
             raise ValueError(f"Falha ao inicializar sistema de hash de senhas: {e}")
+        self._initialized = True
 
     def hash_password(self, password: str) -> str:
         """
@@ -63,10 +84,10 @@ class HashService:
             logger.error(f"Erro ao verificar senha: {e}")
             return False
 
-    def generate_email_token(self, empresa_id: int, expires_in_minutes: int = 60) -> str:
-        """Gera token para verificação de e-mail"""
-        payload = {
-            "sub": str(empresa_id),
-            "exp": datetime.utcnow() + timedelta(minutes=expires_in_minutes)
-        }
-        return jwt.encode(payload, "SECRET_EMAIL_KEY", algorithm="HS256")
+    def generate_email_token(self) -> str:
+        """
+        Gera token opaco para verificação de e-mail / reset de senha.
+        A validação é feita contra a tabela email_token (empresa, tipo e expires_at), então o
+        token não precisa carregar payload assinado: basta ser aleatório e imprevisível
+        """
+        return secrets.token_urlsafe(32)
@@ -1,15 +1,27 @@
 """Persistência de pedidos com itens — compartilhada entre fluxos (e-mail, recompra, etc.)."""
 
 from decimal import Decimal
-from typing import Any, Sequence
+from typing import Any, NamedTuple, Sequence, Union
 
 from app.domain.models.order_model import Order
-from app.domain.models.order_item_model import OrderItem
 from app.infrastructure.repositories.order_repository_interface import IOrderRepository
 
 IPI_ALIQUOTA = Decimal("0.065")
 
 
+class OrderLine(NamedTuple):
+    """Linha de pedido já precificada em Decimal (ex.: recompra), aceita por create_order_with_items."""
+    id_produto: int
+    quantidade_pedida: int
+    valor_unitario: Decimal
+    valor_total: Decimal
+
+
+def _to_decimal(value: Union[Decimal, float]) -> Decimal:
+    """Decimal passa direto; float (DTOs da API) é convertido via str para não herdar o erro binário."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
 def compute_total_order_value_with_ipi_from_subtotal(subtotal_sem_ipi: Decimal) -> Decimal:
     """Total do pedido com IPI (mesma regra do envio por e-mail)."""
     valor_ipi = (subtotal_sem_ipi * IPI_ALIQUOTA).quantize(Decimal("0.01"))
@@ -24,23 +36,22 @@ def create_order_with_items(
 ) -> Order:
     """
     Persiste pedido e itens. Cada item deve expor:
-    id_produto, quantidade_pedida, valor_unitario, valor_total (como no OrderItemUseCaseRequest).
+    id_produto, quantidade_pedida, valor_unitario, valor_total (como no OrderItemUseCaseRequest
+    ou OrderLine); valores Decimal são usados sem reconversão.
     """
+    item_rows = []
     subtotal_sem_ipi = Decimal("0")
     for item in itens:
-        subtotal_sem_ipi += Decimal(str(item.valor_total))
+        subtotal = _to_decimal(item.valor_total)
+        subtotal_sem_ipi += subtotal
+        item_rows.append({
+            "id_produto": item.id_produto,
+            "quantidade": item.quantidade_pedida,
+            "preco_unitario": _to_decimal(item.valor_unitario),
+            "subtotal": subtotal,
+        })
 
     valor_total = compute_total_order_value_with_ipi_from_subtotal(subtotal_sem_ipi)
 
     order = Order(id_cliente=company_id, valor_total=valor_total)
-    for item in itens:
-        order_item = OrderItem(
-            id_pedido=0,
-            id_produto=item.id_produto,
-            quantidade=item.quantidade_pedida,
-            preco_unitario=Decimal(str(item.valor_unitario)),
-            subtotal=Decimal(str(item.valor_total)),
-        )
-        order.itens.append(order_item)
-
-    return order_repository.create_order_with_items(order, session)
+    return order_repository.create_order_with_items(order, item_rows, session)
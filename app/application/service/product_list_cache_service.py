@@ -0,0 +1,96 @@
+"""Serviço com cache em memória das listagens de produtos já serializadas (JSON)"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Listagens são públicas e muito repetidas; 30 segundos limitam a defasagem após alterações
+PRODUCT_LIST_CACHE_TTL_SECONDS = 30
+# Combinações de filtros (estado, categoria, paginação...) mantidas em memória
+PRODUCT_LIST_CACHE_MAX_ENTRIES = 512
+# Marca em session.info: invalidação já agendada para o commit da sessão
+_INVALIDATE_ON_COMMIT_KEY = "product_list_cache_invalidate_on_commit"
+
+
+class ProductListCacheService:
+    """Serviço singleton que guarda o corpo JSON das listagens de produtos por filtros, com TTL"""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(ProductListCacheService, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._cache: "OrderedDict[Hashable, Tuple[float, bytes]]" = OrderedDict()
+        # Incrementada a cada invalidação; store() descarta corpos montados antes dela
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._initialized = True
+
+    @staticmethod
+    def key(request: Dict[str, Any]) -> Hashable:
+        """Chave do cache: os filtros da listagem (valores simples: str, int, bool, None)"""
+        return tuple(sorted(request.items()))
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Retorna o corpo JSON em cache para os filtros, ou None se ausente/expirado"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del self._cache[key]
+                return None
+            return entry[1]
+
+    def generation(self) -> int:
+        """Geração atual do cache; ler antes de consultar o banco e repassar ao store()"""
+        return self._generation
+
+    def store(self, key: Hashable, body: bytes, generation: int) -> None:
+        """
+        Guarda o corpo JSON; ao atingir o limite, descarta a entrada mais antiga.
+        Ignora o corpo se houve invalidação desde a geração lida (dados possivelmente anteriores ao commit)
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._cache[key] = (time.monotonic() + PRODUCT_LIST_CACHE_TTL_SECONDS, body)
+            self._cache.move_to_end(key)
+            while len(self._cache) > PRODUCT_LIST_CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, session: Optional[Session] = None) -> None:
+        """
+        Descarta o cache (chamar após alterações de produtos, imagens ou descontos por região).
+        Com session, a invalidação ocorre após o commit: antes dele, uma listagem concorrente
+        ainda leria as linhas antigas e as guardaria no cache por todo o TTL
+        """
+        if session is not None:
+            if not session.info.get(_INVALIDATE_ON_COMMIT_KEY):
+                session.info[_INVALIDATE_ON_COMMIT_KEY] = True
+                event.listen(session, "after_commit", self._invalidate_after_commit, once=True)
+            return
+
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+        logger.debug("Cache de listagens de produtos invalidado")
+
+    def _invalidate_after_commit(self, session: Session) -> None:
+        session.info.pop(_INVALIDATE_ON_COMMIT_KEY, None)
+        self.invalidate()
@@ -0,0 +1,96 @@
+"""Serviço com cache em memória dos descontos por região (estado)"""
+
+import time
+import threading
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, Optional, Tuple
+from loguru import logger
+
+from app.infrastructure.repositories.region_repository_interface import IRegionRepository
+from app.infrastructure.configs.repository_config import region_repository
+
+# Descontos mudam raramente (alteração administrativa); 5 minutos limita o tempo de defasagem
+REGION_CACHE_TTL_SECONDS = 300
+
+# Estados com descontos próprios; os demais usam os descontos de SP
+OWN_DISCOUNT_STATES: frozenset = frozenset({"MG", "ES"})
+
+
+@dataclass(frozen=True)
+class RegionDiscounts:
+    """Descontos de uma região, desacoplados da entidade ORM (não retém sessão)"""
+    estado: str
+    desconto_0: Decimal
+    desconto_30: Decimal
+    desconto_60: Decimal
+    # (desconto_0, desconto_30, desconto_60) em float, convertidos uma vez por entrada do cache
+    factors: Tuple[float, float, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, 'factors', (float(self.desconto_0), float(self.desconto_30), float(self.desconto_60))
+        )
+
+    def multiplier(self, prazo: int) -> Decimal:
+        """Multiplicador do valor_base para o prazo (0 = à vista, 30 ou 60 dias)"""
+        if prazo == 0:
+            return self.desconto_0
+        if prazo == 30:
+            return self.desconto_30
+        return self.desconto_60
+
+
+class RegionDiscountService:
+    """Serviço singleton que mantém os descontos por estado em cache com TTL"""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(RegionDiscountService, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._cache: Dict[str, Tuple[float, RegionDiscounts]] = {}
+        self._lock = threading.Lock()
+        self.region_repository: IRegionRepository = region_repository
+        self._initialized = True
+
+    def get(self, estado: str, session) -> Optional[RegionDiscounts]:
+        """
+        Retorna os descontos do estado, consultando o banco apenas quando
+        não há entrada válida no cache. Estados inexistentes não são cacheados.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cache.get(estado)
+        if entry and entry[0] > now:
+            return entry[1]
+
+        region = self.region_repository.get_by_estado(estado, session)
+        if not region:
+            return None
+
+        discounts = RegionDiscounts(
+            estado=region.estado,
+            desconto_0=Decimal(str(region.desconto_0)),
+            desconto_30=Decimal(str(region.desconto_30)),
+            desconto_60=Decimal(str(region.desconto_60))
+        )
+        with self._lock:
+            self._cache[estado] = (now + REGION_CACHE_TTL_SECONDS, discounts)
+        return discounts
+
+    def invalidate(self) -> None:
+        """Descarta o cache (chamar após alterações administrativas de regiões)"""
+        with self._lock:
+            self._cache.clear()
+        logger.debug("Cache de descontos por região invalidado")
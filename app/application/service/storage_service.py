@@ -14,7 +14,7 @@ Estrutura de URL:
                                              URL={STORAGE_PUBLIC_BASE_URL}/planilhas/file.xlsx
 """
 
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from loguru import logger
 
 import envs
@@ -83,6 +83,25 @@ class StorageService:
             logger.warning(f"Erro ao remover objeto '{path}': {e}")
             return False
 
+    def delete_files(self, paths: List[str]) -> bool:
+        """Remove vários objetos com uma requisição DeleteObjects por bucket (até 1000 keys cada)."""
+        keys_by_bucket: Dict[str, List[str]] = {}
+        for path in paths:
+            bucket, key = self._split_path(path)
+            keys_by_bucket.setdefault(bucket, []).append(key)
+
+        ok = True
+        for bucket, keys in keys_by_bucket.items():
+            for start in range(0, len(keys), 1000):
+                chunk = keys[start:start + 1000]
+                try:
+                    MinioClient.delete_many(bucket, chunk)
+                    logger.info(f"Removidos {len(chunk)} objeto(s): bucket={bucket}")
+                except Exception as e:
+                    logger.warning(f"Erro ao remover {len(chunk)} objeto(s) do bucket '{bucket}': {e}")
+                    ok = False
+        return ok
+
     def delete_all_images_in_folder(self, folder: str = "") -> bool:
         """Remove todos os objetos com o prefixo dado no bucket de produtos."""
         try:
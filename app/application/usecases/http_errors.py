@@ -0,0 +1,29 @@
+from functools import wraps
+from typing import Tuple, Type
+
+from fastapi import HTTPException, status
+from loguru import logger
+
+
+def http_500_on_error(detail_prefix: str, passthrough: Tuple[Type[Exception], ...] = ()):
+    """
+    Decorator para o execute dos use cases: HTTPException (e as exceções em passthrough)
+    seguem intactas; qualquer outro erro vira HTTP 500 com a mensagem prefixada.
+    """
+    reraise = (HTTPException, *passthrough)
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except reraise:
+                raise
+            except Exception as e:
+                logger.error(f"{detail_prefix}: {e}")
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"{detail_prefix}: {str(e)}"
+                )
+        return wrapper
+    return decorator
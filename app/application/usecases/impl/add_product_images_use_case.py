@@ -7,11 +7,11 @@ from loguru import logger
 
 from app.application.usecases.use_case import UseCase
 from app.application.service.storage_service import StorageService
+from app.application.service.product_list_cache_service import ProductListCacheService
 from app.domain.models.product_image_model import ProductImage
 from app.infrastructure.repositories.product_repository_interface import IProductRepository
 from app.infrastructure.repositories.product_image_repository_interface import IProductImageRepository
-from app.infrastructure.repositories.impl.product_repository_impl import ProductRepositoryImpl
-from app.infrastructure.repositories.impl.product_image_repository_impl import ProductImageRepositoryImpl
+from app.infrastructure.configs.repository_config import product_image_repository, product_repository
 from app.infrastructure.utils.file_utils import get_file_extension_from_content_type
 
 
@@ -20,8 +20,8 @@ class AddProductImagesUseCase(UseCase[Dict[str, Any], List[ProductImage]]):
 
     def __init__(self):
         self.storage_service = StorageService()
-        self.product_repository: IProductRepository = ProductRepositoryImpl()
-        self.product_image_repository: IProductImageRepository = ProductImageRepositoryImpl()
+        self.product_repository: IProductRepository = product_repository
+        self.product_image_repository: IProductImageRepository = product_image_repository
 
     def execute(self, request: Dict[str, Any], session=None) -> List[ProductImage]:
         """
@@ -65,6 +65,7 @@ class AddProductImagesUseCase(UseCase[Dict[str, Any], List[ProductImage]]):
                 f"Imagens adicionadas ao produto {product_id}: "
                 f"{len(created)}/{len(files)} enviadas com sucesso"
             )
+            ProductListCacheService().invalidate(session)
             return created
 
         except HTTPException:
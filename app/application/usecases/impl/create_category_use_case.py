@@ -8,32 +8,14 @@ from app.domain.models.category_model import Category
 from app.domain.models.subcategory_model import Subcategory
 from app.infrastructure.repositories.category_repository_interface import ICategoryRepository
 from app.infrastructure.repositories.subcategory_repository_interface import ISubcategoryRepository
-from app.infrastructure.repositories.impl.category_repository_impl import CategoryRepositoryImpl
-from app.infrastructure.repositories.impl.subcategory_repository_impl import SubcategoryRepositoryImpl
+from app.infrastructure.configs.repository_config import category_repository, subcategory_repository
 from app.presentation.routers.request.category_request import CategoryRequest
-from app.presentation.routers.response.category_response import CategoryResponse, SubcategoryResponse
+from app.presentation.routers.response.category_response import CategoryResponse
 
 
 def _build_category_response(category) -> CategoryResponse:
-    """Builds the category response with subcategories"""
-    # Converte subcategorias
-    subcategory_responses = [
-        SubcategoryResponse(
-            id_subcategoria=sub.id_subcategoria,
-            nome=sub.nome,
-            id_categoria=sub.id_categoria,
-            created_at=sub.created_at,
-            updated_at=sub.updated_at
-        ) for sub in category.subcategorias
-    ]
-
-    return CategoryResponse(
-        id_categoria=category.id_categoria,
-        nome=category.nome,
-        created_at=category.created_at,
-        updated_at=category.updated_at,
-        subcategorias=subcategory_responses
-    )
+    """Builds the category response with subcategories (from_attributes: pydantic-core lê o ORM direto)"""
+    return CategoryResponse.model_validate(category)
 
 
 def _create_subcategory_entity(name: str, category_id: int) -> Subcategory:
@@ -48,8 +30,8 @@ class CreateCategoryUseCase(UseCase[CategoryRequest, CategoryResponse]):
     """Use case for creating category with subcategories"""
 
     def __init__(self):
-        self.category_repo: ICategoryRepository = CategoryRepositoryImpl()
-        self.subcategory_repo: ISubcategoryRepository = SubcategoryRepositoryImpl()
+        self.category_repo: ICategoryRepository = category_repository
+        self.subcategory_repo: ISubcategoryRepository = subcategory_repository
 
     def execute(self, request: CategoryRequest, session=None) -> CategoryResponse:
         """Executes the category creation use case"""
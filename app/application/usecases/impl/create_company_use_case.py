@@ -13,8 +13,7 @@ from app.domain.models.enumerations.role_enumerations import RoleEnum
 from app.domain.exceptions.company_exceptions import CompanyAlreadyExistsException
 from app.infrastructure.repositories.company_repository_interface import ICompanyRepository
 from app.infrastructure.repositories.email_token_repository_interface import IEmailTokenRepository
-from app.infrastructure.repositories.impl.company_repository_impl import CompanyRepositoryImpl
-from app.infrastructure.repositories.impl.email_token_repository_impl import EmailTokenRepositoryImpl
+from app.infrastructure.configs.repository_config import company_repository, email_token_repository
 from app.infrastructure.utils.validate_password import validate_password
 from app.presentation.routers.request.company_request import CompanyRequest
 from app.presentation.routers.response.company_response import CompanyResponse
@@ -22,45 +21,7 @@ from app.presentation.routers.response.company_response import CompanyResponse
 
 def _build_company_response(company) -> CompanyResponse:
     """Constrói a resposta da empresa com endereços e contatos"""
-    from app.presentation.routers.response.company_response import AddressResponse, ContactResponse
-
-    # Converte endereços
-    address_responses = [
-        AddressResponse(
-            id_endereco=addr.id_endereco,
-            cep=addr.cep,
-            numero=addr.numero,
-            complemento=addr.complemento,
-            bairro=addr.bairro,
-            cidade=addr.cidade,
-            uf=addr.uf,
-            ibge=addr.ibge
-        ) for addr in company.enderecos
-    ]
-
-    # Converte contatos
-    contact_responses = [
-        ContactResponse(
-            id_contato=contact.id_contato,
-            nome=contact.nome,
-            telefone=contact.telefone,
-            celular=contact.celular,
-            email=contact.email
-        ) for contact in company.contatos
-    ]
-
-    return CompanyResponse(
-        id_empresa=company.id_empresa,
-        cnpj=company.cnpj,
-        razao_social=company.razao_social,
-        nome_fantasia=company.nome_fantasia,
-        perfil=company.perfil.value,
-        ativo=company.ativo,
-        created_at=company.created_at,
-        updated_at=company.updated_at,
-        enderecos=address_responses,
-        contatos=contact_responses
-    )
+    return CompanyResponse.model_validate(company)
 
 
 def _create_address_entity(request: CompanyRequest) -> Address:
@@ -90,8 +51,8 @@ class CreateCompanyUseCase(UseCase[CompanyRequest, CompanyResponse]):
     """Use case para criação de empresas"""
 
     def __init__(self):
-        self.company_repo: ICompanyRepository = CompanyRepositoryImpl()
-        self.email_token_repo: IEmailTokenRepository = EmailTokenRepositoryImpl()
+        self.company_repo: ICompanyRepository = company_repository
+        self.email_token_repo: IEmailTokenRepository = email_token_repository
         self.hash_service: HashService = HashService()
         self.email_service: EmailService = EmailService()
 
@@ -156,7 +117,7 @@ class CreateCompanyUseCase(UseCase[CompanyRequest, CompanyResponse]):
         """Envia email de verificação para a empresa"""
         from loguru import logger
         
-        token = self.hash_service.generate_email_token(company_id)
+        token = self.hash_service.generate_email_token()
         
         # Cria token de email
         email_token = EmailToken(
@@ -171,12 +132,8 @@ class CreateCompanyUseCase(UseCase[CompanyRequest, CompanyResponse]):
         # Tenta enviar email (não quebra a aplicação se falhar)
         try:
             # Gera HTML do email
-            from urllib.parse import urlencode
-            params = {
-                'token': token,
-                'companyId': str(company_id)
-            }
-            link = f"https://vendas.fortlar.com.br/confirmar-cadastro?{urlencode(params)}"
+            # Token é base64url (secrets.token_urlsafe) e companyId é inteiro: nada a escapar na query string
+            link = f"https://vendas.fortlar.com.br/confirmar-cadastro?token={token}&companyId={company_id}"
             html = verification(link, token)
             
             # Log para debug
@@ -6,14 +6,15 @@ from loguru import logger
 from app.application.usecases.use_case import UseCase
 from app.domain.models.coupon_model import Coupon
 from app.infrastructure.repositories.coupon_repository_interface import ICouponRepository
-from app.infrastructure.repositories.impl.coupon_repository_impl import CouponRepositoryImpl
+from app.infrastructure.configs.repository_config import coupon_repository
 from app.presentation.routers.request.coupon_request import CouponRequest
 from app.presentation.routers.response.coupon_response import CouponResponse
 
 
 def _build_coupon_response(coupon: Coupon) -> CouponResponse:
     """Builds the coupon response"""
-    return CouponResponse(
+    # Campos vêm do ORM já tipados: model_construct dispensa a revalidação do Pydantic
+    return CouponResponse.model_construct(
         id_cupom=coupon.id_cupom,
         codigo=coupon.codigo,
         tipo=coupon.tipo,
@@ -30,7 +31,7 @@ class CreateCouponUseCase(UseCase[CouponRequest, CouponResponse]):
     """Use case for creating coupon"""
 
     def __init__(self):
-        self.coupon_repo: ICouponRepository = CouponRepositoryImpl()
+        self.coupon_repo: ICouponRepository = coupon_repository
 
     def execute(self, request: CouponRequest, session=None) -> CouponResponse:
         """Executes the coupon creation use case"""
@@ -1,8 +1,10 @@
 """Use case para upload completo de planilha CSV ou Excel com kits, regiões, prazos e produtos"""
 
 import io
+import time
 import datetime
 import hashlib
+import numpy as np
 import pandas as pd
 from decimal import Decimal
 from typing import Dict, Any, List, Optional
@@ -11,23 +13,28 @@ from fastapi import HTTPException, status
 import logging
 
 from app.application.usecases.use_case import UseCase
-from app.application.service.excel_loader_service import ExcelLoaderService
+from app.application.service.excel_loader_service import ExcelLoaderService, LoaderResult
 from app.application.service.drive_service import DriveService
 from app.application.service.storage_service import StorageService
+from app.application.service.product_list_cache_service import ProductListCacheService
 from app.infrastructure.repositories.product_repository_interface import IProductRepository
 from app.infrastructure.repositories.category_repository_interface import ICategoryRepository
 from app.infrastructure.repositories.subcategory_repository_interface import ISubcategoryRepository
 from app.infrastructure.repositories.product_image_repository_interface import IProductImageRepository
-from app.infrastructure.repositories.impl.product_repository_impl import ProductRepositoryImpl
-from app.infrastructure.repositories.impl.category_repository_impl import CategoryRepositoryImpl
-from app.infrastructure.repositories.impl.subcategory_repository_impl import SubcategoryRepositoryImpl
-from app.infrastructure.repositories.impl.product_image_repository_impl import ProductImageRepositoryImpl
+from app.infrastructure.configs.repository_config import category_repository, product_image_repository, product_repository, subcategory_repository
 
+from app.domain.models.category_model import Category
+from app.domain.models.subcategory_model import Subcategory
 from app.domain.models.product_model import Product
 from app.domain.models.product_image_model import ProductImage
 
 logger = logging.getLogger(__name__)
 
+# Linhas processadas entre cada gravação em lote (limita memória da sessão)
+IMPORT_FLUSH_BATCH_SIZE = 1000
+# Precisão usada na comparação de valor_base (evita recriar o Decimal a cada linha)
+CENTAVOS = Decimal("0.01")
+
 
 class CreateProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
     """Use case para upload completo de planilha CSV ou Excel"""
@@ -36,13 +43,16 @@ class CreateProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
         self.loader = ExcelLoaderService()
         self.drive_service = DriveService()
         self.storage_service = StorageService()
-        self.product_repository: IProductRepository = ProductRepositoryImpl()
-        self.category_repository: ICategoryRepository = CategoryRepositoryImpl()
-        self.subcategory_repository: ISubcategoryRepository = SubcategoryRepositoryImpl()
-        self.product_image_repository: IProductImageRepository = ProductImageRepositoryImpl()
+        self.product_repository: IProductRepository = product_repository
+        self.category_repository: ICategoryRepository = category_repository
+        self.subcategory_repository: ISubcategoryRepository = subcategory_repository
+        self.product_image_repository: IProductImageRepository = product_image_repository
 
         # Cache global do run: evita download/upload repetidos dentro do mesmo job
         self._shared_image_cache: Dict[str, str] = {}
+        self._commit_every: Optional[int] = None
+        self._last_commit_row = 0
+        self._started_at = 0.0
 
     def _is_stored_url(self, url: str) -> bool:
         """Verifica se a URL já é do storage (MinIO ou legado local) — não requer upload."""
@@ -76,6 +86,8 @@ class CreateProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
                 - 'file_path': caminho do arquivo
                 - 'file_format': 'csv' ou 'excel'
                 - 'clean_before': True para limpar tudo antes (padrão: False)
+                - 'commit_every': commita a cada N linhas em planilhas muito grandes
+                  (padrão: None, transação única com rollback total em caso de erro)
             session: Sessão do banco de dados
             
         Returns:
@@ -91,6 +103,9 @@ class CreateProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
 
         file_format = request.get('file_format', 'auto')
         clean_before = request.get('clean_before', False)  # Nova flag para limpeza
+        self._commit_every = request.get('commit_every')
+        self._last_commit_row = 0
+        self._started_at = time.perf_counter()
         
         self.loader.file_format = file_format
 
@@ -122,57 +137,45 @@ class CreateProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
             df = self.loader.read(file_path)
             logger.info(f"Planilha lida | linhas={len(df)} colunas={list(df.columns)}")
             
-            # Detecta formato pelas colunas (CSV e Excel novo têm mesma estrutura)
-            has_csv_cols = all(col in df.columns for col in ['codigo', 'Nome'])
-            has_old_excel_cols = all(col in df.columns for col in ['PRODUTO', 'CATEGORIA'])
-            
-            # Se tiver colunas do novo formato (CSV), usa processamento CSV mesmo que seja Excel
-            if has_csv_cols:
-                detected_format = 'csv'
-            elif has_old_excel_cols:
-                detected_format = 'excel'
-            else:
-                # Default para CSV se não conseguir detectar
-                detected_format = 'csv'
-                logger.warning(f"Formato não identificado claramente, usando processamento CSV. Colunas: {list(df.columns)}")
-            
-            self.loader.validate_columns(df, detected_format)
-            
-            # Extrai dados (kits_map não é mais necessário, kits são campos do Product)
-            produtos_data, _ = self.loader.extract_entities(df, detected_format)
+            # Detecta formato, valida colunas e extrai dados em uma única passada
+            parsed = self.loader.parse(df)
+            detected_format = parsed.format
+            # Códigos repetidos: a última ocorrência prevalece (mantém o número da linha original)
+            parsed, row_numbers = self._dedupe_by_codigo(parsed)
+            total = len(parsed.nomes)
             
-            if not produtos_data:
+            if not total:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Nenhum produto válido encontrado na planilha"
                 )
 
             logger.info(
-                f"Planilha mapeada | formato={detected_format} | {len(produtos_data)} produto(s) a processar "
+                f"Planilha mapeada | formato={detected_format} | {total} produto(s) a processar "
                 f"(criar novos ou atualizar existentes)"
             )
 
             # Dicionários para evitar duplicatas no mesmo run
             seen_categorias = {}
             seen_subcategorias = {}
-            seen_produtos = {}  # Para CSV: mapeia código -> produto
 
             # Inicia transação
             try:
-                logger.info(f"Iniciando processamento de {len(produtos_data)} produto(s)")
+                logger.info(f"Iniciando processamento de {total} produto(s)")
                 if detected_format == 'csv':
                     self._process_csv_format(
-                        produtos_data, session, summary,
-                        seen_categorias, seen_subcategorias, seen_produtos
+                        parsed, row_numbers, session, summary,
+                        seen_categorias, seen_subcategorias
                     )
                 else:
                     self._process_excel_format(
-                        produtos_data, session, summary,
+                        parsed, row_numbers, session, summary,
                         seen_categorias, seen_subcategorias
                     )
                 
                 logger.info(
-                    f"Processamento concluído | criados={summary['produtos_created']} "
+                    f"Processamento concluído em {time.perf_counter() - self._started_at:.1f}s | "
+                    f"criados={summary['produtos_created']} "
                     f"atualizados={summary['produtos_updated']} imagens_novas={summary['imagens_created']} "
                     f"erros={len(summary['errors'])}"
                 )
@@ -207,6 +210,7 @@ class CreateProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
             logger.error(f"Erro ao gerar planilha atualizada: {e}", exc_info=True)
             # Não falha o processo se houver erro na geração da planilha
 
+        ProductListCacheService().invalidate(session)
         return {
             "success": True,
             "message": "Upload realizado com sucesso",
@@ -214,51 +218,111 @@ class CreateProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
             "excel_url": excel_url
         }
 
+    @staticmethod
+    def _dedupe_by_codigo(parsed: LoaderResult):
+        """
+        Remove linhas com código repetido mantendo a última ocorrência.
+        Linhas sem código (Excel antigo) são preservadas.
+        Retorna (LoaderResult filtrado, números das linhas na planilha para relatório de erros).
+        """
+        codigos = pd.Series(parsed.codigos)
+        keep = ((codigos == '') | ~codigos.duplicated(keep='last')).to_numpy()
+        row_numbers = parsed.row_numbers
+        if keep.all():
+            return parsed, row_numbers
+        logger.info(f"{int((~keep).sum())} linha(s) com código repetido ignorada(s) (última ocorrência prevalece)")
+        return CreateProductUseCase._filter_rows(parsed, row_numbers, keep)
+
+    @staticmethod
+    def _filter_rows(parsed: LoaderResult, row_numbers, keep):
+        """Aplica a máscara booleana keep a todas as colunas do LoaderResult e aos números das linhas"""
+        filtered = {
+            field: value[keep]
+            for field, value in parsed._asdict().items()
+            if isinstance(value, np.ndarray)
+        }
+        return parsed._replace(**filtered), row_numbers[keep]
+
+    @staticmethod
+    def _reject_rows(parsed: LoaderResult, row_numbers, missing, summary, label: str, error: str):
+        """
+        Registra erro para as linhas marcadas em missing (validação vetorizada, antes do loop)
+        e retorna o LoaderResult apenas com as linhas válidas.
+        """
+        if not missing.any():
+            return parsed, row_numbers
+        labels = parsed.codigos if label == "codigo" else parsed.nomes
+        summary["errors"].extend(
+            {"row": row_number, "type": "produto", label: value or 'N/A', "error": error}
+            for row_number, value in zip(row_numbers[missing].tolist(), labels[missing])
+        )
+        return CreateProductUseCase._filter_rows(parsed, row_numbers, ~missing)
+
     def _process_csv_format(
-        self, produtos_data, session, summary,
-        seen_categorias, seen_subcategorias, seen_produtos
+        self, parsed: LoaderResult, row_numbers, session, summary,
+        seen_categorias, seen_subcategorias
     ):
         """Processa formato CSV"""
-        for idx, p in enumerate(produtos_data):
+        parsed, row_numbers = self._reject_rows(
+            parsed, row_numbers, ~parsed.id_categorias.astype(bool), summary,
+            "codigo", "ID da categoria não informado"
+        )
+        rows = zip(
+            row_numbers.tolist(),
+            parsed.codigos, parsed.nomes, parsed.descricoes, parsed.valores, parsed.quantidades,
+            parsed.image_urls_col, parsed.cod_kits, parsed.id_categorias, parsed.id_subcategorias
+        )
+
+        # Valores atuais dos produtos existentes do bloco (carregados em lote) e seus ids
+        existing_by_code: Dict[str, Dict[str, Any]] = {}
+        existing_ids: Dict[str, int] = {}
+        # Novos/alterados são gravados via upsert a cada bloco (uma linha por código); imagens
+        # desses produtos aguardam o id devolvido pelo RETURNING
+        upsert_rows: Dict[str, Dict[str, Any]] = {}
+        pending_images: List[tuple] = []
+        errors_append = summary["errors"].append
+
+        for idx, (row_number, codigo, nome, descricao, valor_base, quantidade, image_urls,
+                  codigo_amarracao, id_categoria, id_subcategoria) in enumerate(rows):
+            if idx % IMPORT_FLUSH_BATCH_SIZE == 0:
+                if idx:
+                    self._flush_csv_batch(upsert_rows, pending_images, existing_ids, session, summary)
+                    # Códigos são únicos após _dedupe_by_codigo: o bloco gravado não é mais consultado
+                    existing_by_code.clear()
+                    existing_ids.clear()
+                    self._checkpoint(idx, session)
+                    self._log_progress(idx, summary)
+                # Pré-carrega os produtos existentes do bloco em uma query IN (evita 1 SELECT por linha)
+                block_codigos = parsed.codigos[idx:idx + IMPORT_FLUSH_BATCH_SIZE]
+                for produto in self.product_repository.get_by_codigos([c for c in block_codigos if c], session):
+                    existing_by_code[produto.codigo] = self._product_values(produto)
+                    existing_ids[produto.codigo] = produto.id_produto
             try:
-                # Busca categoria por ID
-                categoria = None
-                id_categoria = p.get('id_categoria')
-                if id_categoria:
-                    if id_categoria not in seen_categorias:
-                        categoria = self.category_repository.get_by_id(id_categoria, session)
-                        if not categoria:
-                            summary["errors"].append({
-                                "row": idx + 2,
-                                "type": "produto",
-                                "codigo": p.get('codigo', 'N/A'),
-                                "error": f"Categoria com ID {id_categoria} não encontrada"
-                            })
-                            continue
-                        seen_categorias[id_categoria] = categoria
-                    else:
-                        categoria = seen_categorias[id_categoria]
-                else:
-                    summary["errors"].append({
-                        "row": idx + 2,
-                        "type": "produto",
-                        "codigo": p.get('codigo', 'N/A'),
-                        "error": "ID da categoria não informado"
-                    })
-                    continue
+                # Busca categoria por ID (linhas sem ID já foram rejeitadas em _reject_rows)
+                categoria = seen_categorias.get(id_categoria)
+                if categoria is None:
+                    categoria = self.category_repository.get_by_id(id_categoria, session)
+                    if not categoria:
+                        errors_append({
+                            "row": row_number,
+                            "type": "produto",
+                            "codigo": codigo or 'N/A',
+                            "error": f"Categoria com ID {id_categoria} não encontrada"
+                        })
+                        continue
+                    seen_categorias[id_categoria] = categoria
 
                 # Busca subcategoria por ID (opcional)
                 sub = None
-                id_subcategoria = p.get('id_subcategoria')
                 if id_subcategoria:
-                    sub_key = f"{id_categoria}::{id_subcategoria}"
+                    sub_key = (id_categoria, id_subcategoria)
                     if sub_key not in seen_subcategorias:
                         sub = self.subcategory_repository.get_by_id(id_subcategoria, session)
                         if not sub or sub.id_categoria != id_categoria:
-                            summary["errors"].append({
-                                "row": idx + 2,
+                            errors_append({
+                                "row": row_number,
                                 "type": "produto",
-                                "codigo": p.get('codigo', 'N/A'),
+                                "codigo": codigo or 'N/A',
                                 "error": f"Subcategoria com ID {id_subcategoria} não encontrada ou não pertence à categoria {id_categoria}"
                             })
                             continue
@@ -267,123 +331,99 @@ class CreateProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
                         sub = seen_subcategorias[sub_key]
 
                 # Busca ou cria produto por código
-                codigo = p.get('codigo', '').strip()
-                nome = p.get('nome', '').strip()
                 if not codigo and not nome:
                     continue
 
-                existing_product = None
-                if codigo:
-                    existing_product = self.product_repository.get_by_codigo(codigo, session)
-                    seen_produtos[codigo] = existing_product
+                quantidade = int(quantidade) if quantidade is not None else 1
+                existing_product = existing_by_code.get(codigo) if codigo else None
 
                 if existing_product:
                     # Atualiza produto existente: nome e valores (valor_base, quantidade, etc.) são aplicados quando mudam
-                    updated = False
-                    changed_fields = []
-                    if nome and existing_product.nome != nome:
-                        existing_product.nome = nome
-                        updated = True
-                        changed_fields.append("nome")
-                    new_desc = p.get('descricao')
-                    if new_desc is not None:
-                        curr_desc = existing_product.descricao or ""
-                        new_desc_str = str(new_desc).strip() if new_desc else ""
-                        if curr_desc != new_desc_str:
-                            existing_product.descricao = new_desc_str or None
-                            updated = True
-                            changed_fields.append("descricao")
-                    # Valores: normaliza para Decimal para não perder atualização por diferença de tipo
-                    new_valor = p.get('valor_base')
-                    if new_valor is not None:
-                        curr_val = existing_product.valor_base
-                        new_dec = Decimal(str(new_valor)).quantize(Decimal("0.01"))
-                        curr_dec = curr_val.quantize(Decimal("0.01")) if curr_val is not None else None
-                        if curr_dec != new_dec:
-                            existing_product.valor_base = new_dec
-                            updated = True
-                            changed_fields.append("valor_base")
-                    if categoria and existing_product.id_categoria != categoria.id_categoria:
-                        existing_product.id_categoria = categoria.id_categoria
-                        updated = True
-                        changed_fields.append("id_categoria")
-                    if sub and existing_product.id_subcategoria != sub.id_subcategoria:
-                        existing_product.id_subcategoria = sub.id_subcategoria
-                        updated = True
-                        changed_fields.append("id_subcategoria")
-                    quantidade = p.get('quantidade', 1)
-                    qty = int(quantidade) if quantidade is not None else 1
-                    if existing_product.quantidade != qty:
-                        existing_product.quantidade = qty
-                        updated = True
-                        changed_fields.append("quantidade")
-                    codigo_amarracao = p.get('codigo_amarracao')
-                    cod_kit = codigo_amarracao if codigo_amarracao else None
-                    logger.debug(f"Produto {codigo}: codigo_amarracao={codigo_amarracao} -> cod_kit={cod_kit}")
-                    current_cod_kit = existing_product.cod_kit if existing_product.cod_kit is not None else None
-                    new_cod_kit = cod_kit if cod_kit is not None else None
-                    if current_cod_kit != new_cod_kit:
-                        existing_product.cod_kit = cod_kit
-                        updated = True
-                        changed_fields.append("cod_kit")
-                        logger.debug(f"Atualizando cod_kit do produto {codigo}: {current_cod_kit} -> {new_cod_kit}")
-                    if updated:
-                        self.product_repository.update(existing_product, session)
+                    diff = self._product_diff(
+                        existing_product, nome, descricao, valor_base, categoria, sub,
+                        quantidade=quantidade,
+                        cod_kit=codigo_amarracao or None
+                    )
+                    if diff:
+                        existing_product.update(diff)
+                        upsert_rows[codigo] = existing_product
                         summary["produtos_updated"] += 1
-                        logger.info(
-                            f"[ATUALIZAR] codigo={codigo} | campos alterados: {', '.join(changed_fields)}"
-                        )
+                        # Logs por linha em DEBUG com argumentos preguiçosos; o progresso vai em INFO por bloco
+                        logger.debug("[ATUALIZAR] codigo=%s | campos alterados: %s", codigo, ', '.join(diff))
                     else:
-                        logger.info(f"[MANTER] codigo={codigo} | sem alterações nos dados do produto")
-                    produto = existing_product
-                    self._process_product_images(produto, p.get('image_urls', []), session, summary)
+                        logger.debug("[MANTER] codigo=%s | sem alterações nos dados do produto", codigo)
+                    pending_images.append((codigo, image_urls))
                 else:
                     # Cria novo produto
                     if not codigo:
                         codigo = f"PROD-{nome[:20].upper().replace(' ', '-')}"
                         counter = 1
                         original_codigo = codigo
-                        while self.product_repository.get_by_codigo(codigo, session):
+                        # Códigos gerados no bloco ainda não gravados também contam (o upsert os fundiria)
+                        while codigo in upsert_rows or self.product_repository.get_by_codigo(codigo, session):
                             codigo = f"{original_codigo}-{counter}"
                             counter += 1
                     
                     # cod_kit agora é string (mesmo tipo do codigo)
-                    codigo_amarracao = p.get('codigo_amarracao')
                     cod_kit = codigo_amarracao if codigo_amarracao else None
-                    logger.debug(f"Criando produto {codigo}: codigo_amarracao={codigo_amarracao} -> cod_kit={cod_kit}")
-                    
-                    # Obtém quantidade
-                    quantidade = p.get('quantidade', 1)
+                    logger.debug("Criando produto %s: codigo_amarracao=%s -> cod_kit=%s", codigo, codigo_amarracao, cod_kit)
                     
-                    produto = Product(
-                        codigo=codigo,
-                        nome=nome,
-                        descricao=p.get('descricao'),
-                        id_categoria=categoria.id_categoria if categoria else None,
-                        id_subcategoria=sub.id_subcategoria if sub else None,
-                        valor_base=p.get('valor_base') or 0,
-                        quantidade=quantidade,
-                        cod_kit=cod_kit,
-                        ativo=True
-                    )
-                    produto = self.product_repository.create(produto, session)
-                    seen_produtos[codigo] = produto
+                    upsert_rows[codigo] = {
+                        "codigo": codigo,
+                        "nome": nome,
+                        "descricao": descricao,
+                        "id_categoria": categoria.id_categoria if categoria else None,
+                        "id_subcategoria": sub.id_subcategoria if sub else None,
+                        "valor_base": valor_base or 0,
+                        "quantidade": quantidade,
+                        "cod_kit": cod_kit,
+                        "ativo": True,
+                    }
                     summary["produtos_created"] += 1
-                    logger.info(f"[CRIAR] codigo={codigo} | nome={nome}")
+                    logger.debug("[CRIAR] codigo=%s | nome=%s", codigo, nome)
                     
-                    # Processa imagens do produto
-                    self._process_product_images(produto, p.get('image_urls', []), session, summary)
+                    # Imagens são processadas após o upsert em lote (precisam do id_produto)
+                    pending_images.append((codigo, image_urls))
 
             except Exception as e:
-                summary["errors"].append({
-                    "row": idx + 2,
+                errors_append({
+                    "row": row_number,
                     "type": "produto",
-                    "codigo": p.get('codigo', 'N/A'),
+                    "codigo": codigo or 'N/A',
                     "error": str(e)
                 })
-                logger.warning(f"Erro ao processar linha {idx+2}: {e}")
+                logger.warning(f"Erro ao processar linha {row_number}: {e}")
+
+        self._flush_csv_batch(upsert_rows, pending_images, existing_ids, session, summary)
 
-    def _process_product_images(self, produto: Product, image_urls: List[str], session: Session, summary: Dict[str, Any]):
+    def _flush_csv_batch(self, upsert_rows, pending_images, existing_ids, session, summary):
+        """
+        Grava o bloco com um INSERT ... ON CONFLICT (codigo) DO UPDATE RETURNING (atômico entre imports
+        concorrentes) e processa as imagens pendentes com os ids devolvidos
+        """
+        ids_by_codigo = dict(existing_ids)
+        ids_by_codigo.update(self.product_repository.upsert_many(list(upsert_rows.values()), session))
+        for codigo, image_urls in pending_images:
+            self._process_product_images(ids_by_codigo[codigo], codigo, image_urls, session, summary)
+        upsert_rows.clear()
+        pending_images.clear()
+
+    def _log_progress(self, rows_done: int, summary: Dict[str, Any]):
+        """Uma linha de log agregada por bloco gravado (em vez de uma por produto)"""
+        elapsed = time.perf_counter() - self._started_at
+        logger.info(
+            f"Progresso | {rows_done} linha(s) em {elapsed:.1f}s | criados={summary['produtos_created']} "
+            f"atualizados={summary['produtos_updated']} erros={len(summary['errors'])}"
+        )
+
+    def _checkpoint(self, rows_done: int, session: Session):
+        """Commit intermediário opcional (request 'commit_every') para limitar locks e WAL em planilhas enormes"""
+        if self._commit_every and rows_done - self._last_commit_row >= self._commit_every:
+            session.commit()
+            self._last_commit_row = rows_done
+            logger.info(f"Commit intermediário após {rows_done} linha(s)")
+
+    def _process_product_images(self, id_produto: int, codigo: str, image_urls: List[str], session: Session, summary: Dict[str, Any]):
         """
         Processa as imagens do produto:
         1. Deduplica URLs (por produto) mantendo ordem
@@ -397,26 +437,26 @@ class CreateProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
         if not unique_urls:
             return
 
-        existing_images = self.product_image_repository.get_by_produto(produto.id_produto, session)
+        existing_images = self.product_image_repository.get_by_produto(id_produto, session)
         processed_urls: set[str] = set()
         created_count = 0
 
-        logger.info(f"[IMG] produto={produto.codigo} unique_urls={len(unique_urls)}")
+        logger.info(f"[IMG] produto={codigo} unique_urls={len(unique_urls)}")
 
         for idx, original_url in enumerate(unique_urls, start=1):
             try:
                 if not (original_url.startswith("http://") or original_url.startswith("https://")):
-                    logger.warning(f"[IMG] produto={produto.codigo} idx={idx} invalid_url={original_url[:120]}")
+                    logger.warning(f"[IMG] produto={codigo} idx={idx} invalid_url={original_url[:120]}")
                     continue
 
                 download_url = self.drive_service.convert_drive_link(original_url)
                 if not download_url:
                     summary["errors"].append({
                         "type": "imagem",
-                        "product_codigo": produto.codigo,
+                        "product_codigo": codigo,
                         "error": f"Não foi possível converter link do Drive: {original_url[:120]}"
                     })
-                    logger.error(f"[IMG] produto={produto.codigo} idx={idx} convert_failed url={original_url[:120]}")
+                    logger.error(f"[IMG] produto={codigo} idx={idx} convert_failed url={original_url[:120]}")
                     continue
 
                 # Caso já seja URL do storage local: não faz download/upload
@@ -444,10 +484,10 @@ class CreateProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
                             if not image_bytes:
                                 summary["errors"].append({
                                     "type": "imagem",
-                                    "product_codigo": produto.codigo,
+                                    "product_codigo": codigo,
                                     "error": f"Falha no download: {download_url[:120]}"
                                 })
-                                logger.error(f"[IMG] produto={produto.codigo} idx={idx} download_failed url={download_url[:120]}")
+                                logger.error(f"[IMG] produto={codigo} idx={idx} download_failed url={download_url[:120]}")
                                 continue
 
                             content_type = content_type or "image/jpeg"
@@ -459,10 +499,10 @@ class CreateProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
                             if not uploaded_url:
                                 summary["errors"].append({
                                     "type": "imagem",
-                                    "product_codigo": produto.codigo,
+                                    "product_codigo": codigo,
                                     "error": "Falha no upload para storage local (retornou None)"
                                 })
-                                logger.error(f"[IMG] produto={produto.codigo} idx={idx} upload_failed key={key}")
+                                logger.error(f"[IMG] produto={codigo} idx={idx} upload_failed key={key}")
                                 continue
 
                             storage_url = uploaded_url
@@ -470,25 +510,25 @@ class CreateProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
                             source = "uploaded"
 
                 # Registra para este produto (evita duplicata por produto)
-                if self.product_image_repository.exists_by_url(storage_url, produto.id_produto, session):
+                if self.product_image_repository.exists_by_url(storage_url, id_produto, session):
                     processed_urls.add(storage_url)
-                    logger.debug(f"[IMG] produto={produto.codigo} idx={idx} db_skip=exists source={source}")
+                    logger.debug(f"[IMG] produto={codigo} idx={idx} db_skip=exists source={source}")
                     continue
 
                 created = self.product_image_repository.create(
-                    ProductImage(id_produto=produto.id_produto, url=storage_url),
+                    ProductImage(id_produto=id_produto, url=storage_url),
                     session
                 )
                 created_count += 1
                 summary["imagens_created"] += 1
                 processed_urls.add(storage_url)
-                logger.info(f"[IMG] produto={produto.codigo} idx={idx} db_created=1 id_imagem={created.id_imagem} source={source}")
+                logger.info(f"[IMG] produto={codigo} idx={idx} db_created=1 id_imagem={created.id_imagem} source={source}")
 
             except Exception as e:
-                logger.error(f"[IMG] produto={produto.codigo} idx={idx} exception={e}", exc_info=True)
+                logger.error(f"[IMG] produto={codigo} idx={idx} exception={e}", exc_info=True)
                 summary["errors"].append({
                     "type": "imagem",
-                    "product_codigo": produto.codigo,
+                    "product_codigo": codigo,
                     "error": f"Erro ao processar imagem {idx}: {str(e)}"
                 })
 
@@ -496,9 +536,9 @@ class CreateProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
         for img in existing_images:
             if img.url not in processed_urls:
                 self.product_image_repository.delete(img.id_imagem, session)
-                logger.info(f"[IMG] produto={produto.codigo} db_deleted=1 id_imagem={img.id_imagem}")
+                logger.info(f"[IMG] produto={codigo} db_deleted=1 id_imagem={img.id_imagem}")
 
-        logger.info(f"[IMG] produto={produto.codigo} created={created_count} processed={len(processed_urls)} cache_size={len(self._shared_image_cache)}")
+        logger.info(f"[IMG] produto={codigo} created={created_count} processed={len(processed_urls)} cache_size={len(self._shared_image_cache)}")
 
     def _clean_all_data(self, session: Session) -> Dict[str, int]:
         """
@@ -660,116 +700,156 @@ class CreateProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
             return None
 
     def _process_excel_format(
-        self, produtos_data, session, summary,
+        self, parsed: LoaderResult, row_numbers, session, summary,
         seen_categorias, seen_subcategorias
     ):
         """Processa formato Excel (método original) - TODO: Implementar se necessário"""
+        parsed, row_numbers = self._reject_rows(
+            parsed, row_numbers, parsed.categorias == '', summary,
+            "nome", "Category não informada"
+        )
+        rows = zip(
+            row_numbers.tolist(),
+            parsed.codigos, parsed.nomes, parsed.descricoes, parsed.valores,
+            parsed.categorias, parsed.subcategorias
+        )
+
+        # Pré-carrega categorias/subcategorias existentes em lote (2 queries IN em vez de 1 por linha)
+        cat_keys = {c for c in parsed.categorias if c}
+        sub_keys = {s for s in parsed.subcategorias if s}
+        for categoria in self.category_repository.get_by_names(list(cat_keys), session):
+            seen_categorias.setdefault(categoria.nome, categoria)
+        cat_key_by_id = {c.id_categoria: key for key, c in seen_categorias.items()}
+        for sub in self.subcategory_repository.get_by_names(list(sub_keys), session):
+            owner_key = cat_key_by_id.get(sub.id_categoria)
+            if owner_key:
+                seen_subcategorias.setdefault((owner_key, sub.nome), sub)
+
+        # Valores atuais dos produtos por código do bloco (existentes carregados em lote + criados no bloco)
+        existing_by_code: Dict[str, Dict[str, Any]] = {}
+        # Linhas a gravar via upsert, uma por código (a última ocorrência prevalece)
+        upsert_rows: Dict[str, Dict[str, Any]] = {}
+        errors_append = summary["errors"].append
+
         # Processa produtos
-        for idx, p in enumerate(produtos_data):
+        for idx, (row_number, product_code, product_nome, descricao, valor_base, cat_key, sub_key) in enumerate(rows):
+            if idx % IMPORT_FLUSH_BATCH_SIZE == 0:
+                if idx:
+                    self.product_repository.upsert_many(list(upsert_rows.values()), session)
+                    upsert_rows.clear()
+                    # Códigos são únicos após _dedupe_by_codigo: o bloco gravado não é mais consultado
+                    existing_by_code.clear()
+                    self._checkpoint(idx, session)
+                    self._log_progress(idx, summary)
+                block_codigos = parsed.codigos[idx:idx + IMPORT_FLUSH_BATCH_SIZE]
+                existing_by_code.update(
+                    (p.codigo, self._product_values(p))
+                    for p in self.product_repository.get_by_codigos([c for c in block_codigos if c], session)
+                )
             try:
-                # Category
-                categoria = None
-                cat_key = p.get('categoria', '').strip()
-                if not cat_key:
-                    summary["errors"].append({
-                        "row": idx + 2,
-                        "type": "produto",
-                        "nome": p.get('nome', 'N/A'),
-                        "error": "Category não informada"
-                    })
-                    continue
-                
-                if cat_key:
-                    if cat_key not in seen_categorias:
-                        # Tenta buscar existente
-                        categoria = self.category_repository.get_by_name(cat_key, session)
-                        if not categoria:
-                            # Cria nova
-                            from app.domain.models.category_model import Category
-                            categoria = Category(nome=cat_key)
-                            categoria = self.category_repository.create(categoria, session)
-                            summary["categorias_created"] += 1
-                        seen_categorias[cat_key] = categoria
-                    else:
-                        categoria = seen_categorias[cat_key]
+                # Category (linhas sem categoria já foram rejeitadas em _reject_rows)
+                categoria = seen_categorias.get(cat_key)
+                if categoria is None:
+                    # Não existe no banco (já pré-carregado): cria nova
+                    categoria = self.category_repository.create(Category(nome=cat_key), session)
+                    summary["categorias_created"] += 1
+                    seen_categorias[cat_key] = categoria
 
                 # Subcategory
                 sub = None
-                sub_key = p.get('subcategoria', '').strip()
                 if sub_key and categoria:
-                    sc_key = f"{cat_key}::{sub_key}"
+                    sc_key = (cat_key, sub_key)
                     if sc_key not in seen_subcategorias:
-                        # Busca existente (por nome e categoria)
-                        sub = self.subcategory_repository.get_by_name(sub_key, session)
-                        if sub and sub.id_categoria != categoria.id_categoria:
-                            # Nome existe mas para outra categoria, cria novo
-                            sub = None
-                        if not sub:
-                            # Cria nova
-                            from app.domain.models.subcategory_model import Subcategory
-                            sub = Subcategory(nome=sub_key, id_categoria=categoria.id_categoria)
-                            sub = self.subcategory_repository.create(sub, session)
-                            summary["subcategorias_created"] += 1
+                        # Não existe para esta categoria (já pré-carregado): cria nova
+                        sub = Subcategory(nome=sub_key, id_categoria=categoria.id_categoria)
+                        sub = self.subcategory_repository.create(sub, session)
+                        summary["subcategorias_created"] += 1
                         seen_subcategorias[sc_key] = sub
                     else:
                         sub = seen_subcategorias[sc_key]
 
-                # Product - busca por nome exato
-                product_nome = p.get('nome', '').strip()
-                product_code = p.get('codigo', '').strip()
+                # Product - busca por código
                 if not product_code:
                     continue
                     
-                existing_product = self.product_repository.get_by_codigo(product_code, session)
+                existing_product = existing_by_code.get(product_code)
                 
                 if existing_product:
                     # Atualiza produto existente: nome e valores aplicados quando mudam
-                    updated = False
-                    if product_nome and existing_product.nome != product_nome:
-                        existing_product.nome = product_nome
-                        updated = True
-                    if p.get('descricao') is not None:
-                        curr_desc = existing_product.descricao or ""
-                        new_desc_str = str(p.get('descricao')).strip() if p.get('descricao') else ""
-                        if curr_desc != new_desc_str:
-                            existing_product.descricao = new_desc_str or None
-                            updated = True
-                    new_valor = p.get('valor_base')
-                    if new_valor is not None:
-                        curr_val = existing_product.valor_base
-                        new_dec = Decimal(str(new_valor)).quantize(Decimal("0.01"))
-                        curr_dec = curr_val.quantize(Decimal("0.01")) if curr_val is not None else None
-                        if curr_dec != new_dec:
-                            existing_product.valor_base = new_dec
-                            updated = True
-                    if categoria and existing_product.id_categoria != categoria.id_categoria:
-                        existing_product.id_categoria = categoria.id_categoria
-                        updated = True
-                    if sub and existing_product.id_subcategoria != sub.id_subcategoria:
-                        existing_product.id_subcategoria = sub.id_subcategoria
-                        updated = True
-                    if updated:
-                        self.product_repository.update(existing_product, session)
+                    diff = self._product_diff(existing_product, product_nome, descricao, valor_base, categoria, sub)
+                    if diff:
+                        existing_product.update(diff)
+                        upsert_rows[product_code] = existing_product
                         summary["produtos_updated"] += 1
                 else:
-                    produto = Product(
-                        codigo=product_code,
-                        nome=product_nome,
-                        descricao=p.get('descricao'),
-                        id_categoria=categoria.id_categoria if categoria else None,
-                        id_subcategoria=sub.id_subcategoria if sub else None,
-                        valor_base=p.get('valor_base') or 0,
-                        quantidade=1,  # Excel antigo não tem quantidade
-                        cod_kit=None,  # Excel antigo não tem código amarração
-                        ativo=True
-                    )
-                    self.product_repository.create(produto, session)
+                    produto = {
+                        "codigo": product_code,
+                        "nome": product_nome,
+                        "descricao": descricao,
+                        "id_categoria": categoria.id_categoria if categoria else None,
+                        "id_subcategoria": sub.id_subcategoria if sub else None,
+                        "valor_base": valor_base or 0,
+                        "quantidade": 1,  # Excel antigo não tem quantidade
+                        "cod_kit": None,  # Excel antigo não tem código amarração
+                        "ativo": True,
+                    }
+                    upsert_rows[product_code] = produto
+                    existing_by_code[product_code] = produto
                     summary["produtos_created"] += 1
 
             except Exception as e:
-                summary["errors"].append({
-                    "row": idx + 2,
+                errors_append({
+                    "row": row_number,
                     "type": "produto",
-                    "nome": p.get('nome', 'N/A'),
+                    "nome": product_nome or 'N/A',
                     "error": str(e)
                 })
+
+        # Um INSERT ... ON CONFLICT (codigo) DO UPDATE por bloco, em vez de SELECT + INSERT/UPDATE por linha
+        self.product_repository.upsert_many(list(upsert_rows.values()), session)
+
+    @staticmethod
+    def _product_diff(current: Dict[str, Any], nome, descricao, valor_base, categoria, sub, **extra) -> Dict[str, Any]:
+        """
+        Colunas cujo valor da planilha difere do atual (current no formato de _product_values).
+        Campos não informados na planilha (nome vazio, descrição/valor ausentes, sem categoria/subcategoria)
+        não entram como candidatos; extra são candidatos sempre comparados (ex.: quantidade, cod_kit).
+        """
+        candidate: Dict[str, Any] = {}
+        if nome:
+            candidate["nome"] = nome
+        if descricao is not None:
+            candidate["descricao"] = (str(descricao).strip() if descricao else "") or None
+        # Valores: normaliza para Decimal para não perder atualização por diferença de tipo
+        if valor_base is not None:
+            candidate["valor_base"] = Decimal(str(valor_base)).quantize(CENTAVOS)
+        if categoria:
+            candidate["id_categoria"] = categoria.id_categoria
+        if sub:
+            candidate["id_subcategoria"] = sub.id_subcategoria
+        candidate.update(extra)
+
+        curr_val = current["valor_base"]
+        normalized = {
+            "descricao": current["descricao"] or None,
+            "valor_base": Decimal(str(curr_val)).quantize(CENTAVOS) if curr_val is not None else None,
+        }
+        return {
+            field: value for field, value in candidate.items()
+            if normalized.get(field, current[field]) != value
+        }
+
+    @staticmethod
+    def _product_values(product: Product) -> Dict[str, Any]:
+        """Colunas gravadas pelo upsert do import, a partir de um produto existente"""
+        return {
+            "codigo": product.codigo,
+            "nome": product.nome,
+            "descricao": product.descricao,
+            "id_categoria": product.id_categoria,
+            "id_subcategoria": product.id_subcategoria,
+            "valor_base": product.valor_base,
+            "quantidade": product.quantidade,
+            "cod_kit": product.cod_kit,
+            "ativo": product.ativo,
+        }
@@ -4,9 +4,11 @@ from fastapi import HTTPException, status
 from loguru import logger
 
 from app.application.usecases.use_case import UseCase
+from app.application.service.region_discount_service import RegionDiscountService
+from app.application.service.product_list_cache_service import ProductListCacheService
 from app.domain.models.regions_model import Regions
 from app.infrastructure.repositories.region_repository_interface import IRegionRepository
-from app.infrastructure.repositories.impl.region_repository_impl import RegionRepositoryImpl
+from app.infrastructure.configs.repository_config import region_repository
 from app.presentation.routers.request.region_request import RegionRequest
 from app.presentation.routers.response.region_response import RegionResponse
 
@@ -28,12 +30,10 @@ class CreateRegionUseCase(UseCase[RegionRequest, RegionResponse]):
     """Use case for creating region"""
 
     def __init__(self):
-        self.region_repo: IRegionRepository = RegionRepositoryImpl()
+        self.region_repo: IRegionRepository = region_repository
 
     def execute(self, request: RegionRequest, session=None) -> RegionResponse:
         """Executes the region creation use case"""
-        self._validate_request(request, session)
-
         # Create region entity
         region = Regions(
             estado=request.estado,
@@ -41,17 +41,16 @@ class CreateRegionUseCase(UseCase[RegionRequest, RegionResponse]):
             desconto_30=request.desconto_30,
             desconto_60=request.desconto_60
         )
-        region = self.region_repo.create(region, session)
-        logger.info(f"Region created: {region.id_regiao} - {region.estado}")
-
-        # Return response
-        return _build_region_response(region)
-
-    def _validate_request(self, request: RegionRequest, session) -> None:
-        """Validates the request data"""
-        if self.region_repo.exists_by_estado(request.estado, session=session):
+        # Existence check and insert happen in the same statement (ON CONFLICT DO NOTHING)
+        created = self.region_repo.create(region, session)
+        if created is None:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail=f"Region with estado '{request.estado}' already exists"
             )
+        logger.info(f"Region created: {created.id_regiao} - {created.estado}")
+        RegionDiscountService().invalidate()
+        ProductListCacheService().invalidate(session)
 
+        # Return response
+        return _build_region_response(created)
@@ -5,31 +5,22 @@ from fastapi import HTTPException, status
 from app.application.usecases.use_case import UseCase
 from app.domain.exceptions.company_exceptions import CompanyNotFoundException
 from app.infrastructure.repositories.company_repository_interface import ICompanyRepository
+from app.infrastructure.configs import repository_config
 
 
 class DeleteCompanyUseCase(UseCase[int, bool]):
     """Use case para deletar empresa"""
 
-    def __init__(self, company_repository: ICompanyRepository):
-        self.company_repository = company_repository
+    def __init__(self, company_repository: ICompanyRepository = None):
+        self.company_repository = company_repository or repository_config.company_repository
 
     def execute(self, company_id: int, session=None) -> bool:
         """Executa o caso de uso de exclusão de empresa"""
         try:
-            # Verifica se empresa existe
-            company = self.company_repository.get_by_id(company_id, session)
-            if not company:
+            # Deleta empresa; o DELETE ... RETURNING já indica se ela existia
+            if not self.company_repository.delete(company_id, session):
                 raise CompanyNotFoundException(f"Empresa com ID {company_id} não encontrada")
 
-            # Deleta empresa
-            success = self.company_repository.delete(company_id, session)
-            
-            if not success:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Erro ao deletar empresa"
-                )
-
             return True
 
         except CompanyNotFoundException:
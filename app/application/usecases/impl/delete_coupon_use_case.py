@@ -6,14 +6,14 @@ from loguru import logger
 
 from app.application.usecases.use_case import UseCase
 from app.infrastructure.repositories.coupon_repository_interface import ICouponRepository
-from app.infrastructure.repositories.impl.coupon_repository_impl import CouponRepositoryImpl
+from app.infrastructure.configs.repository_config import coupon_repository
 
 
 class DeleteCouponUseCase(UseCase[Dict[str, Any], bool]):
     """Use case for deleting coupon"""
 
     def __init__(self):
-        self.coupon_repo: ICouponRepository = CouponRepositoryImpl()
+        self.coupon_repo: ICouponRepository = coupon_repository
 
     def execute(self, request: Dict[str, Any], session=None) -> bool:
         """Executes the coupon deletion use case"""
@@ -25,24 +25,15 @@ class DeleteCouponUseCase(UseCase[Dict[str, Any], bool]):
                     detail="ID do cupom é obrigatório"
                 )
 
-            # Verifica se cupom existe
-            coupon = self.coupon_repo.get_by_id(coupon_id, session)
-            if not coupon:
+            # Deleta cupom; o DELETE ... RETURNING já indica se ele existia
+            if not self.coupon_repo.delete(coupon_id, session):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Cupom com ID {coupon_id} não encontrado"
                 )
 
-            # Deleta cupom
-            deleted = self.coupon_repo.delete(coupon_id, session)
-            if deleted:
-                logger.info(f"Coupon deleted: {coupon_id}")
-                return True
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Erro ao deletar cupom"
-                )
+            logger.info(f"Coupon deleted: {coupon_id}")
+            return True
 
         except HTTPException:
             raise
@@ -6,10 +6,10 @@ from loguru import logger
 
 from app.application.usecases.use_case import UseCase
 from app.application.service.storage_service import StorageService
-from app.infrastructure.repositories.product_repository_interface import IProductRepository
+from app.application.service.product_list_cache_service import ProductListCacheService
+from app.domain.models.product_model import Product
 from app.infrastructure.repositories.product_image_repository_interface import IProductImageRepository
-from app.infrastructure.repositories.impl.product_repository_impl import ProductRepositoryImpl
-from app.infrastructure.repositories.impl.product_image_repository_impl import ProductImageRepositoryImpl
+from app.infrastructure.configs.repository_config import product_image_repository
 
 
 class DeleteProductImagesUseCase(UseCase[Dict[str, Any], Dict[str, List[int]]]):
@@ -17,16 +17,18 @@ class DeleteProductImagesUseCase(UseCase[Dict[str, Any], Dict[str, List[int]]]):
 
     def __init__(self):
         self.storage_service = StorageService()
-        self.product_repository: IProductRepository = ProductRepositoryImpl()
-        self.product_image_repository: IProductImageRepository = ProductImageRepositoryImpl()
+        self.product_image_repository: IProductImageRepository = product_image_repository
 
     def execute(self, request: Dict[str, Any], session=None) -> Dict[str, List[int]]:
         """
-        request: product_id (int), image_ids (List[int])
+        request: product_id (int), image_ids (List[int]),
+        background_tasks (BackgroundTasks, opcional) — quando informado, os arquivos
+        são removidos do storage depois da resposta (após o commit), fora da transação
         """
         try:
             product_id = request.get("product_id")
             image_ids = request.get("image_ids") or []
+            background_tasks = request.get("background_tasks")
 
             if not product_id or not image_ids:
                 raise HTTPException(
@@ -34,7 +36,8 @@ class DeleteProductImagesUseCase(UseCase[Dict[str, Any], Dict[str, List[int]]]):
                     detail="product_id e image_ids são obrigatórios"
                 )
 
-            product = self.product_repository.get_by_id(product_id, session)
+            # session.get consulta o identity map antes do banco
+            product = session.get(Product, product_id)
             if not product:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -43,17 +46,29 @@ class DeleteProductImagesUseCase(UseCase[Dict[str, Any], Dict[str, List[int]]]):
 
             removidas: List[int] = []
             nao_encontradas: List[int] = []
+            storage_paths: List[str] = []
 
             for image_id in image_ids:
-                if self._delete_one(product_id, image_id, session):
-                    removidas.append(image_id)
-                else:
+                path = self._delete_one(product_id, image_id, session)
+                if path is False:
                     nao_encontradas.append(image_id)
+                    continue
+                removidas.append(image_id)
+                if path:
+                    storage_paths.append(path)
+
+            if storage_paths:
+                if background_tasks is not None:
+                    background_tasks.add_task(self._delete_storage_files, storage_paths)
+                else:
+                    self._delete_storage_files(storage_paths)
 
             logger.info(
                 f"Exclusão de imagens do produto {product_id}: "
                 f"removidas={removidas} nao_encontradas={nao_encontradas}"
             )
+            if removidas:
+                ProductListCacheService().invalidate(session)
             return {"removidas": removidas, "nao_encontradas": nao_encontradas}
 
         except HTTPException:
@@ -65,22 +80,20 @@ class DeleteProductImagesUseCase(UseCase[Dict[str, Any], Dict[str, List[int]]]):
                 detail=f"Erro ao remover imagens: {str(e)}"
             )
 
-    def _delete_one(self, product_id: int, image_id: int, session) -> bool:
-        image = self.product_image_repository.get_by_id(image_id, session)
-        if not image or image.id_produto != product_id:
+    def _delete_one(self, product_id: int, image_id: int, session):
+        """Remove o registro da imagem; retorna o path no storage (None se não houver) ou False se não encontrada"""
+        # DELETE ... RETURNING url: remove e confirma o vínculo com o produto em um único round-trip
+        url = self.product_image_repository.delete_from_produto(image_id, product_id, session)
+        if url is None:
             logger.warning(f"Imagem {image_id} não encontrada para o produto {product_id}")
             return False
 
-        url = image.url
-        deleted = self.product_image_repository.delete(image_id, session)
-        if not deleted:
-            logger.warning(f"Falha ao remover registro da imagem {image_id} do banco")
-            return False
-
-        path = self.storage_service.path_from_public_url(url)
-        if path:
-            # delete_file já loga um warning e retorna False sem lançar exceção
-            # quando o objeto não existe mais no MinIO — não deve bloquear a exclusão.
-            self.storage_service.delete_file(path)
+        return self.storage_service.path_from_public_url(url)
 
-        return True
+    def _delete_storage_files(self, paths: List[str]) -> None:
+        # Uma requisição DeleteObjects por bucket em vez de um DELETE HTTP por imagem.
+        # delete_files só loga um warning em caso de falha — não deve bloquear a exclusão.
+        if len(paths) == 1:
+            self.storage_service.delete_file(paths[0])
+        else:
+            self.storage_service.delete_files(paths)
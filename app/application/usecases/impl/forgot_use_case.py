@@ -9,17 +9,15 @@ from app.application.usecases.use_case import UseCase
 from app.domain.models.enumerations.email_token_type_enumerations import EmailTokenTypeEnum
 from app.infrastructure.repositories.company_repository_interface import ICompanyRepository
 from app.infrastructure.repositories.email_token_repository_interface import IEmailTokenRepository
-from app.infrastructure.repositories.impl.company_repository_impl import CompanyRepositoryImpl
-from app.infrastructure.repositories.impl.email_token_repository_impl import EmailTokenRepositoryImpl
+from app.infrastructure.configs.repository_config import company_repository, email_token_repository
 from app.presentation.routers.request.forgot_password_request import ForgotPasswordRequest
-from app.domain.models.email_token_model import EmailToken
 from app.infrastructure.configs.database_config import Session
 
 class ForgotPasswordUseCase(UseCase[ForgotPasswordRequest, None]):
 
     def __init__(self):
-        self.company_repo: ICompanyRepository = CompanyRepositoryImpl()
-        self.email_token_repo: IEmailTokenRepository = EmailTokenRepositoryImpl()
+        self.company_repo: ICompanyRepository = company_repository
+        self.email_token_repo: IEmailTokenRepository = email_token_repository
         self.hash_service: HashService = HashService()
         self.email_service: EmailService = EmailService()
 
@@ -33,24 +31,16 @@ class ForgotPasswordUseCase(UseCase[ForgotPasswordRequest, None]):
         self.company_repo.update_company_ativo_status(company.id_empresa, False, session)
 
         # Gera token de reset
-        token = self.hash_service.generate_email_token(company.id_empresa)
+        token = self.hash_service.generate_email_token()
 
-        # Remove tokens antigos de reset de senha para esta empresa
-        self.email_token_repo.delete_by_company_id_and_type(
-            company.id_empresa, 
-            EmailTokenTypeEnum.RESET_SENHA, 
+        # Substitui o token de reset anterior (se houver) num único INSERT ... ON CONFLICT.
+        # Persiste token no banco primeiro (importante para não perder o token se email falhar)
+        self.email_token_repo.upsert_token(
+            company.id_empresa,
+            token,
+            EmailTokenTypeEnum.RESET_SENHA,
             session
         )
-
-        # Cria novo token de email
-        email_token = EmailToken(
-            id_empresa=company.id_empresa,
-            token=token,
-            tipo=EmailTokenTypeEnum.RESET_SENHA
-        )
-
-        # Persiste token no banco primeiro (importante para não perder o token se email falhar)
-        self.email_token_repo.create_email_token(email_token, session)
         
         # Busca o email da empresa através do contato
         if company.contatos and len(company.contatos) > 0:
@@ -5,10 +5,11 @@ from fastapi import HTTPException, status
 from decimal import Decimal, ROUND_HALF_UP
 
 from app.application.usecases.use_case import UseCase
+from app.application.service.region_discount_service import RegionDiscountService, OWN_DISCOUNT_STATES
 from app.infrastructure.repositories.product_repository_interface import IProductRepository
-from app.infrastructure.repositories.impl.product_repository_impl import ProductRepositoryImpl
-from app.infrastructure.repositories.region_repository_interface import IRegionRepository
-from app.infrastructure.repositories.impl.region_repository_impl import RegionRepositoryImpl
+from app.infrastructure.configs.repository_config import product_repository
+
+CENTAVOS = Decimal("0.01")
 
 
 class GetCartPricesUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
@@ -23,8 +24,8 @@ class GetCartPricesUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
     """
 
     def __init__(self):
-        self.product_repository: IProductRepository = ProductRepositoryImpl()
-        self.region_repository: IRegionRepository = RegionRepositoryImpl()
+        self.product_repository: IProductRepository = product_repository
+        self.region_discount_service = RegionDiscountService()
 
     def execute(self, request: Dict[str, Any], session=None) -> Dict[str, Any]:
         estado: Optional[str] = request.get("estado")
@@ -42,56 +43,43 @@ class GetCartPricesUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
 
         # Estado para cálculo: MG/ES usam descontos próprios; restante usa SP
         estado_request = estado.strip().upper()
-        estado_calculo = estado_request if estado_request in ("MG", "ES") else "SP"
+        estado_calculo = estado_request if estado_request in OWN_DISCOUNT_STATES else "SP"
 
-        region = self.region_repository.get_by_estado(estado_calculo, session)
+        # Descontos vêm do cache em memória (TTL); o banco só é consultado na expiração
+        region = self.region_discount_service.get(estado_calculo, session)
         if not region:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Região '{estado_calculo}' não encontrada na base de dados"
             )
 
-        if prazo == 0:
-            multiplier = Decimal(str(region.desconto_0))
-        elif prazo == 30:
-            multiplier = Decimal(str(region.desconto_30))
-        else:
-            multiplier = Decimal(str(region.desconto_60))
+        multiplier = region.multiplier(prazo)
 
         # Busca produtos em lote
         unique_ids = list(dict.fromkeys(product_ids))
         products = self.product_repository.get_by_ids(unique_ids, session=session)
-        product_map = {p.id_produto: p for p in products}
-
-        items: List[Dict[str, Any]] = []
-        for pid in product_ids:
-            p = product_map.get(pid)
-            if not p:
-                items.append({
-                    "id_produto": pid,
-                    "found": False,
-                    "codigo": None,
-                    "nome": None,
-                    "ativo": None,
-                    "valor_base": None,
-                    "preco": None,
-                    "error": "Produto não encontrado"
-                })
-                continue
-
-            valor_base = Decimal(str(p.valor_base))
-            preco = (valor_base * multiplier).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
-            items.append({
+        # Item montado uma vez por produto (ids repetidos no carrinho reaproveitam);
+        # valor_base já vem como Decimal da coluna Numeric, sem conversão via str
+        items_por_id = {
+            p.id_produto: {
                 "id_produto": p.id_produto,
                 "found": True,
                 "codigo": p.codigo,
                 "nome": p.nome,
                 "ativo": bool(p.ativo),
-                "valor_base": float(valor_base),
-                "preco": float(preco),
+                "valor_base": float(p.valor_base),
+                "preco": float((p.valor_base * multiplier).quantize(CENTAVOS, rounding=ROUND_HALF_UP)),
                 "error": None
-            })
+            }
+            for p in products
+        }
+
+        # Resposta na ordem original do carrinho; ids inexistentes viram item de erro
+        get_item = items_por_id.get
+        items: List[Dict[str, Any]] = [
+            get_item(pid) or self._not_found_item(pid)
+            for pid in product_ids
+        ]
 
         return {
             "estado_request": estado_request,
@@ -101,4 +89,15 @@ class GetCartPricesUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
             "items": items
         }
 
-
+    @staticmethod
+    def _not_found_item(pid: int) -> Dict[str, Any]:
+        return {
+            "id_produto": pid,
+            "found": False,
+            "codigo": None,
+            "nome": None,
+            "ativo": None,
+            "valor_base": None,
+            "preco": None,
+            "error": "Produto não encontrado"
+        }
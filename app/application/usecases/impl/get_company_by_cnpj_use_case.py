@@ -1,5 +1,19 @@
+import asyncio
+import time
+import weakref
+from typing import Dict, Optional, Tuple
+
 from app.infrastructure.providers.cnpj_provider_interface import ICNPJProvider
 from app.infrastructure.providers.impl.cnpj_provider_impl import CNPJProviderImpl
+from app.infrastructure.utils.validate_cnpj import normalize_cnpj
+
+# Dados cadastrais de CNPJ mudam na escala de meses; 1 hora evita consultas repetidas à BrasilAPI
+CNPJ_CACHE_TTL_SECONDS = 3600
+CNPJ_CACHE_MAX_SIZE = 1024
+
+# Cache por CNPJ normalizado (só respostas de sucesso) e um lock por CNPJ em consulta
+_cache: Dict[str, Tuple[float, dict]] = {}
+_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
 
 
 class GetCompanyByCnpjUseCase:
@@ -7,4 +21,43 @@ class GetCompanyByCnpjUseCase:
         self.cnpj_provider: ICNPJProvider = CNPJProviderImpl()
 
     async def execute(self, cnpj: str) -> dict:
-        return await self.cnpj_provider.get_company_data(cnpj)
+        key = normalize_cnpj(cnpj)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        # Requisições simultâneas para o mesmo CNPJ aguardam uma única chamada externa
+        lock = _locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            _locks[key] = lock
+
+        async with lock:
+            cached = self._get_cached(key)
+            if cached is not None:
+                return cached
+
+            data = await self.cnpj_provider.get_company_data(cnpj)
+            self._store(key, data)
+        return dict(data)
+
+    @staticmethod
+    def _get_cached(key: str) -> Optional[dict]:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            _cache.pop(key, None)
+            return None
+        return dict(entry[1])
+
+    @staticmethod
+    def _store(key: str, data: dict) -> None:
+        now = time.monotonic()
+        if len(_cache) >= CNPJ_CACHE_MAX_SIZE:
+            for expired in [k for k, (expires_at, _) in _cache.items() if expires_at <= now]:
+                del _cache[expired]
+            if len(_cache) >= CNPJ_CACHE_MAX_SIZE:
+                # Descarta a entrada mais antiga (dict preserva a ordem de inserção)
+                del _cache[next(iter(_cache))]
+        _cache[key] = (now + CNPJ_CACHE_TTL_SECONDS, data)
@@ -2,11 +2,11 @@
 
 from typing import Dict, Any
 from fastapi import HTTPException, status
-from loguru import logger
 
 from app.application.usecases.use_case import UseCase
+from app.application.usecases.http_errors import http_500_on_error
 from app.infrastructure.repositories.coupon_repository_interface import ICouponRepository
-from app.infrastructure.repositories.impl.coupon_repository_impl import CouponRepositoryImpl
+from app.infrastructure.configs.repository_config import coupon_repository
 from app.presentation.routers.response.coupon_response import CouponResponse
 
 
@@ -14,39 +14,31 @@ class GetCouponUseCase(UseCase[Dict[str, Any], CouponResponse]):
     """Use case for getting coupon by ID"""
 
     def __init__(self):
-        self.coupon_repo: ICouponRepository = CouponRepositoryImpl()
+        self.coupon_repo: ICouponRepository = coupon_repository
 
+    @http_500_on_error("Erro ao buscar cupom")
     def execute(self, request: Dict[str, Any], session=None) -> CouponResponse:
         """Executes the get coupon use case"""
-        try:
-            coupon_id = request.get('coupon_id')
-            if not coupon_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="ID do cupom é obrigatório"
-                )
-
-            coupon = self.coupon_repo.get_by_id(coupon_id, session)
-            if not coupon:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Cupom com ID {coupon_id} não encontrado"
-                )
-
-            return self._build_coupon_response(coupon)
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Erro ao buscar cupom: {e}")
+        coupon_id = request.get('coupon_id')
+        if not coupon_id:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Erro ao buscar cupom: {str(e)}"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="ID do cupom é obrigatório"
             )
 
+        coupon = self.coupon_repo.get_by_id(coupon_id, session)
+        if not coupon:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Cupom com ID {coupon_id} não encontrado"
+            )
+
+        return self._build_coupon_response(coupon)
+
     def _build_coupon_response(self, coupon) -> CouponResponse:
         """Builds the coupon response"""
-        return CouponResponse(
+        # Campos vêm do ORM já tipados: model_construct dispensa a revalidação do Pydantic
+        return CouponResponse.model_construct(
             id_cupom=coupon.id_cupom,
             codigo=coupon.codigo,
             tipo=coupon.tipo,
@@ -1,106 +1,101 @@
 """Use case para buscar produto por ID"""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from fastapi import HTTPException, status
-from decimal import Decimal
+import numpy as np
 
 from app.application.usecases.use_case import UseCase
+from app.application.usecases.http_errors import http_500_on_error
 from app.domain.models.product_model import Product
 from app.infrastructure.repositories.product_repository_interface import IProductRepository
-from app.infrastructure.repositories.impl.product_repository_impl import ProductRepositoryImpl
-from app.infrastructure.repositories.region_repository_interface import IRegionRepository
-from app.infrastructure.repositories.impl.region_repository_impl import RegionRepositoryImpl
+from app.infrastructure.configs.repository_config import product_repository
+from app.application.service.region_discount_service import RegionDiscountService, OWN_DISCOUNT_STATES
 
 
 class GetProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
     """Use case para buscar produto por ID"""
 
     def __init__(self):
-        self.product_repository: IProductRepository = ProductRepositoryImpl()
-        self.region_repository: IRegionRepository = RegionRepositoryImpl()
+        self.product_repository: IProductRepository = product_repository
+        self.region_discount_service = RegionDiscountService()
 
+    @http_500_on_error("Erro ao buscar produto")
     def execute(self, request: Dict[str, Any], session=None) -> Dict[str, Any]:
         """Executa o caso de uso de busca de produto por ID"""
-        try:
-            product_id = request.get('product_id')
-            estado = request.get('estado')
-            
-            if not product_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="ID do produto é obrigatório"
-                )
-            
-            if not estado:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Estado é obrigatório"
-                )
-
-            # Busca o produto
-            product = self.product_repository.get_by_id(product_id, session)
-
-            if not product:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Produto não encontrado"
-                )
-
-            # Busca a região para aplicar descontos
-            # Se for MG ou ES, usa os descontos desses estados, senão usa SP
-            estado_para_busca = estado.upper()
-            if estado_para_busca not in ['MG', 'ES']:
-                estado_para_busca = 'SP'
-            
-            region = self.region_repository.get_by_estado(estado_para_busca, session)
-            
-            if not region:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Região '{estado_para_busca}' não encontrada na base de dados"
-                )
-
-            return self._build_product_response(product, region, session)
-
-        except HTTPException:
-            raise
-        except Exception as e:
+        product_id = request.get('product_id')
+        estado = request.get('estado')
+        
+        if not product_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="ID do produto é obrigatório"
+            )
+        
+        if not estado:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Estado é obrigatório"
+            )
+
+        # Busca a região antes do produto: com o cache normalmente não vai ao banco
+        # e, se a região não existir, evita a consulta do produto
+        # Se for MG ou ES, usa os descontos desses estados, senão usa SP
+        estado_para_busca = estado.upper()
+        if estado_para_busca not in OWN_DISCOUNT_STATES:
+            estado_para_busca = 'SP'
+        
+        # Descontos em cache (TTL): a chave é sempre MG, ES ou SP
+        region = self.region_discount_service.get(estado_para_busca, session)
+        
+        if not region:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Região '{estado_para_busca}' não encontrada na base de dados"
+            )
+
+        # Busca o produto e, se for base de kit, os itens do kit
+        product, kit_products = self.product_repository.get_by_id_with_kit(product_id, session)
+
+        if not product:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Erro ao buscar produto: {str(e)}"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Produto não encontrado"
             )
 
-    def _build_product_response(self, product: Product, region, session=None) -> Dict[str, Any]:
+        return self._build_product_response(product, region, kit_products)
+
+    def _build_product_response(self, product: Product, region, kit_products: List[Product]) -> Dict[str, Any]:
         """Constrói a resposta do produto com preços calculados e kits relacionados"""
         # Converte cod_kit para string ou None (pode vir como int do banco)
         cod_kit_str = None
         if product.cod_kit is not None:
             cod_kit_str = str(product.cod_kit)
         
-        # Calcula os preços com desconto
-        valor_base = Decimal(product.valor_base)
+        # Coleção de imagens lida uma única vez
+        imagens = product.imagens or ()
+
+        # Calcula os preços com desconto (em float: o resultado é arredondado para exibição;
+        # o arredondamento comercial ROUND_HALF_UP fica no cálculo do carrinho)
+        valor_base = float(product.valor_base)
         
         # avista = valor_base * desconto_0
-        avista = float(valor_base * region.desconto_0)
+        avista = valor_base * float(region.desconto_0)
         
         # 30_dias = valor_base * desconto_30
-        dias_30 = float(valor_base * region.desconto_30)
+        dias_30 = valor_base * float(region.desconto_30)
         
         # 60_dias = valor_base * desconto_60
-        dias_60 = float(valor_base * region.desconto_60)
+        dias_60 = valor_base * float(region.desconto_60)
         
-        # 🧩 NOVA LÓGICA: Identificar itens de cada kit
-        # Para cada produto base, buscar produtos cujo cod_kit seja igual ao código do produto base
-        # Esses produtos serão os itens pertencentes ao kit
+        # 🧩 Itens do kit: produtos cujo cod_kit é igual ao código do produto base.
+        # Já vêm carregados junto com o produto (vazio se o produto não for base)
         kits = []
-        if product.codigo and session and product.cod_kit is None:
-            # Só busca kits se o produto for base (cod_kit == null)
-            # Busca produtos onde cod_kit == product.codigo
-            # Garante que codigo seja string (pode vir como int do banco)
-            codigo_str = str(product.codigo) if product.codigo is not None else None
-            if codigo_str:
-                kit_products = self.product_repository.get_by_cod_kit(codigo_str, exclude_product_id=product.id_produto, session=session)
-                kits = [self._build_kit_product_response(kit_product, region) for kit_product in kit_products]
+        if kit_products:
+            kit_prices = self._compute_kit_prices(kit_products, region)
+            kits = [
+                self._build_kit_product_response(kit_product, prices)
+                for kit_product, prices in zip(kit_products, kit_prices)
+            ]
         
         return {
             'id_produto': product.id_produto,
@@ -111,52 +106,66 @@ class GetProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
             'cod_kit': cod_kit_str,
             'id_categoria': product.id_categoria,
             'id_subcategoria': product.id_subcategoria,
-            'valor_base': float(product.valor_base),
+            'valor_base': valor_base,
             'ativo': product.ativo,
             'created_at': product.created_at.isoformat(),
             'updated_at': product.updated_at.isoformat() if product.updated_at else None,
             'categoria': product.categoria.nome if product.categoria else None,
             'subcategoria': product.subcategoria.nome if product.subcategoria else None,
-            'imagens': [img.url for img in product.imagens] if product.imagens else [],
-            'imagens_detalhe': [{'id_imagem': img.id_imagem, 'url': img.url} for img in product.imagens] if product.imagens else [],
+            'imagens': [img.url for img in imagens],
+            'imagens_detalhe': [{'id_imagem': img.id_imagem, 'url': img.url} for img in imagens],
             'avista': round(avista, 2),
             '30_dias': round(dias_30, 2),
             '60_dias': round(dias_60, 2),
             'kits': kits
         }
     
-    def _build_kit_product_response(self, product: Product, region) -> Dict[str, Any]:
-        """Constrói a resposta de um produto do kit (sem kits aninhados)"""
+    @staticmethod
+    def _compute_kit_prices(kit_products: List[Product], region) -> List[Dict[str, float]]:
+        """
+        Calcula os preços de todos os itens do kit de uma vez (vetorizado):
+        preço unitário por prazo (valor_base * desconto) e totais (preço * quantidade)
+        """
+        bases = np.array([float(kp.valor_base) for kp in kit_products])
+        quantidades = np.array([kp.quantidade for kp in kit_products], dtype=float)
+
+        # avista, 30_dias e 60_dias = valor_base * desconto do prazo
+        avista = bases * float(region.desconto_0)
+        dias_30 = bases * float(region.desconto_30)
+        dias_60 = bases * float(region.desconto_60)
+
+        colunas = {
+            'avista': np.round(avista, 2),
+            '30_dias': np.round(dias_30, 2),
+            '60_dias': np.round(dias_60, 2),
+            'valor_base_total': np.round(bases * quantidades, 2),
+            'valor_total_avista': np.round(avista * quantidades, 2),
+            'valor_total_30': np.round(dias_30 * quantidades, 2),
+            'valor_total_60': np.round(dias_60 * quantidades, 2),
+        }
+        # tolist() devolve floats nativos (serializáveis em JSON)
+        listas = {nome: valores.tolist() for nome, valores in colunas.items()}
+        return [
+            {nome: listas[nome][i] for nome in colunas}
+            for i in range(len(kit_products))
+        ]
+
+    def _build_kit_product_response(self, product: Product, prices: Dict[str, float]) -> Dict[str, Any]:
+        """Constrói a resposta de um produto do kit (sem kits aninhados) com preços já calculados"""
         # Converte cod_kit para string ou None
         cod_kit_str = None
         if product.cod_kit is not None:
             cod_kit_str = str(product.cod_kit)
         
-        # Calcula os preços com desconto
-        valor_base = Decimal(product.valor_base)
-        
-        # avista = valor_base * desconto_0
-        avista = float(valor_base * region.desconto_0)
-        
-        # 30_dias = valor_base * desconto_30
-        dias_30 = float(valor_base * region.desconto_30)
-        
-        # 60_dias = valor_base * desconto_60
-        dias_60 = float(valor_base * region.desconto_60)
-        
-        # Calcula os valores totais (preço * quantidade)
-        quantidade = product.quantidade
-        valor_base_total = float(valor_base) * quantidade
-        valor_total_avista = avista * quantidade
-        valor_total_30 = dias_30 * quantidade
-        valor_total_60 = dias_60 * quantidade
+        # Coleção de imagens lida uma única vez
+        imagens = product.imagens or ()
         
         return {
             'id_produto': product.id_produto,
             'codigo': product.codigo,
             'nome': product.nome,
             'descricao': product.descricao,
-            'quantidade': quantidade,
+            'quantidade': product.quantidade,
             'cod_kit': cod_kit_str,
             'id_categoria': product.id_categoria,
             'id_subcategoria': product.id_subcategoria,
@@ -166,15 +175,9 @@ class GetProductUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
             'updated_at': product.updated_at.isoformat() if product.updated_at else None,
             'categoria': product.categoria.nome if product.categoria else None,
             'subcategoria': product.subcategoria.nome if product.subcategoria else None,
-            'imagens': [img.url for img in product.imagens] if product.imagens else [],
-            'imagens_detalhe': [{'id_imagem': img.id_imagem, 'url': img.url} for img in product.imagens] if product.imagens else [],
-            'avista': round(avista, 2),
-            '30_dias': round(dias_30, 2),
-            '60_dias': round(dias_60, 2),
-            'valor_base_total': round(valor_base_total, 2),
-            'valor_total_avista': round(valor_total_avista, 2),
-            'valor_total_30': round(valor_total_30, 2),
-            'valor_total_60': round(valor_total_60, 2),
+            'imagens': [img.url for img in imagens],
+            'imagens_detalhe': [{'id_imagem': img.id_imagem, 'url': img.url} for img in imagens],
+            **prices,
             'kits': []  # Produtos dentro de kits não têm kits aninhados
         }
 
@@ -44,43 +44,5 @@ class ListCompaniesUseCase(UseCase[dict, List[CompanyResponse]]):
             )
 
     def _build_company_response(self, company: Company) -> CompanyResponse:
-        """Constrói a resposta da empresa"""
-        from app.presentation.routers.response.company_response import AddressResponse, ContactResponse
-
-        # Converte endereços
-        address_responses = [
-            AddressResponse(
-                id_endereco=addr.id_endereco,
-                cep=addr.cep,
-                numero=addr.numero,
-                complemento=addr.complemento,
-                bairro=addr.bairro,
-                cidade=addr.cidade,
-                uf=addr.uf,
-                ibge=addr.ibge
-            ) for addr in company.enderecos
-        ]
-
-        # Converte contatos
-        contact_responses = [
-            ContactResponse(
-                id_contato=contact.id_contato,
-                nome=contact.nome,
-                telefone=contact.telefone,
-                celular=contact.celular,
-                email=contact.email
-            ) for contact in company.contatos
-        ]
-
-        return CompanyResponse(
-            id_empresa=company.id_empresa,
-            cnpj=company.cnpj,
-            razao_social=company.razao_social,
-            nome_fantasia=company.nome_fantasia,
-            perfil=company.perfil.value,
-            ativo=company.ativo,
-            created_at=company.created_at,
-            updated_at=company.updated_at,
-            enderecos=address_responses,
-            contatos=contact_responses
-        )
+        """Constrói a resposta da empresa (from_attributes: pydantic-core lê o ORM direto)"""
+        return CompanyResponse.model_validate(company)
@@ -7,17 +7,16 @@ from loguru import logger
 from app.application.usecases.use_case import UseCase
 from app.domain.models.coupon_model import Coupon
 from app.infrastructure.repositories.coupon_repository_interface import ICouponRepository
-from app.infrastructure.repositories.impl.coupon_repository_impl import CouponRepositoryImpl
-from app.presentation.routers.response.coupon_response import CouponResponse
+from app.infrastructure.configs.repository_config import coupon_repository
 
 
-class ListCouponsUseCase(UseCase[Dict[str, Any], List[CouponResponse]]):
+class ListCouponsUseCase(UseCase[Dict[str, Any], List[Dict[str, Any]]]):
     """Use case for listing coupons"""
 
     def __init__(self):
-        self.coupon_repo: ICouponRepository = CouponRepositoryImpl()
+        self.coupon_repo: ICouponRepository = coupon_repository
 
-    def execute(self, request: Dict[str, Any], session=None) -> List[CouponResponse]:
+    def execute(self, request: Dict[str, Any], session=None) -> List[Dict[str, Any]]:
         """Executes the coupon listing use case"""
         try:
             skip = request.get('skip', 0)
@@ -45,16 +44,16 @@ class ListCouponsUseCase(UseCase[Dict[str, Any], List[CouponResponse]]):
                 detail=f"Erro ao listar cupons: {str(e)}"
             )
 
-    def _build_coupon_response(self, coupon: Coupon) -> CouponResponse:
-        """Builds the coupon response"""
-        return CouponResponse(
-            id_cupom=coupon.id_cupom,
-            codigo=coupon.codigo,
-            tipo=coupon.tipo,
-            valor=coupon.valor,
-            validade_inicio=coupon.validade_inicio,
-            validade_fim=coupon.validade_fim,
-            ativo=coupon.ativo,
-            created_at=coupon.created_at,
-            updated_at=coupon.updated_at
-        )
+    def _build_coupon_response(self, coupon: Coupon) -> Dict[str, Any]:
+        """Builds the coupon response (CouponResponse fields, serialized by the router with orjson)"""
+        return {
+            "id_cupom": coupon.id_cupom,
+            "codigo": coupon.codigo,
+            "tipo": coupon.tipo,
+            "valor": coupon.valor,
+            "validade_inicio": coupon.validade_inicio,
+            "validade_fim": coupon.validade_fim,
+            "ativo": coupon.ativo,
+            "created_at": coupon.created_at,
+            "updated_at": coupon.updated_at
+        }
@@ -1,27 +1,41 @@
 """Use case para listar produtos"""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from fastapi import HTTPException, status
 from decimal import Decimal
-from collections import defaultdict
+from itertools import groupby
+import numpy as np
+from sqlalchemy.orm import selectinload
 
 from app.application.usecases.use_case import UseCase
 from app.domain.models.product_model import Product
 from app.infrastructure.repositories.product_repository_interface import IProductRepository
-from app.infrastructure.repositories.impl.product_repository_impl import ProductRepositoryImpl
-from app.infrastructure.repositories.region_repository_interface import IRegionRepository
-from app.infrastructure.repositories.impl.region_repository_impl import RegionRepositoryImpl
+from app.infrastructure.configs.repository_config import product_repository
+from app.application.service.region_discount_service import RegionDiscountService, OWN_DISCOUNT_STATES
 
 
-class ListProductsUseCase(UseCase[Dict[str, Any], List[Dict[str, Any]]]):
+# Filtros de preço são comparados com a coluna NUMERIC(10, 2)
+_TWOPLACES = Decimal("0.01")
+
+
+def _price_matrix(bases: np.ndarray, region) -> np.ndarray:
+    """Preços unitários (N x 3: avista, 30_dias, 60_dias) = valor_base * fatores da região, sem arredondar"""
+    return bases[:, None] * np.array(region.factors, dtype=np.float64)
+
+
+class ListProductsUseCase(UseCase[Dict[str, Any], Iterator[Dict[str, Any]]]):
     """Use case para listar produtos"""
 
     def __init__(self):
-        self.product_repository: IProductRepository = ProductRepositoryImpl()
-        self.region_repository: IRegionRepository = RegionRepositoryImpl()
+        self.product_repository: IProductRepository = product_repository
+        self.region_discount_service = RegionDiscountService()
 
-    def execute(self, request: Dict[str, Any], session=None) -> List[Dict[str, Any]]:
-        """Executa o caso de uso de listagem de produtos com filtros consolidados"""
+    def execute(self, request: Dict[str, Any], session=None) -> Iterator[Dict[str, Any]]:
+        """
+        Executa o caso de uso de listagem de produtos com filtros consolidados.
+        Consultas e preços são resolvidos aqui; os dicts de resposta são gerados sob demanda
+        (um produto por vez) para o router serializar em streaming sem materializar a lista.
+        """
         try:
             estado = request.get('estado')
             
@@ -46,10 +60,11 @@ class ListProductsUseCase(UseCase[Dict[str, Any], List[Dict[str, Any]]]):
             # Busca a região para aplicar descontos
             # Se for MG ou ES, usa os descontos desses estados, senão usa SP
             estado_para_busca = estado.upper()
-            if estado_para_busca not in ['MG', 'ES']:
+            if estado_para_busca not in OWN_DISCOUNT_STATES:
                 estado_para_busca = 'SP'
             
-            region = self.region_repository.get_by_estado(estado_para_busca, session)
+            # Descontos vêm do cache com TTL (não consulta o banco a cada listagem)
+            region = self.region_discount_service.get(estado_para_busca, session)
             
             if not region:
                 raise HTTPException(
@@ -64,29 +79,22 @@ class ListProductsUseCase(UseCase[Dict[str, Any], List[Dict[str, Any]]]):
             elif min_price is not None and max_price is not None:
                 # Para busca por faixa de preço, também precisa excluir kits
                 all_products = self.product_repository.get_by_price_range(
-                    Decimal(str(min_price)), 
-                    Decimal(str(max_price)), 
+                    Decimal(min_price).quantize(_TWOPLACES),
+                    Decimal(max_price).quantize(_TWOPLACES),
                     session,
                     skip=skip,
                     limit=limit
                 )
                 # Filtra produtos: mantém os que não têm cod_kit OU os que têm cod_kit mas não têm produto pai
-                products = []
-                for p in all_products:
-                    if p.cod_kit is None:
-                        products.append(p)
-                    else:
-                        # Verifica se existe produto pai com codigo igual ao cod_kit
-                        # Converte cod_kit para string (pode vir como int do banco)
-                        cod_kit_str = str(p.cod_kit) if p.cod_kit is not None else None
-                        if cod_kit_str:
-                            parent = self.product_repository.get_by_codigo(cod_kit_str, session)
-                            if not parent:
-                                # Não tem pai, então aparece na listagem
-                                products.append(p)
-                        else:
-                            # Se cod_kit for None, aparece na listagem
-                            products.append(p)
+                # Os pais são verificados numa única consulta IN (cod_kit pode vir como int do banco)
+                kit_codes = {str(p.cod_kit) for p in all_products if p.cod_kit is not None}
+                existing_parents = (
+                    self.product_repository.get_existing_codigos(kit_codes, session) if kit_codes else set()
+                )
+                products = [
+                    p for p in all_products
+                    if p.cod_kit is None or str(p.cod_kit) not in existing_parents
+                ]
             else:
                 # Usa método consolidado que suporta todos os filtros
                 # Retorna apenas produtos base (cod_kit == null) ou produtos sem pai
@@ -106,11 +114,15 @@ class ListProductsUseCase(UseCase[Dict[str, Any], List[Dict[str, Any]]]):
             if include_kits and session:
                 kit_map = self._build_kit_map(products, session)
 
-            # Converte para DTOs de resposta
-            return [
-                self._build_product_response(product, region, session, include_kits=include_kits, kit_map=kit_map)
-                for product in products
-            ]
+            # Preços de todos os produtos (e itens de kit) calculados de uma vez, vetorizados
+            base_prices = self._compute_prices(products, region)
+            kit_prices = self._compute_kit_prices(kit_map, region) if kit_map else {}
+
+            # Converte para DTOs de resposta (gerador: relacionamentos já vêm carregados pelas consultas)
+            return (
+                self._build_product_response(product, prices, kit_map=kit_map, kit_prices=kit_prices)
+                for product, prices in zip(products, base_prices)
+            )
 
         except HTTPException:
             raise
@@ -120,41 +132,83 @@ class ListProductsUseCase(UseCase[Dict[str, Any], List[Dict[str, Any]]]):
                 detail=f"Erro ao listar produtos: {str(e)}"
             )
 
-    def _build_product_response(self, product: Product, region, session=None, include_kits: bool = True, kit_map: Optional[Dict[str, List[Product]]] = None) -> Dict[str, Any]:
-        """Constrói a resposta do product com preços calculados e kits relacionados"""
+    @staticmethod
+    def _compute_prices(products: List[Product], region) -> List[List[float]]:
+        """
+        Calcula [avista, 30_dias, 60_dias] de todos os produtos de uma vez:
+        valor_base (vetor N) * descontos da região (vetor 3), arredondado a 2 casas
+        """
+        bases = np.fromiter((float(p.valor_base) for p in products), dtype=np.float64, count=len(products))
+        # tolist() devolve floats nativos (serializáveis em JSON)
+        return np.round(_price_matrix(bases, region), 2).tolist()
+
+    @staticmethod
+    def _compute_kit_prices(kit_map: Dict[str, List[Product]], region) -> Dict[int, Dict[str, float]]:
+        """
+        Calcula os preços de todos os itens de kit de uma vez (vetorizado):
+        preço unitário por prazo (valor_base * desconto) e totais (preço * quantidade).
+        Retorna {id_produto -> preços}
+        """
+        kit_items = [item for items in kit_map.values() for item in items]
+        if not kit_items:
+            return {}
+
+        bases = np.fromiter((float(kp.valor_base) for kp in kit_items), dtype=np.float64, count=len(kit_items))
+        quantidades = np.fromiter((kp.quantidade for kp in kit_items), dtype=np.float64, count=len(kit_items))
+
+        # Colunas: avista, 30_dias, 60_dias (preço unitário) e os respectivos totais
+        unit = _price_matrix(bases, region)
+        unit_rounded = np.round(unit, 2).tolist()
+        totals = np.round(unit * quantidades[:, None], 2).tolist()
+        base_totals = np.round(bases * quantidades, 2).tolist()
+
+        return {
+            item.id_produto: {
+                'avista': unit_rounded[i][0],
+                '30_dias': unit_rounded[i][1],
+                '60_dias': unit_rounded[i][2],
+                'valor_base_total': base_totals[i],
+                'valor_total_avista': totals[i][0],
+                'valor_total_30': totals[i][1],
+                'valor_total_60': totals[i][2],
+            }
+            for i, item in enumerate(kit_items)
+        }
+
+    def _build_product_response(
+        self,
+        product: Product,
+        prices: List[float],
+        kit_map: Optional[Dict[str, List[Product]]] = None,
+        kit_prices: Optional[Dict[int, Dict[str, float]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Constrói a resposta do product com preços já calculados e kits relacionados.
+        Só lê atributos já carregados (relacionamentos via selectinload, itens de kit via kit_map):
+        nenhuma consulta é feita aqui
+        """
         # Converte cod_kit para string ou None (pode vir como int do banco)
         cod_kit_str = None
         if product.cod_kit is not None:
             cod_kit_str = str(product.cod_kit)
         
-        # Calcula os preços com desconto
-        valor_base = Decimal(str(product.valor_base))
-        
-        # avista = valor_base * desconto_0
-        avista = float(valor_base * region.desconto_0)
-        
-        # 30_dias = valor_base * desconto_30
-        dias_30 = float(valor_base * region.desconto_30)
-        
-        # 60_dias = valor_base * desconto_60
-        dias_60 = float(valor_base * region.desconto_60)
+        # Preços com desconto (avista, 30_dias, 60_dias) já arredondados em _compute_prices
+        avista, dias_30, dias_60 = prices
         
         # 🧩 NOVA LÓGICA: Identificar itens de cada kit
         # Para cada produto base retornado, obter o valor de seu código (codigo)
         # Em seguida, buscar produtos cujo cod_kit seja igual a esse código
         # Esses produtos serão os itens pertencentes ao kit
         kits = []
-        if include_kits and product.codigo and session and product.cod_kit is None:
-            # Só busca kits se o produto for base (cod_kit == null)
-            # Busca produtos onde cod_kit == product.codigo
+        if kit_map and product.codigo and product.cod_kit is None:
+            # Só há kits se o produto for base (cod_kit == null): itens onde cod_kit == product.codigo
             # Garante que codigo seja string (pode vir como int do banco)
-            codigo_str = str(product.codigo) if product.codigo is not None else None
-            if codigo_str:
-                if kit_map is not None:
-                    kit_products = kit_map.get(codigo_str, [])
-                else:
-                    kit_products = self.product_repository.get_by_cod_kit(codigo_str, exclude_product_id=product.id_produto, session=session)
-                kits = [self._build_kit_product_response(kit_product, region) for kit_product in kit_products]
+            kit_products = kit_map.get(str(product.codigo), [])
+            if kit_products:
+                kits = [
+                    self._build_kit_product_response(kit_product, kit_prices[kit_product.id_produto])
+                    for kit_product in kit_products
+                ]
         
         return {
             'id_produto': product.id_produto,
@@ -173,9 +227,14 @@ class ListProductsUseCase(UseCase[Dict[str, Any], List[Dict[str, Any]]]):
             'subcategoria': product.subcategoria.nome if product.subcategoria else None,
             'imagens': [img.url for img in product.imagens] if product.imagens else [],
             'imagens_detalhe': [{'id_imagem': img.id_imagem, 'url': img.url} for img in product.imagens] if product.imagens else [],
-            'avista': round(avista, 2),
-            '30_dias': round(dias_30, 2),
-            '60_dias': round(dias_60, 2),
+            'avista': avista,
+            '30_dias': dias_30,
+            '60_dias': dias_60,
+            # Totais só se aplicam a itens de kit; presentes para manter o formato de ProductResponse
+            'valor_base_total': None,
+            'valor_total_avista': None,
+            'valor_total_30': None,
+            'valor_total_60': None,
             'kits': kits
         }
 
@@ -184,13 +243,8 @@ class ListProductsUseCase(UseCase[Dict[str, Any], List[Dict[str, Any]]]):
         Monta um dicionário {cod_kit -> [produtos do kit]} em uma única query.
         Evita N+1 quando include_kits=True.
         """
-        from sqlalchemy.orm import selectinload
-
-        base_codigos: List[str] = []
-        for p in products:
-            if p.cod_kit is None and p.codigo is not None:
-                base_codigos.append(str(p.codigo))
-
+        # Conjunto: códigos repetidos não inflam a cláusula IN
+        base_codigos = {str(p.codigo) for p in products if p.cod_kit is None and p.codigo is not None}
         if not base_codigos:
             return {}
 
@@ -201,49 +255,28 @@ class ListProductsUseCase(UseCase[Dict[str, Any], List[Dict[str, Any]]]):
                 selectinload(Product.subcategoria),
                 selectinload(Product.imagens),
             )
-            .filter(Product.cod_kit.in_(base_codigos))
+            .filter(Product.cod_kit.in_(list(base_codigos)))
+            # Ordenado por cod_kit (e id, para manter a ordem dos itens): o groupby agrupa numa passada
+            .order_by(Product.cod_kit, Product.id_produto)
             .all()
         )
 
-        kit_map: Dict[str, List[Product]] = defaultdict(list)
-        for item in kit_items:
-            if item.cod_kit is not None:
-                kit_map[str(item.cod_kit)].append(item)
-
-        return dict(kit_map)
+        # cod_kit nunca é NULL aqui (filtrado pelo IN)
+        return {cod_kit: list(items) for cod_kit, items in groupby(kit_items, key=lambda item: str(item.cod_kit))}
     
-    def _build_kit_product_response(self, product: Product, region) -> Dict[str, Any]:
-        """Constrói a resposta de um produto do kit (sem kits aninhados)"""
+    def _build_kit_product_response(self, product: Product, prices: Dict[str, float]) -> Dict[str, Any]:
+        """Constrói a resposta de um produto do kit (sem kits aninhados) com preços já calculados"""
         # Converte cod_kit para string ou None
         cod_kit_str = None
         if product.cod_kit is not None:
             cod_kit_str = str(product.cod_kit)
         
-        # Calcula os preços com desconto
-        valor_base = Decimal(str(product.valor_base))
-        
-        # avista = valor_base * desconto_0
-        avista = float(valor_base * region.desconto_0)
-        
-        # 30_dias = valor_base * desconto_30
-        dias_30 = float(valor_base * region.desconto_30)
-        
-        # 60_dias = valor_base * desconto_60
-        dias_60 = float(valor_base * region.desconto_60)
-        
-        # Calcula os valores totais (preço * quantidade)
-        quantidade = product.quantidade
-        valor_base_total = float(valor_base) * quantidade
-        valor_total_avista = avista * quantidade
-        valor_total_30 = dias_30 * quantidade
-        valor_total_60 = dias_60 * quantidade
-        
         return {
             'id_produto': product.id_produto,
             'codigo': product.codigo,
             'nome': product.nome,
             'descricao': product.descricao,
-            'quantidade': quantidade,
+            'quantidade': product.quantidade,
             'cod_kit': cod_kit_str,
             'id_categoria': product.id_categoria,
             'id_subcategoria': product.id_subcategoria,
@@ -255,12 +288,12 @@ class ListProductsUseCase(UseCase[Dict[str, Any], List[Dict[str, Any]]]):
             'subcategoria': product.subcategoria.nome if product.subcategoria else None,
             'imagens': [img.url for img in product.imagens] if product.imagens else [],
             'imagens_detalhe': [{'id_imagem': img.id_imagem, 'url': img.url} for img in product.imagens] if product.imagens else [],
-            'avista': round(avista, 2),
-            '30_dias': round(dias_30, 2),
-            '60_dias': round(dias_60, 2),
-            'valor_base_total': round(valor_base_total, 2),
-            'valor_total_avista': round(valor_total_avista, 2),
-            'valor_total_30': round(valor_total_30, 2),
-            'valor_total_60': round(valor_total_60, 2),
+            'avista': prices['avista'],
+            '30_dias': prices['30_dias'],
+            '60_dias': prices['60_dias'],
+            'valor_base_total': prices['valor_base_total'],
+            'valor_total_avista': prices['valor_total_avista'],
+            'valor_total_30': prices['valor_total_30'],
+            'valor_total_60': prices['valor_total_60'],
             'kits': []  # Produtos dentro de kits não têm kits aninhados
         }
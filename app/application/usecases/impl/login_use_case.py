@@ -3,13 +3,13 @@ from app.application.service.hash_service import HashService
 from app.application.service.jwt_service import JWTService
 from app.infrastructure.configs.database_config import Session
 from app.infrastructure.repositories.company_repository_interface import ICompanyRepository
+from app.infrastructure.configs.repository_config import company_repository
 from app.presentation.routers.request.login_request import LoginRequest
 from app.presentation.routers.response.login_response import LoginResponse
-from app.infrastructure.repositories.impl.company_repository_impl import CompanyRepositoryImpl
 
 class LoginUseCase:
     def __init__(self):
-        self.company_repo: ICompanyRepository = CompanyRepositoryImpl()
+        self.company_repo: ICompanyRepository = company_repository
         self.hash_service: HashService = HashService()
         self.jwt_service: JWTService = JWTService()
 
@@ -24,7 +24,8 @@ class LoginUseCase:
             "role": company.perfil.value  # Inclui a role no token
         })
 
-        return LoginResponse(access_token=token)
+        # Token gerado aqui (str): model_construct dispensa a validação do Pydantic
+        return LoginResponse.model_construct(access_token=token)
 
 
     def __valid_company(self, login, session: Session = None ):
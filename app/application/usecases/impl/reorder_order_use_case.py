@@ -5,23 +5,21 @@ from typing import Any, Dict
 
 from fastapi import HTTPException, status
 
-from app.application.service.order_creation_service import create_order_with_items
+from app.application.service.order_creation_service import OrderLine, create_order_with_items
 from app.application.usecases.impl.get_order_use_case import GetOrderUseCase
 from app.application.usecases.use_case import UseCase
-from app.domain.models.dtos.send_order_email_dto import OrderItemUseCaseRequest
 from app.domain.models.enumerations.role_enumerations import RoleEnum
 from app.infrastructure.repositories.order_repository_interface import IOrderRepository
-from app.infrastructure.repositories.impl.order_repository_impl import OrderRepositoryImpl
 from app.infrastructure.repositories.product_repository_interface import IProductRepository
-from app.infrastructure.repositories.impl.product_repository_impl import ProductRepositoryImpl
+from app.infrastructure.configs.repository_config import order_repository, product_repository
 
 
 class ReorderOrderUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
     """Duplica itens de um pedido em um novo pedido PENDENTE, usando preço atual (valor_base)."""
 
     def __init__(self):
-        self.order_repository: IOrderRepository = OrderRepositoryImpl()
-        self.product_repository: IProductRepository = ProductRepositoryImpl()
+        self.order_repository: IOrderRepository = order_repository
+        self.product_repository: IProductRepository = product_repository
 
     def execute(self, request: Dict[str, Any], session=None) -> Dict[str, Any]:
         pedido_id = request.get("pedido_id")
@@ -57,7 +55,7 @@ class ReorderOrderUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
         products = self.product_repository.get_by_ids(product_ids, session)
         by_id = {p.id_produto: p for p in products}
 
-        priced_lines: list[OrderItemUseCaseRequest] = []
+        priced_lines: list[OrderLine] = []
         for line in original.itens:
             produto = by_id.get(line.id_produto)
             if produto is None or not produto.ativo:
@@ -72,19 +70,15 @@ class ReorderOrderUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
                 else Decimal(str(produto.valor_base))
             )
             qty = int(line.quantidade)
-            line_total = float((unit_dec * Decimal(qty)).quantize(Decimal("0.01")))
-            unit = float(unit_dec)
+            line_total = (unit_dec * Decimal(qty)).quantize(Decimal("0.01"))
 
+            # Mantém Decimal até a persistência (sem ida e volta por float/str)
             priced_lines.append(
-                OrderItemUseCaseRequest(
+                OrderLine(
                     id_produto=produto.id_produto,
-                    codigo=produto.codigo,
-                    nome=produto.nome,
                     quantidade_pedida=qty,
-                    valor_unitario=unit,
+                    valor_unitario=unit_dec,
                     valor_total=line_total,
-                    categoria=None,
-                    subcategoria=None,
                 )
             )
 
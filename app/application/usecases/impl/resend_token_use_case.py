@@ -1,14 +1,14 @@
-from fastapi import HTTPException, status
+from typing import Optional
+
+from fastapi import BackgroundTasks, HTTPException, status
 from loguru import logger
 
 from app.application.usecases.use_case import UseCase
-from app.domain.models.email_token_model import EmailToken
 from app.domain.models.enumerations.email_token_type_enumerations import EmailTokenTypeEnum
 from app.infrastructure.configs.database_config import Session
 from app.infrastructure.repositories.company_repository_interface import ICompanyRepository
 from app.infrastructure.repositories.email_token_repository_interface import IEmailTokenRepository
-from app.infrastructure.repositories.impl.company_repository_impl import CompanyRepositoryImpl
-from app.infrastructure.repositories.impl.email_token_repository_impl import EmailTokenRepositoryImpl
+from app.infrastructure.configs.repository_config import company_repository, email_token_repository
 from app.application.service.hash_service import HashService
 from app.application.service.email_service import EmailService
 from app.application.service.email.template.verification_template import verification
@@ -18,12 +18,16 @@ from app.presentation.routers.request.resend_token_request import ResendTokenReq
 class ResendTokenUseCase(UseCase[ResendTokenRequest, None]):
 
     def __init__(self):
-        self.company_repo: ICompanyRepository = CompanyRepositoryImpl()
-        self.email_token_repo: IEmailTokenRepository = EmailTokenRepositoryImpl()
+        self.company_repo: ICompanyRepository = company_repository
+        self.email_token_repo: IEmailTokenRepository = email_token_repository
         self.hash_service: HashService = HashService()
         self.email_service: EmailService = EmailService()
 
-    def execute(self, data: ResendTokenRequest, session: Session = None):
+    def execute(self, data: ResendTokenRequest, session: Session = None, background_tasks: Optional[BackgroundTasks] = None):
+        """
+        Regera o token de validação e reenvia o e-mail. Com background_tasks, o envio SMTP
+        acontece depois da resposta (o token já está commitado); sem ele, é feito inline
+        """
         # Verifica se a empresa existe
         if data.company_id:
             company = self.company_repo.get_by_id(data.company_id, session)
@@ -39,52 +43,35 @@ class ResendTokenUseCase(UseCase[ResendTokenRequest, None]):
 
         email = company.contatos[0].email
 
-        # Busca o token existente se houver
-        existing_token = self.email_token_repo.get_by_company_id(company.id_empresa, session)
-        if existing_token and existing_token.tipo != EmailTokenTypeEnum.VALIDACAO_EMAIL:
-            existing_token = None
-
-        token = self._send_verification_email(company.id_empresa, existing_token, email, session)
+        token = self._save_verification_token(company.id_empresa, session)
         
         # Faz commit explícito para garantir que o token foi salvo
         if session:
             session.commit()
 
+        if background_tasks is not None:
+            background_tasks.add_task(self._send_verification_email, company.id_empresa, token, email)
+        else:
+            self._send_verification_email(company.id_empresa, token, email)
+
         return dict(message="Token reenviado com sucesso", company_id=company.id_empresa, token=token)
 
-    def _send_verification_email(self, company_id: int, email_token, email: str, session) -> str:
+    def _save_verification_token(self, company_id: int, session) -> str:
+        """Substitui o token de validação da empresa (upsert) e retorna o novo token"""
+        token = self.hash_service.generate_email_token()
+
+        # Persiste token primeiro (importante para não perder o token se email falhar);
+        # o token anterior do mesmo tipo, se houver, é sobrescrito no mesmo comando
+        self.email_token_repo.upsert_token(company_id, token, EmailTokenTypeEnum.VALIDACAO_EMAIL, session)
+        return token
+
+    def _send_verification_email(self, company_id: int, token: str, email: str) -> None:
         """Envia email de verificação para a empresa"""
-        # Remove token existente se houver
-        if email_token:
-            self.email_token_repo.delete_by_company_id_and_type(
-                company_id,
-                EmailTokenTypeEnum.VALIDACAO_EMAIL,
-                session
-            )
-            session.flush()  # Garante que a deleção foi persistida
-
-        token = self.hash_service.generate_email_token(company_id)
-
-        # Cria token de email
-        email_token = EmailToken(
-            id_empresa=company_id,
-            token=token,
-            tipo=EmailTokenTypeEnum.VALIDACAO_EMAIL
-        )
-
-        # Persiste token primeiro (importante para não perder o token se email falhar)
-        self.email_token_repo.create_email_token(email_token, session)
-        session.flush()  # Garante que o token foi persistido antes de enviar o email
-        
         # Tenta enviar email (não quebra a aplicação se falhar)
         try:
             # Gera HTML do email
-            from urllib.parse import urlencode
-            params = {
-                'token': token,
-                'companyId': str(company_id)
-            }
-            link = f"https://vendas.fortlar.com.br/confirmar-cadastro?{urlencode(params)}"
+            # Token é base64url (secrets.token_urlsafe) e companyId é inteiro: nada a escapar na query string
+            link = f"https://vendas.fortlar.com.br/confirmar-cadastro?token={token}&companyId={company_id}"
             html = verification(link, token)
 
             # Log para debug
@@ -101,5 +88,3 @@ class ResendTokenUseCase(UseCase[ResendTokenRequest, None]):
             logger.error(f"   Tipo do erro: {type(e).__name__}")
             logger.error(f"   Detalhes: {str(e)}")
             logger.info("💡 Token foi criado. O usuário pode solicitar reenvio novamente.")
-
-        return token
\ No newline at end of file
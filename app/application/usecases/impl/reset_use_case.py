@@ -5,8 +5,7 @@ from app.application.usecases.use_case import UseCase
 from app.domain.models.enumerations.email_token_type_enumerations import EmailTokenTypeEnum
 from app.infrastructure.repositories.company_repository_interface import ICompanyRepository
 from app.infrastructure.repositories.email_token_repository_interface import IEmailTokenRepository
-from app.infrastructure.repositories.impl.company_repository_impl import CompanyRepositoryImpl
-from app.infrastructure.repositories.impl.email_token_repository_impl import EmailTokenRepositoryImpl
+from app.infrastructure.configs.repository_config import company_repository, email_token_repository
 from app.infrastructure.utils.validate_password import validate_password
 from app.presentation.routers.request.reset_password_request import ResetPasswordRequest
 from app.infrastructure.configs.database_config import Session
@@ -14,23 +13,19 @@ from app.infrastructure.configs.database_config import Session
 class ResetPasswordUseCase(UseCase[ResetPasswordRequest, None]):
 
     def __init__(self):
-        self.company_repo: ICompanyRepository = CompanyRepositoryImpl()
-        self.email_token_repo: IEmailTokenRepository = EmailTokenRepositoryImpl()
+        self.company_repo: ICompanyRepository = company_repository
+        self.email_token_repo: IEmailTokenRepository = email_token_repository
         self.hash_service: HashService = HashService()
 
 
     def execute(self, data: ResetPasswordRequest, session: Session = None) -> None:
-        # valida token
-        if not self.email_token_repo.exists_by_token_and_company_id_and_type(data.token,
-                                                                             data.company_id,
-                                                                             EmailTokenTypeEnum.RESET_SENHA,
-                                                                             session):
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Token inválido")
-
-        # atualiza senha
-        company = self.company_repo.get_by_id(data.company_id, session)
+        # valida token e carrega a empresa numa única consulta (o token referencia a empresa)
+        company = self.company_repo.get_by_id_with_valid_token(data.company_id,
+                                                               data.token,
+                                                               EmailTokenTypeEnum.RESET_SENHA,
+                                                               session)
         if not company:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Empresa não encontrada")
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Token inválido")
 
         if not validate_password(data.new_password):
             raise HTTPException(
@@ -41,7 +36,8 @@ class ResetPasswordUseCase(UseCase[ResetPasswordRequest, None]):
         # Hash da senha
         password_hash = self.hash_service.hash_password(data.new_password)
 
-        self.company_repo.update_password(data.company_id, password_hash, session)
+        if not self.company_repo.update_password(data.company_id, password_hash, session):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Empresa não encontrada")
 
         # opcional: apagar token após uso
         self.email_token_repo.delete_by_token_and_company_id(data.token, data.company_id, session)
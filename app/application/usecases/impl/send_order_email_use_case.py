@@ -1,9 +1,11 @@
 """Use case para enviar order por email"""
 
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from loguru import logger
 
+import math
 from decimal import Decimal
+from typing import Optional, Tuple
 
 from app.application.usecases.use_case import UseCase
 from app.application.service.email_service import EmailService
@@ -12,11 +14,9 @@ import envs
 from app.domain.models.company_model import Company
 from app.application.service.order_creation_service import IPI_ALIQUOTA, create_order_with_items
 from app.infrastructure.repositories.company_repository_interface import ICompanyRepository
-from app.infrastructure.repositories.impl.company_repository_impl import CompanyRepositoryImpl
 from app.infrastructure.repositories.order_repository_interface import IOrderRepository
-from app.infrastructure.repositories.impl.order_repository_impl import OrderRepositoryImpl
 from app.infrastructure.repositories.product_repository_interface import IProductRepository
-from app.infrastructure.repositories.impl.product_repository_impl import ProductRepositoryImpl
+from app.infrastructure.configs.repository_config import company_repository, order_repository, product_repository
 from app.domain.models.dtos.send_order_email_dto import (
     SendOrderEmailUseCaseRequest,
     SendOrderEmailUseCaseResponse,
@@ -24,27 +24,40 @@ from app.domain.models.dtos.send_order_email_dto import (
 )
 
 
+# Cópias (CC) do email de order: envs é lido uma vez, no import
+_ORDER_CC_EMAILS: Tuple[str, ...] = (envs.MAIL_USERNAME_ORDER,) if envs.MAIL_USERNAME_ORDER else ()
+
+_PAYMENT_METHOD_MAP = {
+    FormaPagamentoEnum.AVISTA: "À Vista",
+    FormaPagamentoEnum.DIAS_30: "30 Dias",
+    FormaPagamentoEnum.DIAS_60: "60 Dias"
+}
+
+
 def _map_payment_method(forma_pagamento: FormaPagamentoEnum) -> str:
     """Mapeia forma de pagamento para texto legível"""
-    mapping = {
-        FormaPagamentoEnum.AVISTA: "À Vista",
-        FormaPagamentoEnum.DIAS_30: "30 Dias",
-        FormaPagamentoEnum.DIAS_60: "60 Dias"
-    }
-    return mapping.get(forma_pagamento, forma_pagamento.value)
+    return _PAYMENT_METHOD_MAP.get(forma_pagamento, forma_pagamento.value)
 
 
 class SendOrderEmailUseCase(UseCase[SendOrderEmailUseCaseRequest, SendOrderEmailUseCaseResponse]):
     """Use case para enviar order por email"""
 
     def __init__(self):
-        self.company_repository: ICompanyRepository = CompanyRepositoryImpl()
+        self.company_repository: ICompanyRepository = company_repository
         self.email_service: EmailService = EmailService()
-        self.order_repository: IOrderRepository = OrderRepositoryImpl()
-        self.product_repository: IProductRepository = ProductRepositoryImpl()
+        self.order_repository: IOrderRepository = order_repository
+        self.product_repository: IProductRepository = product_repository
 
-    def execute(self, request: SendOrderEmailUseCaseRequest, session=None) -> SendOrderEmailUseCaseResponse:
-        """Executa o caso de uso de envio de order por email"""
+    def execute(
+        self,
+        request: SendOrderEmailUseCaseRequest,
+        session=None,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> SendOrderEmailUseCaseResponse:
+        """
+        Executa o caso de uso de envio de order por email. Com background_tasks, o envio SMTP
+        acontece depois da resposta (o order já está persistido); sem ele, é feito inline
+        """
         try:
             logger.info(f"=== Enviando order para empresa {request.company_id} ===")
 
@@ -66,15 +79,14 @@ class SendOrderEmailUseCase(UseCase[SendOrderEmailUseCaseRequest, SendOrderEmail
             # Mapeia forma de pagamento
             forma_pagamento_texto = _map_payment_method(request.forma_pagamento)
 
-            # Envia email
-            self._send_order_email(
+            # Monta o email enquanto a sessão está aberta (endereços/contatos da empresa)
+            html_email, subject = self._build_order_email(
                 company=company,
                 itens=itens_formatados,
                 subtotal_sem_ipi=subtotal_sem_ipi,
                 valor_ipi=valor_ipi,
                 total_com_ipi=total_com_ipi,
-                forma_pagamento=forma_pagamento_texto,
-                email_empresa=email_empresa
+                forma_pagamento=forma_pagamento_texto
             )
 
             # Cria o order no banco de dados (valor total = produtos + IPI)
@@ -87,8 +99,11 @@ class SendOrderEmailUseCase(UseCase[SendOrderEmailUseCaseRequest, SendOrderEmail
 
             logger.info(f"✅ Order {order.id_pedido} criado com sucesso no banco de dados")
 
-            # Busca order criado novamente para garantir dados completos
-            order_created = self.order_repository.get_by_id(order.id_pedido, session)
+            # Envia email: com background_tasks, o SMTP roda depois da resposta
+            if background_tasks is not None:
+                background_tasks.add_task(self._send_order_email, email_empresa, html_email, subject)
+            else:
+                self._send_order_email(email_empresa, html_email, subject)
 
             return SendOrderEmailUseCaseResponse(
                 message="Order enviado por email com sucesso",
@@ -155,23 +170,21 @@ class SendOrderEmailUseCase(UseCase[SendOrderEmailUseCaseRequest, SendOrderEmail
     def _process_order_items(self, itens: list, session) -> tuple[list, float]:
         """Processa itens do carrinho, garante código (request ou banco) e calcula subtotal sem IPI."""
         codigo_por_id = self._resolve_codigos_produto(itens, session)
-        itens_formatados = []
-        subtotal_sem_ipi = 0.0
 
-        for item in itens:
-            codigo = (item.codigo or "").strip()
-            if not codigo:
-                codigo = codigo_por_id.get(item.id_produto) or "N/A"
-            itens_formatados.append({
-                'codigo': codigo,
+        # Um único float() por item; o subtotal soma os mesmos valores com fsum
+        itens_formatados = [
+            {
+                'codigo': (item.codigo or "").strip() or codigo_por_id.get(item.id_produto) or "N/A",
                 'nome': item.nome,
                 'quantidade': item.quantidade_pedida,
                 'preco_unitario': float(item.valor_unitario),
                 'subtotal': float(item.valor_total),
                 'categoria': item.categoria or 'N/A',
                 'subcategoria': item.subcategoria or 'N/A'
-            })
-            subtotal_sem_ipi += float(item.valor_total)
+            }
+            for item in itens
+        ]
+        subtotal_sem_ipi = math.fsum(item['subtotal'] for item in itens_formatados)
 
         if not itens_formatados:
             raise HTTPException(
@@ -181,17 +194,16 @@ class SendOrderEmailUseCase(UseCase[SendOrderEmailUseCaseRequest, SendOrderEmail
 
         return itens_formatados, subtotal_sem_ipi
 
-    def _send_order_email(
+    def _build_order_email(
         self,
         company: Company,
         itens: list,
         subtotal_sem_ipi: float,
         valor_ipi: float,
         total_com_ipi: float,
-        forma_pagamento: str,
-        email_empresa: str
-    ) -> None:
-        """Envia email do order para a empresa"""
+        forma_pagamento: str
+    ) -> Tuple[str, str]:
+        """Gera HTML e assunto do email do order"""
         endereco_principal = company.enderecos[0] if company.enderecos else None
         contato_principal = company.contatos[0] if company.contatos else None
 
@@ -210,26 +222,21 @@ class SendOrderEmailUseCase(UseCase[SendOrderEmailUseCaseRequest, SendOrderEmail
             f"Novo Order - {company.nome_fantasia or company.razao_social} "
             f"- Total: R$ {total_com_ipi:.2f}"
         )
-        
-        # Prepara lista de cópias (CC)
-        cc_emails = []
-        mail_order_copy = envs.MAIL_USERNAME_ORDER
-        if mail_order_copy:
-            cc_emails.append(mail_order_copy)
-        
+
+        return html_email, subject
+
+    def _send_order_email(self, email_empresa: str, html_email: str, subject: str) -> None:
+        """Envia email do order para a empresa (com cópia para _ORDER_CC_EMAILS, se configurado)"""
         # Tenta enviar email (não quebra a aplicação se falhar)
-        # O order será criado mesmo se o email falhar
+        # O order já foi criado quando o email é enviado
         try:
             # Envia email com cópia se configurado
-            if cc_emails:
-                self.email_service.send_email(email_empresa, html_email, subject, cc=cc_emails)
-                logger.info(f"✅ Email de order enviado com sucesso para {email_empresa} com cópia para {', '.join(cc_emails)}")
+            if _ORDER_CC_EMAILS:
+                self.email_service.send_email(email_empresa, html_email, subject, cc=list(_ORDER_CC_EMAILS))
+                logger.info(f"✅ Email de order enviado com sucesso para {email_empresa} com cópia para {', '.join(_ORDER_CC_EMAILS)}")
             else:
                 self.email_service.send_email(email_empresa, html_email, subject)
                 logger.info(f"✅ Email de order enviado com sucesso para {email_empresa}")
         except Exception as e:
             # Loga o erro mas não quebra a aplicação
-            # O order será criado mesmo sem o email
             logger.warning(f"⚠️  Erro ao enviar email de order para {email_empresa}: {e}")
-            logger.info("💡 Order será criado mesmo sem envio de email.")
-
@@ -5,38 +5,23 @@ from fastapi import HTTPException, status
 from loguru import logger
 
 from app.application.usecases.use_case import UseCase
+from app.application.service.product_list_cache_service import ProductListCacheService
 from app.domain.exceptions.category_exceptions import CategoryNotFoundException, CategoryAlreadyExistsException
 from app.infrastructure.repositories.category_repository_interface import ICategoryRepository
-from app.infrastructure.repositories.impl.category_repository_impl import CategoryRepositoryImpl
-from app.presentation.routers.response.category_response import CategoryResponse, SubcategoryResponse
+from app.infrastructure.configs.repository_config import category_repository
+from app.presentation.routers.response.category_response import CategoryResponse
 
 
 def _build_category_response(category) -> CategoryResponse:
-    """Builds the category response with subcategories"""
-    subcategory_responses = [
-        SubcategoryResponse(
-            id_subcategoria=sub.id_subcategoria,
-            nome=sub.nome,
-            id_categoria=sub.id_categoria,
-            created_at=sub.created_at,
-            updated_at=sub.updated_at
-        ) for sub in category.subcategorias
-    ]
-
-    return CategoryResponse(
-        id_categoria=category.id_categoria,
-        nome=category.nome,
-        created_at=category.created_at,
-        updated_at=category.updated_at,
-        subcategorias=subcategory_responses
-    )
+    """Builds the category response with subcategories (from_attributes: pydantic-core lê o ORM direto)"""
+    return CategoryResponse.model_validate(category)
 
 
 class UpdateCategoryUseCase(UseCase[Dict[str, Any], CategoryResponse]):
     """Use case para atualizar categoria"""
 
     def __init__(self):
-        self.category_repo: ICategoryRepository = CategoryRepositoryImpl()
+        self.category_repo: ICategoryRepository = category_repository
 
     def execute(self, request: Dict[str, Any], session=None) -> CategoryResponse:
         """Executa o caso de uso de atualização de categoria"""
@@ -65,9 +50,10 @@ class UpdateCategoryUseCase(UseCase[Dict[str, Any], CategoryResponse]):
 
             # Salva alterações
             updated_category = self.category_repo.update(category, session)
-            session.refresh(updated_category)
 
             logger.info(f"Category updated: {updated_category.id_categoria} - {updated_category.nome}")
+            # Listagens de produtos em cache trazem o nome da categoria/subcategoria
+            ProductListCacheService().invalidate(session)
             return _build_category_response(updated_category)
 
         except (CategoryNotFoundException, CategoryAlreadyExistsException):
@@ -7,14 +7,19 @@ from app.application.usecases.use_case import UseCase
 from app.domain.models.company_model import Company
 from app.domain.exceptions.company_exceptions import CompanyNotFoundException
 from app.infrastructure.repositories.company_repository_interface import ICompanyRepository
+from app.infrastructure.configs import repository_config
 from app.presentation.routers.response.company_response import CompanyResponse
 
 
+# Campos que podem ser atualizados
+_UPDATABLE_COMPANY_FIELDS = frozenset({'razao_social', 'nome_fantasia', 'ativo'})
+
+
 class UpdateCompanyUseCase(UseCase[Dict[str, Any], CompanyResponse]):
     """Use case para atualizar empresa"""
 
-    def __init__(self, company_repository: ICompanyRepository):
-        self.company_repository = company_repository
+    def __init__(self, company_repository: ICompanyRepository = None):
+        self.company_repository = company_repository or repository_config.company_repository
 
     def execute(self, request: Dict[str, Any], session=None) -> CompanyResponse:
         """Executa o caso de uso de atualização de empresa"""
@@ -31,8 +36,9 @@ class UpdateCompanyUseCase(UseCase[Dict[str, Any], CompanyResponse]):
             if not company:
                 raise CompanyNotFoundException(f"Empresa com ID {company_id} não encontrada")
 
-            # Atualiza campos permitidos
-            self._update_company_fields(company, request)
+            # Atualiza campos permitidos; sem alteração efetiva não há UPDATE
+            if not self._update_company_fields(company, request):
+                return self._build_company_response(company)
 
             # Salva alterações
             updated_company = self.company_repository.update(company, session)
@@ -49,55 +55,15 @@ class UpdateCompanyUseCase(UseCase[Dict[str, Any], CompanyResponse]):
                 detail=f"Erro ao atualizar empresa: {str(e)}"
             )
 
-    def _update_company_fields(self, company: Company, request: Dict[str, Any]) -> None:
-        """Atualiza campos da empresa"""
-        # Campos que podem ser atualizados
-        updatable_fields = [
-            'razao_social', 'nome_fantasia', 'ativo'
-        ]
-
-        for field in updatable_fields:
-            if field in request:
-                setattr(company, field, request[field])
+    def _update_company_fields(self, company: Company, request: Dict[str, Any]) -> bool:
+        """Atualiza campos da empresa (None = não informado). Retorna True se algum valor mudou"""
+        dirty = False
+        for field, value in request.items():
+            if field in _UPDATABLE_COMPANY_FIELDS and value is not None and getattr(company, field) != value:
+                setattr(company, field, value)
+                dirty = True
+        return dirty
 
     def _build_company_response(self, company: Company) -> CompanyResponse:
-        """Constrói a resposta da empresa"""
-        from app.presentation.routers.response.company_response import AddressResponse, ContactResponse
-
-        # Converte endereços
-        address_responses = [
-            AddressResponse(
-                id_endereco=addr.id_endereco,
-                cep=addr.cep,
-                numero=addr.numero,
-                complemento=addr.complemento,
-                bairro=addr.bairro,
-                cidade=addr.cidade,
-                uf=addr.uf,
-                ibge=addr.ibge
-            ) for addr in company.enderecos
-        ]
-
-        # Converte contatos
-        contact_responses = [
-            ContactResponse(
-                id_contato=contact.id_contato,
-                nome=contact.nome,
-                telefone=contact.telefone,
-                celular=contact.celular,
-                email=contact.email
-            ) for contact in company.contatos
-        ]
-
-        return CompanyResponse(
-            id_empresa=company.id_empresa,
-            cnpj=company.cnpj,
-            razao_social=company.razao_social,
-            nome_fantasia=company.nome_fantasia,
-            perfil=company.perfil.value,
-            ativo=company.ativo,
-            created_at=company.created_at,
-            updated_at=company.updated_at,
-            enderecos=address_responses,
-            contatos=contact_responses
-        )
+        """Constrói a resposta da empresa (from_attributes: pydantic-core lê o ORM direto)"""
+        return CompanyResponse.model_validate(company)
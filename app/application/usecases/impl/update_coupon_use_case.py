@@ -3,11 +3,12 @@
 from typing import Dict, Any
 from fastapi import HTTPException, status
 from loguru import logger
+from sqlalchemy.exc import IntegrityError
 
 from app.application.usecases.use_case import UseCase
 from app.domain.models.coupon_model import Coupon
 from app.infrastructure.repositories.coupon_repository_interface import ICouponRepository
-from app.infrastructure.repositories.impl.coupon_repository_impl import CouponRepositoryImpl
+from app.infrastructure.configs.repository_config import coupon_repository
 from app.presentation.routers.response.coupon_response import CouponResponse
 
 
@@ -15,7 +16,7 @@ class UpdateCouponUseCase(UseCase[Dict[str, Any], CouponResponse]):
     """Use case for updating coupon"""
 
     def __init__(self):
-        self.coupon_repo: ICouponRepository = CouponRepositoryImpl()
+        self.coupon_repo: ICouponRepository = coupon_repository
 
     def execute(self, request: Dict[str, Any], session=None) -> CouponResponse:
         """Executes the coupon update use case"""
@@ -39,10 +40,16 @@ class UpdateCouponUseCase(UseCase[Dict[str, Any], CouponResponse]):
             self._update_coupon_fields(coupon, request)
 
             # Validações
-            self._validate_update(coupon, request, session)
+            self._validate_update(coupon, request)
 
-            # Salva alterações
-            updated_coupon = self.coupon_repo.update(coupon, session)
+            # Salva alterações; a unicidade do código é garantida pelo índice UNIQUE de cupons.codigo
+            try:
+                updated_coupon = self.coupon_repo.update(coupon, session)
+            except IntegrityError:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"Cupom com código '{coupon.codigo}' já existe"
+                )
             logger.info(f"Coupon updated: {updated_coupon.id_cupom} - {updated_coupon.codigo}")
 
             return self._build_coupon_response(updated_coupon)
@@ -71,18 +78,8 @@ class UpdateCouponUseCase(UseCase[Dict[str, Any], CouponResponse]):
         if 'ativo' in request and request['ativo'] is not None:
             coupon.ativo = request['ativo']
 
-    def _validate_update(self, coupon: Coupon, request: Dict[str, Any], session) -> None:
-        """Valida atualização do cupom"""
-        # Valida código único (se foi alterado)
-        if 'codigo' in request and request['codigo']:
-            new_codigo = request['codigo'].upper().strip()
-            if new_codigo != coupon.codigo:
-                if self.coupon_repo.exists_by_codigo(new_codigo, session):
-                    raise HTTPException(
-                        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                        detail=f"Cupom com código '{new_codigo}' já existe"
-                    )
-        
+    def _validate_update(self, coupon: Coupon, request: Dict[str, Any]) -> None:
+        """Valida atualização do cupom (código duplicado é tratado pelo IntegrityError no update)"""
         # Valida datas
         validade_inicio = request.get('validade_inicio', coupon.validade_inicio)
         validade_fim = request.get('validade_fim', coupon.validade_fim)
@@ -106,7 +103,8 @@ class UpdateCouponUseCase(UseCase[Dict[str, Any], CouponResponse]):
 
     def _build_coupon_response(self, coupon: Coupon) -> CouponResponse:
         """Builds the coupon response"""
-        return CouponResponse(
+        # Campos vêm do ORM já tipados: model_construct dispensa a revalidação do Pydantic
+        return CouponResponse.model_construct(
             id_cupom=coupon.id_cupom,
             codigo=coupon.codigo,
             tipo=coupon.tipo,
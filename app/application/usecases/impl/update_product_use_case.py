@@ -6,22 +6,21 @@ from fastapi import HTTPException, status
 from loguru import logger
 
 from app.application.usecases.use_case import UseCase
+from app.application.service.product_list_cache_service import ProductListCacheService
 from app.domain.models.product_model import Product
 from app.infrastructure.repositories.product_repository_interface import IProductRepository
 from app.infrastructure.repositories.category_repository_interface import ICategoryRepository
 from app.infrastructure.repositories.subcategory_repository_interface import ISubcategoryRepository
-from app.infrastructure.repositories.impl.product_repository_impl import ProductRepositoryImpl
-from app.infrastructure.repositories.impl.category_repository_impl import CategoryRepositoryImpl
-from app.infrastructure.repositories.impl.subcategory_repository_impl import SubcategoryRepositoryImpl
+from app.infrastructure.configs.repository_config import category_repository, product_repository, subcategory_repository
 
 
 class UpdateProductUseCase(UseCase[Dict[str, Any], Product]):
     """Use case para atualizar produto (nome, descrição, preço, categoria, ativo, etc.)"""
 
     def __init__(self):
-        self.product_repository: IProductRepository = ProductRepositoryImpl()
-        self.category_repository: ICategoryRepository = CategoryRepositoryImpl()
-        self.subcategory_repository: ISubcategoryRepository = SubcategoryRepositoryImpl()
+        self.product_repository: IProductRepository = product_repository
+        self.category_repository: ICategoryRepository = category_repository
+        self.subcategory_repository: ISubcategoryRepository = subcategory_repository
 
     def execute(self, request: Dict[str, Any], session=None) -> Product:
         """Atualiza o produto com os campos enviados (apenas os informados)."""
@@ -72,6 +71,7 @@ class UpdateProductUseCase(UseCase[Dict[str, Any], Product]):
 
             updated = self.product_repository.update(product, session)
             logger.info(f"Produto atualizado: id={updated.id_produto}, nome={updated.nome}")
+            ProductListCacheService().invalidate(session)
             return updated
 
         except HTTPException:
@@ -5,9 +5,10 @@ from fastapi import HTTPException, status
 from loguru import logger
 
 from app.application.usecases.use_case import UseCase
+from app.application.service.product_list_cache_service import ProductListCacheService
 from app.domain.exceptions.category_exceptions import SubcategoryNotFoundException, SubcategoryAlreadyExistsException
 from app.infrastructure.repositories.subcategory_repository_interface import ISubcategoryRepository
-from app.infrastructure.repositories.impl.subcategory_repository_impl import SubcategoryRepositoryImpl
+from app.infrastructure.configs.repository_config import subcategory_repository
 from app.presentation.routers.response.category_response import SubcategoryResponse
 
 
@@ -15,7 +16,7 @@ class UpdateSubcategoryUseCase(UseCase[Dict[str, Any], SubcategoryResponse]):
     """Use case para atualizar subcategoria"""
 
     def __init__(self):
-        self.subcategory_repo: ISubcategoryRepository = SubcategoryRepositoryImpl()
+        self.subcategory_repo: ISubcategoryRepository = subcategory_repository
 
     def execute(self, request: Dict[str, Any], session=None) -> SubcategoryResponse:
         """Executa o caso de uso de atualização de subcategoria"""
@@ -46,6 +47,8 @@ class UpdateSubcategoryUseCase(UseCase[Dict[str, Any], SubcategoryResponse]):
             updated_subcategory = self.subcategory_repo.update(subcategory, session)
 
             logger.info(f"Subcategory updated: {updated_subcategory.id_subcategoria} - {updated_subcategory.nome}")
+            # Listagens de produtos em cache trazem o nome da categoria/subcategoria
+            ProductListCacheService().invalidate(session)
 
             return SubcategoryResponse(
                 id_subcategoria=updated_subcategory.id_subcategoria,
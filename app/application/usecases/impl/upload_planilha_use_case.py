@@ -4,15 +4,40 @@ import io
 import json
 import datetime
 import hashlib
-import pandas as pd
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from loguru import logger
+from openpyxl import Workbook, load_workbook
 
 from app.application.usecases.use_case import UseCase
 from app.application.service.drive_service import DriveService
 from app.application.service.storage_service import StorageService
 
 
+@lru_cache(maxsize=4096)
+def _parse_image_urls_cached(imagem_url: str) -> Tuple[str, ...]:
+    """Parse puro (e memoizado) de uma célula imagem_url já normalizada com strip."""
+    if not imagem_url or imagem_url.lower() in ('nan', 'none'):
+        return ()
+
+    # Caminho rápido: URL única, sem JSON
+    if not (imagem_url.startswith('[') and imagem_url.endswith(']')):
+        return (imagem_url,)
+
+    try:
+        parsed = json.loads(imagem_url)
+        if isinstance(parsed, list):
+            return tuple(url.strip() for url in parsed if url and str(url).strip())
+    except (json.JSONDecodeError, ValueError):
+        pass
+    return tuple(url.strip() for url in imagem_url[1:-1].split(',') if url.strip())
+
+
+# Downloads/uploads simultâneos; abaixo do pool padrão de 10 conexões do cliente boto3 (MinIO)
+_IMAGE_WORKERS = 8
+
+
 class UploadPlanilhaUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
     """Use case para processar planilha Excel e fazer upload de imagens"""
 
@@ -36,25 +61,70 @@ class UploadPlanilhaUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
     def _parse_image_urls(self, imagem_url: str) -> List[str]:
         """Parseia a coluna imagem_url (URL única ou array '[url1, url2]')."""
         try:
-            imagem_url = str(imagem_url).strip()
-            if not imagem_url or imagem_url.lower() in ['nan', 'none', '']:
-                return []
-
-            if imagem_url.startswith('[') and imagem_url.endswith(']'):
-                content = imagem_url[1:-1].strip()
-                try:
-                    parsed = json.loads(imagem_url)
-                    if isinstance(parsed, list):
-                        return [url.strip() for url in parsed if url and str(url).strip()]
-                except (json.JSONDecodeError, ValueError):
-                    pass
-                return [url.strip() for url in content.split(',') if url.strip()]
-
-            return [imagem_url]
+            return list(_parse_image_urls_cached(str(imagem_url).strip()))
         except Exception as e:
             logger.error(f"Erro ao parsear URLs: {e}")
             return []
 
+    def _download_and_store(self, key: str, download_url: str) -> Optional[str]:
+        """Baixa uma imagem e envia ao storage (executa nos workers). Retorna a URL pública ou None."""
+        try:
+            image_bytes, content_type = self.drive_service.download_image_with_meta(download_url)
+            if not image_bytes:
+                logger.error(f"Imagem {key}: Falha no download da imagem")
+                return None
+
+            logger.info(f"Imagem {key}: Download concluído ({len(image_bytes)} bytes)")
+
+            storage_url = self.storage_service.upload_image(
+                file_name=self._shared_object_path(key),
+                file_bytes=image_bytes,
+                content_type=content_type or "image/jpeg"
+            )
+            if not storage_url:
+                logger.error(f"Imagem {key}: Falha no upload para storage local")
+                return None
+
+            logger.info(f"Imagem {key}: Upload concluído - {storage_url}")
+            return storage_url
+        except Exception as e:
+            logger.error(f"Erro ao processar imagem {key}: {e}")
+            return None
+
+    def _read_rows(self, file_bytes: bytes) -> Tuple[List[Any], List[tuple]]:
+        """Lê cabeçalho e linhas da primeira aba em modo read_only (streaming, só valores)."""
+        wb = load_workbook(io.BytesIO(file_bytes), read_only=True, data_only=True)
+        try:
+            row_iter = wb.active.iter_rows(values_only=True)
+            header = list(next(row_iter, ()))
+            width = len(header)
+            rows = []
+            for row in row_iter:
+                # Linhas totalmente vazias são ignoradas (como no read_excel)
+                if all(value is None for value in row):
+                    continue
+                rows.append(tuple(row[:width]) + (None,) * (width - len(row)))
+            return header, rows
+        finally:
+            wb.close()
+
+    def _write_rows(self, header: List[Any], rows: List[tuple], storage_column: List[str]) -> bytes:
+        """Gera o Excel de saída (aba Produtos) com a coluna imagem_storage, em modo write_only."""
+        storage_idx = header.index('imagem_storage') if 'imagem_storage' in header else None
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet('Produtos')
+        ws.append(header if storage_idx is not None else header + ['imagem_storage'])
+        for row, storage_value in zip(rows, storage_column):
+            if storage_idx is None:
+                ws.append(row + (storage_value,))
+            else:
+                ws.append(row[:storage_idx] + (storage_value,) + row[storage_idx + 1:])
+
+        output = io.BytesIO()
+        wb.save(output)
+        return output.getvalue()
+
     def execute(self, request: Dict[str, Any], session=None) -> Dict[str, Any]:
         """
         Executa o processamento da planilha.
@@ -73,29 +143,35 @@ class UploadPlanilhaUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
 
             logger.info("Iniciando processamento da planilha")
 
-            df = pd.read_excel(io.BytesIO(file_bytes))
+            header, rows = self._read_rows(file_bytes)
+            col_idx = {name: i for i, name in enumerate(header)}
 
             required_columns = ['codigo', 'nome', 'imagem_url']
-            missing_columns = [col for col in required_columns if col not in df.columns]
+            missing_columns = [col for col in required_columns if col not in col_idx]
             if missing_columns:
                 raise ValueError(
                     f"Planilha deve conter as colunas: {required_columns}. "
                     f"Colunas faltando: {missing_columns}"
                 )
 
-            logger.info(f"Planilha lida com sucesso. {len(df)} linhas encontradas")
+            logger.info(f"Planilha lida com sucesso. {len(rows)} linhas encontradas")
 
-            df['imagem_storage'] = ''
+            codigo_idx = col_idx['codigo']
+            nome_idx = col_idx['nome']
+            imagem_url_idx = col_idx['imagem_url']
+            storage_column = [''] * len(rows)
 
-            success_count = 0
+            # 1ª passada (sem rede): converte links e agrupa por imagem única, para que cada
+            # imagem seja baixada/enviada uma única vez mesmo repetida em várias linhas
+            row_images: Dict[int, List[Tuple[int, Optional[str], Optional[str]]]] = {}
+            pending: Dict[str, str] = {}
             error_count = 0
-            total_imagens_processadas = 0
 
-            for index, row in df.iterrows():
+            for index, row in enumerate(rows):
                 try:
-                    codigo = str(row['codigo']).strip()
-                    nome = str(row['nome']).strip()
-                    imagem_url_raw = str(row['imagem_url']).strip()
+                    codigo = str(row[codigo_idx]).strip()
+                    nome = str(row[nome_idx]).strip()
+                    imagem_url_raw = str(row[imagem_url_idx]).strip()
 
                     image_urls = self._parse_image_urls(imagem_url_raw)
 
@@ -105,95 +181,81 @@ class UploadPlanilhaUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
 
                     logger.info(f"Processando linha {index + 1}: {codigo} - {nome} ({len(image_urls)} imagem(ns))")
 
-                    storage_urls = []
-                    linha_success = 0
-                    linha_errors = 0
-
+                    images = []
                     for img_idx, imagem_url in enumerate(image_urls, 1):
-                        try:
-                            logger.info(f"Linha {index + 1}, Imagem {img_idx}/{len(image_urls)}: Processando {imagem_url[:50]}...")
-
-                            download_url = self.drive_service.convert_drive_link(imagem_url)
-                            if not download_url:
-                                logger.error(f"Linha {index + 1}, Imagem {img_idx}: Não foi possível converter o link")
-                                linha_errors += 1
-                                continue
-
-                            # URL já é do storage (MinIO ou legado local) — usa diretamente sem re-upload
-                            is_stored_url = '/storage/' in download_url or '/api/media/' in download_url or '/uploads/' in download_url
-
-                            if is_stored_url:
-                                logger.info(f"Linha {index + 1}, Imagem {img_idx}: URL já é local, usando diretamente")
-                                storage_url = download_url
-                            else:
-                                key = self._image_key(original_url=imagem_url, download_url=download_url)
-                                cached = self._shared_image_cache.get(key)
-                                if cached:
-                                    storage_url = cached
-                                    logger.info(f"Linha {index + 1}, Imagem {img_idx}: Dedupe cache_hit=1")
-                                else:
-                                    object_path = self._shared_object_path(key)
-
-                                    image_bytes, content_type = self.drive_service.download_image_with_meta(download_url)
-                                    if not image_bytes:
-                                        logger.error(f"Linha {index + 1}, Imagem {img_idx}: Falha no download da imagem")
-                                        linha_errors += 1
-                                        continue
-
-                                    logger.info(f"Linha {index + 1}, Imagem {img_idx}: Download concluído ({len(image_bytes)} bytes)")
-
-                                    storage_url = self.storage_service.upload_image(
-                                        file_name=object_path,
-                                        file_bytes=image_bytes,
-                                        content_type=content_type or "image/jpeg"
-                                    )
-
-                                    if not storage_url:
-                                        logger.error(f"Linha {index + 1}, Imagem {img_idx}: Falha no upload para storage local")
-                                        linha_errors += 1
-                                        continue
-
-                                    self._shared_image_cache[key] = storage_url
-
-                            storage_urls.append(storage_url)
-                            linha_success += 1
-                            total_imagens_processadas += 1
-
-                            logger.info(f"Linha {index + 1}, Imagem {img_idx}: Upload concluído - {storage_url}")
-
-                        except Exception as e:
-                            logger.error(f"Erro ao processar imagem {img_idx} da linha {index + 1}: {e}")
-                            linha_errors += 1
+                        download_url = self.drive_service.convert_drive_link(imagem_url)
+                        if not download_url:
+                            logger.error(f"Linha {index + 1}, Imagem {img_idx}: Não foi possível converter o link")
+                            images.append((img_idx, None, None))
                             continue
 
-                    if storage_urls:
-                        storage_urls_str = '[' + ', '.join(storage_urls) + ']'
-                        df.at[index, 'imagem_storage'] = storage_urls_str
-                        success_count += 1
-                        logger.info(f"Linha {index + 1}: Processada com sucesso - {linha_success} imagem(ns) salva(s)")
-                    else:
-                        logger.warning(f"Linha {index + 1}: Nenhuma imagem foi processada com sucesso")
-                        error_count += 1
+                        # URL já é do storage (MinIO ou legado local) — usa diretamente sem re-upload
+                        is_stored_url = '/storage/' in download_url or '/api/media/' in download_url or '/uploads/' in download_url
+                        if is_stored_url:
+                            logger.info(f"Linha {index + 1}, Imagem {img_idx}: URL já é local, usando diretamente")
+                            images.append((img_idx, download_url, None))
+                            continue
+
+                        key = self._image_key(original_url=imagem_url, download_url=download_url)
+                        if key in pending or key in self._shared_image_cache:
+                            logger.info(f"Linha {index + 1}, Imagem {img_idx}: Dedupe cache_hit=1")
+                        else:
+                            pending[key] = download_url
+                        images.append((img_idx, None, key))
 
-                    if linha_errors > 0:
-                        error_count += linha_errors
+                    row_images[index] = images
 
                 except Exception as e:
                     logger.error(f"Erro ao processar linha {index + 1}: {e}")
                     error_count += 1
-                    continue
+
+            # 2ª passada: download + upload das imagens únicas em paralelo (I/O de rede)
+            if pending:
+                logger.info(f"Baixando e enviando {len(pending)} imagem(ns) única(s) com até {_IMAGE_WORKERS} workers")
+                with ThreadPoolExecutor(max_workers=_IMAGE_WORKERS) as executor:
+                    futures = {
+                        executor.submit(self._download_and_store, key, download_url): key
+                        for key, download_url in pending.items()
+                    }
+                    for future in as_completed(futures):
+                        storage_url = future.result()
+                        if storage_url:
+                            self._shared_image_cache[futures[future]] = storage_url
+
+            # 3ª passada: monta a coluna imagem_storage e as estatísticas por linha
+            success_count = 0
+            total_imagens_processadas = 0
+
+            for index, images in row_images.items():
+                storage_urls = []
+                linha_errors = 0
+
+                for img_idx, stored_url, key in images:
+                    storage_url = stored_url or (self._shared_image_cache.get(key) if key else None)
+                    if not storage_url:
+                        if key:
+                            logger.error(f"Linha {index + 1}, Imagem {img_idx}: Falha no download/upload da imagem")
+                        linha_errors += 1
+                        continue
+                    storage_urls.append(storage_url)
+
+                if storage_urls:
+                    storage_column[index] = '[' + ', '.join(storage_urls) + ']'
+                    success_count += 1
+                    total_imagens_processadas += len(storage_urls)
+                    logger.info(f"Linha {index + 1}: Processada com sucesso - {len(storage_urls)} imagem(ns) salva(s)")
+                else:
+                    logger.warning(f"Linha {index + 1}: Nenhuma imagem foi processada com sucesso")
+                    error_count += 1
+
+                error_count += linha_errors
 
             logger.info(
                 f"Processamento concluído: {success_count} linhas processadas, "
                 f"{total_imagens_processadas} imagens salvas, {error_count} erros"
             )
 
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Produtos')
-
-            output.seek(0)
-            result_bytes = output.read()
+            result_bytes = self._write_rows(header, rows, storage_column)
 
             logger.info(f"Arquivo Excel gerado: {len(result_bytes)} bytes")
 
@@ -215,7 +277,7 @@ class UploadPlanilhaUseCase(UseCase[Dict[str, Any], Dict[str, Any]]):
             return {
                 "excel_url": excel_url,
                 "excel_filename": excel_file_name,
-                "total_linhas": len(df),
+                "total_linhas": len(rows),
                 "linhas_processadas": success_count,
                 "total_imagens_salvas": total_imagens_processadas,
                 "erros": error_count,
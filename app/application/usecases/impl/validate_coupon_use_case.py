@@ -7,7 +7,7 @@ from loguru import logger
 
 from app.application.usecases.use_case import UseCase
 from app.infrastructure.repositories.coupon_repository_interface import ICouponRepository
-from app.infrastructure.repositories.impl.coupon_repository_impl import CouponRepositoryImpl
+from app.infrastructure.configs.repository_config import coupon_repository
 from app.presentation.routers.response.coupon_response import ValidateCouponResponse, CouponResponse
 
 
@@ -15,7 +15,7 @@ class ValidateCouponUseCase(UseCase[Dict[str, Any], ValidateCouponResponse]):
     """Use case for validating coupon by code"""
 
     def __init__(self):
-        self.coupon_repo: ICouponRepository = CouponRepositoryImpl()
+        self.coupon_repo: ICouponRepository = coupon_repository
 
     def execute(self, request: Dict[str, Any], session=None) -> ValidateCouponResponse:
         """Executes the coupon validation use case"""
@@ -77,7 +77,8 @@ class ValidateCouponUseCase(UseCase[Dict[str, Any], ValidateCouponResponse]):
 
     def _build_coupon_response(self, coupon) -> CouponResponse:
         """Builds the coupon response"""
-        return CouponResponse(
+        # Campos vêm do ORM já tipados: model_construct dispensa a revalidação do Pydantic
+        return CouponResponse.model_construct(
             id_cupom=coupon.id_cupom,
             codigo=coupon.codigo,
             tipo=coupon.tipo,
@@ -1,4 +1,6 @@
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
 import jwt
 from fastapi import HTTPException
@@ -11,15 +13,33 @@ from app.domain.models.dtos.user_company_permission_dto import UserCompanyPermis
 from app.domain.models.enumerations.role_enumerations import RoleEnum
 from app.infrastructure.configs.database_config import Session
 from app.infrastructure.repositories.company_repository_interface import ICompanyRepository
-from app.infrastructure.repositories.impl.company_repository_impl import CompanyRepositoryImpl
+from app.infrastructure.configs.repository_config import company_repository
 
 from app.infrastructure.utils.messages import messages
 
+# Decoder e chave preparados uma vez: evita montar o PyJWT/encode da chave a cada request autenticada
+_JWT_DECODER = jwt.PyJWT(options={"require": ["exp", "sub"]})
+_JWT_KEY = envs.JWT_SECRET_KEY.encode() if isinstance(envs.JWT_SECRET_KEY, str) else envs.JWT_SECRET_KEY
+
+
+@lru_cache(maxsize=4096)
+def _decode_token_cached(token: str) -> Dict[str, Any]:
+    """Verifica assinatura e claims uma vez por token; o exp é checado fora do cache."""
+    return _JWT_DECODER.decode(token, _JWT_KEY, algorithms=["HS256"], options={"verify_exp": False})
+
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    payload = _decode_token_cached(token)
+    # Reavalia a expiração a cada chamada: uma entrada em cache nunca valida um token vencido
+    if payload["exp"] <= time.time():
+        raise ExpiredSignatureError("Signature has expired")
+    return dict(payload)
+
 
 class VerifyUserPermissionUseCase(UseCase[UserCompanyPermissionDTO, Optional[CompanyDTO]]):
 
     def __init__(self):
-        self.__company_repository: ICompanyRepository = CompanyRepositoryImpl()
+        self.__company_repository: ICompanyRepository = company_repository
 
 
     def execute(self, data: UserCompanyPermissionDTO, session: Session = None) -> Optional[CompanyDTO]:
@@ -101,11 +121,11 @@ class VerifyUserPermissionUseCase(UseCase[UserCompanyPermissionDTO, Optional[Com
     def __valid_token(authorization):
         from loguru import logger
         
-        token = authorization.replace("Bearer ", "")
+        token = authorization[7:] if authorization.startswith("Bearer ") else authorization
         logger.debug(f"🔐 Tentando decodificar token com chave: {envs.JWT_SECRET_KEY[:10]}...")
         
         try:
-            decoded = jwt.decode(jwt=token, key=envs.JWT_SECRET_KEY, algorithms=["HS256"])
+            decoded = _decode_token(token)
             logger.debug(f"✅ Token decodificado com sucesso: {decoded}")
             return decoded
         except ExpiredSignatureError as e:
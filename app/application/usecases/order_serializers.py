@@ -0,0 +1,21 @@
+from typing import Any, Dict
+
+from app.domain.models.order_model import Order
+
+
+def build_order_response(order: Order) -> Dict[str, Any]:
+    """Dict de resposta do pedido (formato de OrderResponse, sem itens) usado pelas listagens.
+
+    Datas seguem como datetime: o FastJSONResponse (orjson) as serializa em ISO-8601.
+    """
+    status = order.status
+    return {
+        "id": order.id_pedido,
+        "id_cliente": order.id_cliente,
+        "id_cupom": order.id_cupom,
+        "data_pedido": order.data_pedido,
+        "status": status.value if status else None,
+        "valor_total": float(order.valor_total),
+        "created_at": order.created_at,
+        "updated_at": order.updated_at
+    }
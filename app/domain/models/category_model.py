@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, Index
+from sqlalchemy import Integer, String, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import List
 
@@ -20,6 +20,8 @@ class Category(Base, TimestampMixin, BaseMixin):
     __table_args__ = (
         Index('idx_categoria_nome_search', 'nome'),
     )
+    # updated_at (onupdate no banco) volta no próprio UPDATE via RETURNING, sem refresh posterior
+    __mapper_args__ = {'eager_defaults': True}
 
     # Relacionamentos
     subcategorias: Mapped[List['Subcategory']] = relationship(
@@ -30,4 +32,13 @@ class Category(Base, TimestampMixin, BaseMixin):
     produtos: Mapped[List['Product']] = relationship('Product', back_populates='categoria')
 
     def __init__(self, nome):
-        self.nome = nome
\ No newline at end of file
+        self.nome = nome
+
+
+# Trigram (pg_trgm) sobre lower(nome) para buscas lower(nome) LIKE '%...%'
+Index(
+    'idx_categoria_nome_lower_trgm',
+    func.lower(Category.nome).label('nome_lower'),
+    postgresql_using='gin',
+    postgresql_ops={'nome_lower': 'gin_trgm_ops'}
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, DateTime, ForeignKey, Enum
+from sqlalchemy import Integer, String, DateTime, ForeignKey, Enum, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from typing import Optional
@@ -11,6 +11,10 @@ from app.infrastructure.configs.base_mixin import BaseMixin, Base, TimestampMixi
 class EmailToken(Base, BaseMixin):
     """Modelo de domínio para EmailToken"""
     __tablename__ = 'email_token'
+    __table_args__ = (
+        # Um token vigente por empresa e tipo (alvo do ON CONFLICT no reenvio)
+        UniqueConstraint('id_empresa', 'tipo', name='uq_email_token_empresa_tipo'),
+    )
 
     id_email: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     id_empresa: Mapped[int] = mapped_column(
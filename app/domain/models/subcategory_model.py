@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, ForeignKey, Index
+from sqlalchemy import Integer, String, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import List
 
@@ -21,6 +21,8 @@ class Subcategory(Base, TimestampMixin, BaseMixin):
     nome: Mapped[str] = mapped_column(String(150), nullable=False)
 
     __table_args__ = (
+        # Nome único dentro da categoria (alvo do ON CONFLICT na criação)
+        UniqueConstraint('id_categoria', 'nome', name='subcategoria_id_categoria_nome_key'),
         Index('idx_subcategoria_nome', 'nome'),
         Index('idx_subcategoria_categoria', 'id_categoria'),
     )
@@ -1,6 +1,7 @@
 
 from loguru import logger
 from sqlalchemy import create_engine, QueuePool
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
 
@@ -19,6 +20,11 @@ def __connection_status(engine):
         logger.exception(f"Unexpected error while trying to connect to the database: {e}")
 
 
+# psycopg2: agrupa executemany (UPDATEs em lote) via execute_batch; INSERTs já usam multi-VALUES
+_driver_options = {}
+if make_url(envs.SQLALCHEMY_DATABASE_URI).get_driver_name() == "psycopg2":
+    _driver_options["executemany_mode"] = "values_plus_batch"
+
 engine = create_engine(
     envs.SQLALCHEMY_DATABASE_URI,
     pool_size=envs.SQLALCHEMY_POOL_SIZE,
@@ -27,7 +33,11 @@ engine = create_engine(
     pool_recycle=envs.SQLALCHEMY_POOL_RECYCLE,
     pool_pre_ping=envs.SQLALCHEMY_POOL_PRE_PING,
     echo=envs.SQLALCHEMY_SHOW_SQL,
-    poolclass=QueuePool
+    poolclass=QueuePool,
+    # Consultas dos repositórios (inclusive session.query) são compiladas uma vez e reaproveitadas;
+    # o cache precisa comportar todas as variações de filtros das listagens para não haver expulsões
+    query_cache_size=envs.SQLALCHEMY_QUERY_CACHE_SIZE,
+    **_driver_options
 )
 
 __connection_status(engine)
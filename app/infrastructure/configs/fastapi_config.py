@@ -6,7 +6,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
@@ -48,7 +48,9 @@ async def lifespan(app: FastAPI):
     logger.info("Buckets MinIO prontos.")
 
     yield
-    # shutdown: nada a liberar explicitamente (SQLAlchemy pool e boto3 encerram com o processo)
+    # shutdown: SQLAlchemy pool e boto3 encerram com o processo; a conexão SMTP é fechada aqui
+    from app.application.service.email_service import EmailService
+    EmailService().close()
 
 
 # ==== Aplicação ====
@@ -74,6 +76,8 @@ application = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    # orjson serializa respostas grandes (listas de produtos, carrinho) bem mais rápido que o json da stdlib
+    default_response_class=ORJSONResponse,
     contact={
         "name": "Equipe Fortlar",
         "email": "vendas@fortlar.com.br",
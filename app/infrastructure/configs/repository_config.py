@@ -0,0 +1,40 @@
+"""Instâncias compartilhadas dos repositories
+
+Os repositories não guardam estado por request (a sessão é recebida em cada método),
+então os use cases reutilizam estas instâncias em vez de criar novas a cada request.
+"""
+
+from app.infrastructure.repositories.category_repository_interface import ICategoryRepository
+from app.infrastructure.repositories.subcategory_repository_interface import ISubcategoryRepository
+from app.infrastructure.repositories.product_repository_interface import IProductRepository
+from app.infrastructure.repositories.company_repository_interface import ICompanyRepository
+from app.infrastructure.repositories.coupon_repository_interface import ICouponRepository
+from app.infrastructure.repositories.order_repository_interface import IOrderRepository
+from app.infrastructure.repositories.contact_repository_interface import IContactRepository
+from app.infrastructure.repositories.address_repository_interface import IAddressRepository
+from app.infrastructure.repositories.email_token_repository_interface import IEmailTokenRepository
+from app.infrastructure.repositories.product_image_repository_interface import IProductImageRepository
+from app.infrastructure.repositories.region_repository_interface import IRegionRepository
+from app.infrastructure.repositories.impl.category_repository_impl import CategoryRepositoryImpl
+from app.infrastructure.repositories.impl.subcategory_repository_impl import SubcategoryRepositoryImpl
+from app.infrastructure.repositories.impl.product_repository_impl import ProductRepositoryImpl
+from app.infrastructure.repositories.impl.company_repository_impl import CompanyRepositoryImpl
+from app.infrastructure.repositories.impl.coupon_repository_impl import CouponRepositoryImpl
+from app.infrastructure.repositories.impl.order_repository_impl import OrderRepositoryImpl
+from app.infrastructure.repositories.impl.contact_repository_impl import ContactRepositoryImpl
+from app.infrastructure.repositories.impl.address_repository_impl import AddressRepositoryImpl
+from app.infrastructure.repositories.impl.email_token_repository_impl import EmailTokenRepositoryImpl
+from app.infrastructure.repositories.impl.product_image_repository_impl import ProductImageRepositoryImpl
+from app.infrastructure.repositories.impl.region_repository_impl import RegionRepositoryImpl
+
+category_repository: ICategoryRepository = CategoryRepositoryImpl()
+subcategory_repository: ISubcategoryRepository = SubcategoryRepositoryImpl()
+product_repository: IProductRepository = ProductRepositoryImpl()
+company_repository: ICompanyRepository = CompanyRepositoryImpl()
+coupon_repository: ICouponRepository = CouponRepositoryImpl()
+order_repository: IOrderRepository = OrderRepositoryImpl()
+contact_repository: IContactRepository = ContactRepositoryImpl()
+address_repository: IAddressRepository = AddressRepositoryImpl()
+email_token_repository: IEmailTokenRepository = EmailTokenRepositoryImpl()
+product_image_repository: IProductImageRepository = ProductImageRepositoryImpl()
+region_repository: IRegionRepository = RegionRepositoryImpl()
@@ -34,6 +34,11 @@ class ICategoryRepository(ABC):
     def get_by_name(self, name: str, session: Session) -> Optional[Category]:
         pass
 
+    @abstractmethod
+    def get_by_names(self, names: List[str], session: Session) -> List[Category]:
+        """Busca categorys por lista de nomes exatos (em lote)"""
+        pass
+
     @abstractmethod
     def search_by_name(self, name: str, session: Session, skip: int = 0, limit: int = 100) -> List[Category]:
         pass
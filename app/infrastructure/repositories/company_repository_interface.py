@@ -25,6 +25,10 @@ class ICompanyRepository(ABC):
     def get_by_id(self, company_id: int, session: Session) -> Optional[Company]:
         pass
 
+    @abstractmethod
+    def get_by_id_with_valid_token(self, company_id: int, token: str, token_type, session: Session) -> Optional[Company]:
+        pass
+
     @abstractmethod
     def get_by_id_and_role(self, company_id: int, role, session: Session) -> Optional[Company]:
         pass
@@ -33,12 +37,16 @@ class ICompanyRepository(ABC):
     def create_company_with_address_and_contact(self, company: Company, session: Session) -> int:
         pass
 
+    @abstractmethod
+    def update(self, company: Company, session: Session) -> Company:
+        pass
+
     @abstractmethod
     def update_company_ativo(self, company_id: int, session: Session) -> None:
         pass
 
     @abstractmethod
-    def update_password(self, company_id: int, new_password: str, session: Session) -> None:
+    def update_password(self, company_id: int, new_password: str, session: Session) -> bool:
         pass
 
     @abstractmethod
@@ -69,6 +77,10 @@ class ICompanyRepository(ABC):
     def update_status(self, company_id: int, ativo: bool, session: Session) -> bool:
         pass
 
+    @abstractmethod
+    def delete(self, company_id: int, session: Session) -> bool:
+        pass
+
     @abstractmethod
     def get_with_relations(self, company_id: int, session: Session) -> Optional[Company]:
         pass
\ No newline at end of file
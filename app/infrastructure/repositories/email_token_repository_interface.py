@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from app.domain.models.email_token_model import EmailToken
 from app.domain.models.enumerations.email_token_type_enumerations import EmailTokenTypeEnum
@@ -40,6 +40,12 @@ class IEmailTokenRepository(ABC):
         """Verifica se token existe por token, empresa e tipo"""
         pass
 
+    @abstractmethod
+    def validate_activate_and_consume(self, token: str, company_id: int, token_type: EmailTokenTypeEnum,
+                                      session: Session) -> Tuple[bool, bool]:
+        """Consome o token e ativa a empresa numa única ida ao banco; retorna (token_valido, empresa_ativada)"""
+        pass
+
     @abstractmethod
     def get_by_company_id(self, company_id: int, session: Session) -> Optional[EmailToken]:
         """Busca token por empresa"""
@@ -50,6 +56,11 @@ class IEmailTokenRepository(ABC):
         """Cria token de email (método legado)"""
         pass
 
+    @abstractmethod
+    def upsert_token(self, company_id: int, token: str, token_type: EmailTokenTypeEnum, session: Session) -> None:
+        """Grava o token da empresa para o tipo, substituindo o anterior se houver (uma ida ao banco)"""
+        pass
+
     @abstractmethod
     def delete_by_token_and_company_id(self, token: str, company_id: int, session: Session) -> None:
         """Deleta token por token e empresa"""
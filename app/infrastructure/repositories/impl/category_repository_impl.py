@@ -32,18 +32,26 @@ class CategoryRepositoryImpl(ICategoryRepository):
         return category
 
     def delete(self, category_id: int, session: Session) -> bool:
-        """Deleta uma category"""
-        category = self.get_by_id(category_id, session)
-        if category:
-            session.delete(category)
-            session.flush()
-            return True
-        return False
+        """Deleta uma category (subcategorias são removidas pelo ON DELETE CASCADE do banco)"""
+        from sqlalchemy import delete
+
+        deleted = session.execute(
+            delete(Category).where(Category.id_categoria == category_id).returning(Category.id_categoria)
+        ).first()
+        if deleted is None:
+            return False
+        return True
 
     def get_by_name(self, name: str, session: Session) -> Optional[Category]:
         """Busca category por nome exato"""
         return session.query(Category).filter(Category.nome == name).first()
 
+    def get_by_names(self, names: List[str], session: Session) -> List[Category]:
+        """Busca categorys por lista de nomes exatos (em lote)"""
+        if not names:
+            return []
+        return session.query(Category).filter(Category.nome.in_(names)).all()
+
     def search_by_name(self, name: str, session: Session, skip: int = 0, limit: int = 100) -> List[Category]:
         """Busca categorys por nome (busca parcial)"""
         # Validação de entrada
@@ -54,8 +62,10 @@ class CategoryRepositoryImpl(ICategoryRepository):
         skip = max(0, skip)
         limit = max(1, min(limit, 1000))
         
+        from sqlalchemy import func
+        # lower(nome) LIKE com o padrão já em minúsculas usa o índice trigram de lower(nome)
         return session.query(Category).filter(
-            Category.nome.ilike(f"%{name.strip()}%")
+            func.lower(Category.nome).like(f"%{name.strip().lower()}%")
         ).offset(skip).limit(limit).all()
 
     def exists_by_name(self, name: str, session: Session) -> bool:
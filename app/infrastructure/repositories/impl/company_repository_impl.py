@@ -1,10 +1,11 @@
 from typing import Optional, List
-from sqlalchemy.orm import joinedload
-from sqlalchemy import or_, and_
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy import or_, and_, func, update
 
 from app.domain.models.address_model import Address
 from app.domain.models.company_model import Company
 from app.domain.models.contact_model import Contact
+from app.domain.models.email_token_model import EmailToken
 from app.infrastructure.configs.database_config import Session
 from app.infrastructure.repositories.company_repository_interface import ICompanyRepository
 
@@ -39,12 +40,30 @@ class CompanyRepositoryImpl(ICompanyRepository):
         return query.first()
 
     def get_by_id(self, company_id: int, session: Session) -> Optional[Company]:
-        """Busca empresa por ID"""
-        return session.query(Company).options(
-            joinedload(Company.enderecos),
-            joinedload(Company.contatos),
-            joinedload(Company.vendedor)
-        ).filter(Company.id_empresa == company_id).first()
+        """
+        Busca empresa por ID. Via session.get: se a empresa já está na sessão (ex.: carregada
+        pela verificação de permissão da mesma requisição), não emite outro SELECT
+        """
+        return session.get(
+            Company,
+            company_id,
+            options=[
+                selectinload(Company.enderecos),
+                selectinload(Company.contatos),
+                joinedload(Company.vendedor)
+            ]
+        )
+
+    def get_by_id_with_valid_token(self, company_id: int, token: str, token_type, session: Session) -> Optional[Company]:
+        """Busca empresa por ID somente se houver email_token válido (não expirado) com o token e tipo informados (um único SELECT com JOIN)"""
+        return session.query(Company).join(
+            EmailToken, EmailToken.id_empresa == Company.id_empresa
+        ).filter(
+            and_(Company.id_empresa == company_id,
+                 EmailToken.token == token,
+                 EmailToken.tipo == token_type,
+                 EmailToken.expires_at > func.now())
+        ).first()
 
     def get_by_id_and_role(self, company_id: int, role, session: Session) -> Optional[Company]:
         return session.query(Company).filter(
@@ -56,6 +75,12 @@ class CompanyRepositoryImpl(ICompanyRepository):
         session.flush()
         return company.id_empresa
 
+    def update(self, company: Company, session: Session) -> Company:
+        """Atualiza uma empresa"""
+        session.merge(company)
+        session.flush()
+        return company
+
     def update_company_ativo(self, company_id: int, session: Session) -> None:
         """Atualiza status ativo da empresa para True"""
         company = session.query(Company).filter(Company.id_empresa == company_id).first()
@@ -64,12 +89,15 @@ class CompanyRepositoryImpl(ICompanyRepository):
             session.flush()
 
 
-    def update_password(self, company_id: int, new_password: str, session: Session) -> None:
-        """Atualiza senha da empresa"""
-        company = session.query(Company).filter(Company.id_empresa == company_id).first()
-        if company:
-            company.senha_hash = new_password
-            session.flush()
+    def update_password(self, company_id: int, new_password: str, session: Session) -> bool:
+        """Atualiza senha da empresa com um único UPDATE ... RETURNING; retorna False se a empresa não existe"""
+        updated_id = session.execute(
+            update(Company)
+            .where(Company.id_empresa == company_id)
+            .values(senha_hash=new_password)
+            .returning(Company.id_empresa)
+        ).scalar_one_or_none()
+        return updated_id is not None
 
     def update_company_ativo_status(self, company_id: int, ativo: bool, session: Session) -> None:
         """Atualiza status ativo/inativo da empresa"""
@@ -102,8 +130,8 @@ class CompanyRepositoryImpl(ICompanyRepository):
         limit = max(1, min(limit, 1000))
         
         return session.query(Company).options(
-            joinedload(Company.enderecos),
-            joinedload(Company.contatos),
+            selectinload(Company.enderecos),
+            selectinload(Company.contatos),
             joinedload(Company.vendedor)
         ).filter(
             Company.id_vendedor == vendedor_id
@@ -120,8 +148,8 @@ class CompanyRepositoryImpl(ICompanyRepository):
         limit = max(1, min(limit, 1000))
         
         return session.query(Company).options(
-            joinedload(Company.enderecos),
-            joinedload(Company.contatos),
+            selectinload(Company.enderecos),
+            selectinload(Company.contatos),
             joinedload(Company.vendedor)
         ).filter(
             or_(
@@ -139,11 +167,20 @@ class CompanyRepositoryImpl(ICompanyRepository):
             return True
         return False
 
+    def delete(self, company_id: int, session: Session) -> bool:
+        """Deleta empresa (endereços, contatos e tokens são removidos pelo ON DELETE CASCADE do banco)"""
+        from sqlalchemy import delete
+
+        deleted = session.execute(
+            delete(Company).where(Company.id_empresa == company_id).returning(Company.id_empresa)
+        ).first()
+        return deleted is not None
+
     def get_with_relations(self, company_id: int, session: Session) -> Optional[Company]:
         """Busca empresa com todos os relacionamentos"""
         return session.query(Company).options(
-            joinedload(Company.enderecos),
-            joinedload(Company.contatos),
+            selectinload(Company.enderecos),
+            selectinload(Company.contatos),
             joinedload(Company.vendedor)
         ).filter(Company.id_empresa == company_id).first()
 
@@ -31,13 +31,15 @@ class CouponRepositoryImpl(ICouponRepository):
         return coupon
 
     def delete(self, coupon_id: int, session: Session) -> bool:
-        """Deleta um cupom"""
-        coupon = self.get_by_id(coupon_id, session)
-        if coupon:
-            session.delete(coupon)
-            session.flush()
-            return True
-        return False
+        """Deleta um cupom (pedidos que o usaram ficam sem cupom)"""
+        from sqlalchemy import delete, update
+        from app.domain.models.order_model import Order
+
+        session.execute(update(Order).where(Order.id_cupom == coupon_id).values(id_cupom=None))
+        deleted = session.execute(
+            delete(Coupon).where(Coupon.id_cupom == coupon_id).returning(Coupon.id_cupom)
+        ).first()
+        return deleted is not None
 
     def get_by_codigo(self, codigo: str, session: Session) -> Optional[Coupon]:
         """Busca cupom por código"""
@@ -1,12 +1,13 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 
+from app.domain.models.company_model import Company
 from app.domain.models.email_token_model import EmailToken
 from app.domain.models.enumerations.email_token_type_enumerations import EmailTokenTypeEnum
 from app.infrastructure.configs.database_config import Session
 from app.infrastructure.repositories.email_token_repository_interface import IEmailTokenRepository
 
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, select, update
 
 
 class EmailTokenRepositoryImpl(IEmailTokenRepository):
@@ -49,6 +50,36 @@ class EmailTokenRepositoryImpl(IEmailTokenRepository):
                                                      EmailToken.tipo == type)
                                                 ).first() is not None
 
+    def validate_activate_and_consume(self, token: str, company_id: int, token_type: EmailTokenTypeEnum,
+                                      session: Session) -> Tuple[bool, bool]:
+        """
+        WITH consumed AS (DELETE ... RETURNING), activated AS (UPDATE empresas ... RETURNING):
+        valida (inclusive a expiração), consome o token e ativa a empresa num único statement
+        """
+        consumed = (
+            delete(EmailToken)
+            .where(and_(EmailToken.token == token,
+                        EmailToken.id_empresa == company_id,
+                        EmailToken.tipo == token_type,
+                        EmailToken.expires_at > func.now()))
+            .returning(EmailToken.id_empresa)
+            .cte('consumed')
+        )
+        activated = (
+            update(Company)
+            .where(Company.id_empresa.in_(select(consumed.c.id_empresa)))
+            .values(ativo=True)
+            .returning(Company.id_empresa)
+            .cte('activated')
+        )
+        row = session.execute(
+            select(
+                select(func.count()).select_from(consumed).scalar_subquery().label('matched'),
+                select(func.count()).select_from(activated).scalar_subquery().label('updated')
+            )
+        ).one()
+        return row.matched > 0, row.updated > 0
+
     def get_by_company_id(self, company_id: int, session: Session) -> Optional[EmailToken]:
         """Busca token por empresa"""
         return session.query(EmailToken).filter(EmailToken.id_empresa == company_id).first()
@@ -59,6 +90,24 @@ class EmailTokenRepositoryImpl(IEmailTokenRepository):
         session.flush()
         return email_token.id_empresa
 
+    def upsert_token(self, company_id: int, token: str, token_type: EmailTokenTypeEnum, session: Session) -> None:
+        """
+        INSERT ... ON CONFLICT (id_empresa, tipo) DO UPDATE: substitui o token anterior
+        (e renova a expiração) sem SELECT/DELETE prévios
+        """
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        stmt = pg_insert(EmailToken).values(
+            id_empresa=company_id,
+            token=token,
+            tipo=token_type
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EmailToken.id_empresa, EmailToken.tipo],
+            set_={'token': stmt.excluded.token, 'expires_at': stmt.excluded.expires_at}
+        )
+        session.execute(stmt)
+
     def delete_by_token_and_company_id(self, token: str, company_id: int, session: Session) -> None:
         """Deleta token por token e empresa"""
         session.query(EmailToken).filter(
@@ -1,9 +1,12 @@
 """Implementação do repository para Order"""
 
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from datetime import datetime
 from decimal import Decimal
 
+from sqlalchemy import insert
+
+from app.domain.models.order_item_model import OrderItem
 from app.domain.models.order_model import Order, OrderStatusEnum
 from app.infrastructure.configs.database_config import Session
 from app.infrastructure.repositories.order_repository_interface import IOrderRepository
@@ -19,10 +22,18 @@ class OrderRepositoryImpl(IOrderRepository):
         session.flush()
         return order
 
-    def create_order_with_items(self, order: Order, session: Session) -> Order:
-        """Cria um order com seus itens (os itens devem estar associados ao order antes)"""
+    def create_order_with_items(self, order: Order, item_rows: List[Dict[str, Any]], session: Session) -> Order:
+        """
+        Cria um order e seus itens. Os itens (dicts com as colunas de OrderItem, sem id_pedido)
+        vão num único INSERT em lote, sem instanciar OrderItem nem passar pelo identity map
+        """
         session.add(order)
         session.flush()
+        if item_rows:
+            session.execute(
+                insert(OrderItem),
+                [{**row, "id_pedido": order.id_pedido} for row in item_rows]
+            )
         return order
 
     def get_by_id(self, pedido_id: int, session: Session) -> Optional[Order]:
@@ -34,12 +34,24 @@ class ProductImageRepositoryImpl(IProductImageRepository):
 
     def delete(self, image_id: int, session: Session) -> bool:
         """Deleta um product_image por ID"""
-        image = self.get_by_id(image_id, session)
-        if image:
-            session.delete(image)
-            session.flush()
-            return True
-        return False
+        from sqlalchemy import delete
+
+        deleted = session.execute(
+            delete(ProductImage).where(ProductImage.id_imagem == image_id).returning(ProductImage.id_imagem)
+        ).first()
+        return deleted is not None
+
+    def delete_from_produto(self, image_id: int, produto_id: int, session: Session) -> Optional[str]:
+        """Deleta a imagem se pertencer ao produto; retorna a URL removida ou None"""
+        from sqlalchemy import delete
+
+        deleted = session.execute(
+            delete(ProductImage).where(
+                ProductImage.id_imagem == image_id,
+                ProductImage.id_produto == produto_id
+            ).returning(ProductImage.url)
+        ).first()
+        return deleted.url if deleted else None
 
     def get_by_produto(self, produto_id: int, session: Session) -> List[ProductImage]:
         """Busca todas as imagens de um produto"""
@@ -1,12 +1,25 @@
 """Implementação do repository para Product"""
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Tuple, Set, Iterable
 from decimal import Decimal
 
+from sqlalchemy.orm import selectinload
+
 from app.domain.models.product_model import Product
 from app.infrastructure.configs.database_config import Session
 from app.infrastructure.repositories.product_repository_interface import IProductRepository
 
+# Tamanho máximo da lista em cláusulas IN (evita estourar o limite de parâmetros do Postgres)
+IN_CLAUSE_BATCH_SIZE = 1000
+# Linhas por INSERT ... ON CONFLICT (9 colunas x 1000 linhas fica abaixo do limite de 65535 parâmetros)
+UPSERT_BATCH_SIZE = 1000
+# Relacionamentos lidos ao montar a resposta de produto (um SELECT ... IN por relação, sem N+1)
+PRODUCT_RELATION_LOADS = (
+    selectinload(Product.categoria),
+    selectinload(Product.subcategoria),
+    selectinload(Product.imagens),
+)
+
 
 class ProductRepositoryImpl(IProductRepository):
     """Repository para operações de Product com CRUD completo"""
@@ -18,6 +31,13 @@ class ProductRepositoryImpl(IProductRepository):
         session.flush()
         return product
 
+    def create_many(self, products: List[Product], session: Session) -> List[Product]:
+        """Cria products em lote: um único flush gera INSERT multi-VALUES com RETURNING dos ids"""
+        if products:
+            session.add_all(products)
+            session.flush()
+        return products
+
     def get_by_id(self, product_id: int, session: Session) -> Optional[Product]:
         """Busca product por ID"""
         from sqlalchemy.orm import selectinload
@@ -27,6 +47,33 @@ class ProductRepositoryImpl(IProductRepository):
             selectinload(Product.imagens)
         ).filter(Product.id_produto == product_id).first()
 
+    def get_by_id_with_kit(self, product_id: int, session: Session, kit_limit: int = 100) -> Tuple[Optional[Product], List[Product]]:
+        """
+        Busca o produto e, se ele for base de kit (cod_kit nulo), os itens do kit
+        (cod_kit == codigo do produto). Categoria e subcategoria vêm por JOIN; as imagens
+        num SELECT ... IN por consulta.
+        """
+        from sqlalchemy.orm import joinedload, selectinload
+
+        kit_limit = max(1, min(kit_limit, 1000))
+        load_options = (
+            joinedload(Product.categoria),
+            joinedload(Product.subcategoria),
+            selectinload(Product.imagens)
+        )
+
+        product = session.query(Product).options(*load_options).filter(Product.id_produto == product_id).first()
+        if not product or product.cod_kit is not None or not product.codigo:
+            return product, []
+
+        # codigo vai como parâmetro: no banco cod_kit é integer e codigo varchar, e uma comparação
+        # coluna x coluna (subquery) falha com "operator does not exist: integer = character varying"
+        kit_products = session.query(Product).options(*load_options).filter(
+            Product.cod_kit == str(product.codigo),
+            Product.id_produto != product_id
+        ).order_by(Product.id_produto).limit(kit_limit).all()
+        return product, kit_products
+
     def get_all(self, session: Session, skip: int = 0, limit: int = 100) -> List[Product]:
         """Lista todos os products"""
         return session.query(Product).offset(skip).limit(limit).all()
@@ -37,6 +84,41 @@ class ProductRepositoryImpl(IProductRepository):
         session.flush()
         return product
 
+    def update_many(self, products: List[Product], session: Session) -> List[Product]:
+        """Atualiza products em lote: as instâncias já estão na sessão, um único flush envia os UPDATEs agrupados"""
+        if products:
+            session.add_all(products)
+            session.flush()
+        return products
+
+    def upsert_many(self, rows: List[Dict[str, Any]], session: Session) -> Dict[str, int]:
+        """
+        Insere ou atualiza products por código com INSERT ... ON CONFLICT (codigo) DO UPDATE RETURNING.
+        Cada linha deve ter todas as colunas obrigatórias; códigos não podem se repetir no lote.
+        Retorna o id_produto de cada código gravado (codigo -> id_produto).
+        """
+        from sqlalchemy import func
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        ids_by_codigo: Dict[str, int] = {}
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = pg_insert(Product).values(rows[start:start + UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Product.codigo],
+                set_={
+                    'nome': stmt.excluded.nome,
+                    'descricao': stmt.excluded.descricao,
+                    'valor_base': stmt.excluded.valor_base,
+                    'quantidade': stmt.excluded.quantidade,
+                    'cod_kit': stmt.excluded.cod_kit,
+                    'id_categoria': stmt.excluded.id_categoria,
+                    'id_subcategoria': stmt.excluded.id_subcategoria,
+                    'updated_at': func.now(),
+                }
+            ).returning(Product.id_produto, Product.codigo)
+            ids_by_codigo.update((codigo, id_produto) for id_produto, codigo in session.execute(stmt))
+        return ids_by_codigo
+
     def delete(self, product_id: int, session: Session) -> bool:
         """Deleta um product"""
         product = self.get_by_id(product_id, session)
@@ -52,6 +134,26 @@ class ProductRepositoryImpl(IProductRepository):
         codigo_str = str(codigo) if codigo is not None else None
         return session.query(Product).filter(Product.codigo == codigo_str).first()
 
+    def get_by_codigos(self, codigos: List[str], session: Session) -> List[Product]:
+        """Busca produtos por lista de códigos (em lote, em blocos de IN_CLAUSE_BATCH_SIZE)"""
+        codigos_str = list(dict.fromkeys(str(c) for c in codigos if c is not None))
+        products: List[Product] = []
+        for start in range(0, len(codigos_str), IN_CLAUSE_BATCH_SIZE):
+            batch = codigos_str[start:start + IN_CLAUSE_BATCH_SIZE]
+            products.extend(session.query(Product).filter(Product.codigo.in_(batch)).all())
+        return products
+
+    def get_existing_codigos(self, codigos: Iterable[str], session: Session) -> Set[str]:
+        """Retorna os códigos existentes (só a coluna codigo, em blocos de IN_CLAUSE_BATCH_SIZE)"""
+        codigos_str = list(dict.fromkeys(str(c) for c in codigos if c is not None))
+        existing: Set[str] = set()
+        for start in range(0, len(codigos_str), IN_CLAUSE_BATCH_SIZE):
+            batch = codigos_str[start:start + IN_CLAUSE_BATCH_SIZE]
+            existing.update(
+                str(codigo) for (codigo,) in session.query(Product.codigo).filter(Product.codigo.in_(batch)).all()
+            )
+        return existing
+
     def get_by_categoria(self, categoria_id: int, session: Session, skip: int = 0, limit: int = 100) -> List[Product]:
         """Busca products por categoria"""
         from sqlalchemy.orm import selectinload
@@ -79,10 +181,9 @@ class ProductRepositoryImpl(IProductRepository):
             selectinload(Product.imagens)
         ).filter(Product.ativo == True).offset(skip).limit(limit).all()
 
-    def search_by_name(self, name: str, session: Session, exclude_kits: bool = False, skip: int = 0, limit: int = 100) -> List[Product]:
+    def search_by_name(self, name: str, session: Session, exclude_kits: bool = False, skip: int = 0, limit: int = 100, load_relations: bool = True) -> List[Product]:
         """Busca products por nome"""
         from sqlalchemy import exists, or_, not_
-        from sqlalchemy.orm import selectinload
         
         # Validação de entrada
         if not name or not name.strip():
@@ -92,11 +193,10 @@ class ProductRepositoryImpl(IProductRepository):
         skip = max(0, skip)
         limit = max(1, min(limit, 1000))  # Limite máximo de 1000
         
-        query = session.query(Product).options(
-            selectinload(Product.categoria),
-            selectinload(Product.subcategoria),
-            selectinload(Product.imagens)
-        ).filter(Product.nome.ilike(f"%{name.strip()}%"))
+        query = session.query(Product)
+        if load_relations:
+            query = query.options(*PRODUCT_RELATION_LOADS)
+        query = query.filter(Product.nome.ilike(f"%{name.strip()}%"))
         
         # Otimização: Filtragem de kits no SQL ao invés de Python
         if exclude_kits:
@@ -116,19 +216,16 @@ class ProductRepositoryImpl(IProductRepository):
         
         return query.offset(skip).limit(limit).all()
 
-    def get_by_price_range(self, min_price: Decimal, max_price: Decimal, session: Session, skip: int = 0, limit: int = 100) -> List[Product]:
+    def get_by_price_range(self, min_price: Decimal, max_price: Decimal, session: Session, skip: int = 0, limit: int = 100, load_relations: bool = True) -> List[Product]:
         """Busca products por faixa de preço"""
-        from sqlalchemy.orm import selectinload
-        
         # Validação de paginação
         skip = max(0, skip)
         limit = max(1, min(limit, 1000))
         
-        return session.query(Product).options(
-            selectinload(Product.categoria),
-            selectinload(Product.subcategoria),
-            selectinload(Product.imagens)
-        ).filter(
+        query = session.query(Product)
+        if load_relations:
+            query = query.options(*PRODUCT_RELATION_LOADS)
+        return query.filter(
             Product.valor_base.between(min_price, max_price)
         ).offset(skip).limit(limit).all()
 
@@ -204,18 +301,16 @@ class ProductRepositoryImpl(IProductRepository):
         order_by_price: Optional[str] = None,
         skip: int = 0,
         limit: Optional[int] = None,
-        exclude_kits: bool = False
+        exclude_kits: bool = False,
+        load_relations: bool = True
     ) -> List[Product]:
         """Busca produtos com filtros e ordenação. Se limit=None, retorna todos os registros"""
         from sqlalchemy import asc, desc, exists
-        from sqlalchemy.orm import selectinload
         
         # Eager loading para evitar N+1 (categoria/subcategoria/imagens)
-        query = session.query(Product).options(
-            selectinload(Product.categoria),
-            selectinload(Product.subcategoria),
-            selectinload(Product.imagens),
-        )
+        query = session.query(Product)
+        if load_relations:
+            query = query.options(*PRODUCT_RELATION_LOADS)
         
         # Aplica filtros
         if active_only:
@@ -245,7 +340,7 @@ class ProductRepositoryImpl(IProductRepository):
         # Otimização: Filtragem de kits no SQL ao invés de Python
         if exclude_kits:
             # Filtra: produtos sem cod_kit OU produtos com cod_kit mas sem produto pai
-            from sqlalchemy import exists, or_, not_, alias, cast, String
+            from sqlalchemy import or_, not_, alias, cast, String
             # Subquery verifica se existe produto com codigo igual ao cod_kit do produto atual
             # Cast cod_kit para String para garantir compatibilidade de tipos (codigo é varchar, cod_kit pode ser integer no DB)
             ProductParent = alias(Product.__table__)
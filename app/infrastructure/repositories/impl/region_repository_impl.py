@@ -10,11 +10,20 @@ from app.infrastructure.repositories.region_repository_interface import IRegionR
 class RegionRepositoryImpl(IRegionRepository):
     """Repository para operações de Region com CRUD completo"""
 
-    def create(self, region: Regions, session: Session) -> Regions:
-        """Cria uma nova region"""
-        session.add(region)
-        session.flush()
-        return region
+    def create(self, region: Regions, session: Session) -> Optional[Regions]:
+        """
+        Cria uma nova region com INSERT ... ON CONFLICT (estado) DO NOTHING RETURNING.
+        Retorna None se já existir region para o estado (verificação e inserção atômicas).
+        """
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        stmt = pg_insert(Regions).values(
+            estado=region.estado,
+            desconto_0=region.desconto_0,
+            desconto_30=region.desconto_30,
+            desconto_60=region.desconto_60
+        ).on_conflict_do_nothing(index_elements=[Regions.estado]).returning(Regions)
+        return session.scalars(stmt).first()
 
     def get_by_id(self, region_id: int, session: Session) -> Optional[Regions]:
         """Busca region por ID"""
@@ -46,4 +55,3 @@ class RegionRepositoryImpl(IRegionRepository):
     def exists_by_estado(self, estado: str, session: Session) -> bool:
         """Verifica se region existe por estado"""
         return session.query(Regions).filter(Regions.estado == estado).first() is not None
-
@@ -17,6 +17,24 @@ class SubcategoryRepositoryImpl(ISubcategoryRepository):
         session.flush()
         return subcategory
 
+    def create_if_absent(self, nome: str, id_categoria: int, session: Session) -> Optional[Subcategory]:
+        """
+        Cria a subcategory com INSERT ... SELECT ... ON CONFLICT (id_categoria, nome) DO NOTHING RETURNING,
+        condicionado à existência da categoria (verificação e inserção atômicas).
+        Retorna None quando a categoria não existe ou a subcategory já existe.
+        """
+        from sqlalchemy import select, literal
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        from app.domain.models.category_model import Category
+
+        source = select(literal(nome), Category.id_categoria).where(Category.id_categoria == id_categoria)
+        stmt = pg_insert(Subcategory).from_select(
+            [Subcategory.nome, Subcategory.id_categoria], source
+        ).on_conflict_do_nothing(
+            index_elements=[Subcategory.id_categoria, Subcategory.nome]
+        ).returning(Subcategory)
+        return session.scalars(stmt).first()
+
     def get_by_id(self, subcategory_id: int, session: Session) -> Optional[Subcategory]:
         """Busca subcategory por ID"""
         return session.query(Subcategory).filter(Subcategory.id_subcategoria == subcategory_id).first()
@@ -32,18 +50,28 @@ class SubcategoryRepositoryImpl(ISubcategoryRepository):
         return subcategory
 
     def delete(self, subcategory_id: int, session: Session) -> bool:
-        """Deleta uma subcategory"""
-        subcategory = self.get_by_id(subcategory_id, session)
-        if subcategory:
-            session.delete(subcategory)
-            session.flush()
-            return True
-        return False
+        """Deleta uma subcategory (produtos vinculados ficam sem subcategoria)"""
+        from sqlalchemy import delete, update
+        from app.domain.models.product_model import Product
+
+        session.execute(
+            update(Product).where(Product.id_subcategoria == subcategory_id).values(id_subcategoria=None)
+        )
+        deleted = session.execute(
+            delete(Subcategory).where(Subcategory.id_subcategoria == subcategory_id).returning(Subcategory.id_subcategoria)
+        ).first()
+        return deleted is not None
 
     def get_by_name(self, name: str, session: Session) -> Optional[Subcategory]:
         """Busca subcategory por nome exato"""
         return session.query(Subcategory).filter(Subcategory.nome == name).first()
 
+    def get_by_names(self, names: List[str], session: Session) -> List[Subcategory]:
+        """Busca subcategorys por lista de nomes exatos (em lote)"""
+        if not names:
+            return []
+        return session.query(Subcategory).filter(Subcategory.nome.in_(names)).all()
+
     def get_by_categoria(self, categoria_id: int, session: Session, skip: int = 0, limit: int = 100) -> List[Subcategory]:
         """Busca subcategorys por categoria"""
         # Validação de paginação
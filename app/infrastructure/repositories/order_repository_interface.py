@@ -1,7 +1,7 @@
 """Interface do repository para Order"""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from datetime import datetime
 
 from app.domain.models.order_model import Order
@@ -16,7 +16,7 @@ class IOrderRepository(ABC):
         pass
 
     @abstractmethod
-    def create_order_with_items(self, order: Order, session: Session) -> Order:
+    def create_order_with_items(self, order: Order, item_rows: List[Dict[str, Any]], session: Session) -> Order:
         pass
 
     @abstractmethod
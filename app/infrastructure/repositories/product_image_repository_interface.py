@@ -35,6 +35,10 @@ class IProductImageRepository(ABC):
         """Busca todas as imagens de um produto"""
         pass
 
+    @abstractmethod
+    def delete_from_produto(self, image_id: int, produto_id: int, session: Session) -> Optional[str]:
+        pass
+
     @abstractmethod
     def delete_by_produto(self, produto_id: int, session: Session) -> bool:
         """Deleta todas as imagens de um produto"""
@@ -1,7 +1,7 @@
 """Interface do repository para Product"""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Tuple, Set, Iterable
 from decimal import Decimal
 
 from app.domain.models.product_model import Product
@@ -15,6 +15,11 @@ class IProductRepository(ABC):
     def create(self, product: Product, session: Session) -> Product:
         pass
 
+    @abstractmethod
+    def create_many(self, products: List[Product], session: Session) -> List[Product]:
+        """Cria produtos em lote (um único flush)"""
+        pass
+
     @abstractmethod
     def get_by_id(self, product_id: int, session: Session) -> Optional[Product]:
         pass
@@ -27,6 +32,16 @@ class IProductRepository(ABC):
     def update(self, product: Product, session: Session) -> Product:
         pass
 
+    @abstractmethod
+    def update_many(self, products: List[Product], session: Session) -> List[Product]:
+        """Atualiza produtos em lote (um único flush)"""
+        pass
+
+    @abstractmethod
+    def upsert_many(self, rows: List[Dict[str, Any]], session: Session) -> Dict[str, int]:
+        """Insere ou atualiza produtos por código (em lote); retorna codigo -> id_produto"""
+        pass
+
     @abstractmethod
     def delete(self, product_id: int, session: Session) -> bool:
         pass
@@ -35,6 +50,16 @@ class IProductRepository(ABC):
     def get_by_codigo(self, codigo: str, session: Session) -> Optional[Product]:
         pass
 
+    @abstractmethod
+    def get_by_codigos(self, codigos: List[str], session: Session) -> List[Product]:
+        """Busca produtos por lista de códigos (em lote)"""
+        pass
+
+    @abstractmethod
+    def get_existing_codigos(self, codigos: Iterable[str], session: Session) -> Set[str]:
+        """Retorna o subconjunto de códigos que existem na base (em lote)"""
+        pass
+
     @abstractmethod
     def get_by_categoria(self, categoria_id: int, session: Session, skip: int = 0, limit: int = 100) -> List[Product]:
         pass
@@ -48,11 +73,11 @@ class IProductRepository(ABC):
         pass
 
     @abstractmethod
-    def search_by_name(self, name: str, session: Session, exclude_kits: bool = False, skip: int = 0, limit: int = 100) -> List[Product]:
+    def search_by_name(self, name: str, session: Session, exclude_kits: bool = False, skip: int = 0, limit: int = 100, load_relations: bool = True) -> List[Product]:
         pass
 
     @abstractmethod
-    def get_by_price_range(self, min_price: Decimal, max_price: Decimal, session: Session, skip: int = 0, limit: int = 100) -> List[Product]:
+    def get_by_price_range(self, min_price: Decimal, max_price: Decimal, session: Session, skip: int = 0, limit: int = 100, load_relations: bool = True) -> List[Product]:
         pass
 
     @abstractmethod
@@ -65,9 +90,18 @@ class IProductRepository(ABC):
         order_by_price: Optional[str] = None,
         skip: int = 0,
         limit: Optional[int] = None,
-        exclude_kits: bool = False
+        exclude_kits: bool = False,
+        load_relations: bool = True
     ) -> List[Product]:
-        """Busca produtos com filtros e ordenação. Se limit=None, retorna todos os registros"""
+        """
+        Busca produtos com filtros e ordenação. Se limit=None, retorna todos os registros.
+        load_relations carrega categoria/subcategoria/imagens via selectinload
+        """
+        pass
+
+    @abstractmethod
+    def get_by_id_with_kit(self, product_id: int, session: Session, kit_limit: int = 100) -> Tuple[Optional[Product], List[Product]]:
+        """Busca o produto e, se for base de kit, seus itens de kit (cod_kit == codigo, por parâmetro)"""
         pass
 
     @abstractmethod
@@ -11,7 +11,7 @@ class IRegionRepository(ABC):
     """Interface para operações de Region"""
 
     @abstractmethod
-    def create(self, region: Regions, session: Session) -> Regions:
+    def create(self, region: Regions, session: Session) -> Optional[Regions]:
         pass
 
     @abstractmethod
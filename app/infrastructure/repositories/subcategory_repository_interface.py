@@ -30,10 +30,19 @@ class ISubcategoryRepository(ABC):
     def delete(self, subcategoria_id: int, session: Session) -> bool:
         pass
 
+    @abstractmethod
+    def create_if_absent(self, nome: str, id_categoria: int, session: Session) -> Optional[Subcategory]:
+        pass
+
     @abstractmethod
     def get_by_name(self, name: str, session: Session) -> Optional[Subcategory]:
         pass
 
+    @abstractmethod
+    def get_by_names(self, names: List[str], session: Session) -> List[Subcategory]:
+        """Busca subcategorys por lista de nomes exatos (em lote)"""
+        pass
+
     @abstractmethod
     def get_by_categoria(self, categoria_id: int, session: Session, skip: int = 0, limit: int = 100) -> List[Subcategory]:
         pass
@@ -0,0 +1,41 @@
+import hashlib
+import json
+from typing import Any
+
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+
+# Categorias mudam raramente: clientes e proxies podem reaproveitar a resposta por 5 minutos
+PUBLIC_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=60"
+# Respostas autenticadas não ficam em caches compartilhados e são sempre revalidadas (304 via ETag)
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Compara o ETag com o cabeçalho If-None-Match (lista separada por vírgula, aceita W/ e *)"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def cached_json_response(request: Request, content: Any, cache_control: str = PUBLIC_CACHE_CONTROL) -> Response:
+    """
+    Serializa o conteúdo em JSON com ETag (hash do corpo) e Cache-Control.
+    Retorna 304 sem corpo quando o cliente já possui a mesma versão.
+    """
+    body = json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,64 @@
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import orjson
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+
+# OPT_UTC_Z: datetimes em UTC saem como "...Z", igual à serialização do Pydantic nos response_model
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def _default(value: Any) -> Any:
+    """Tipos que o orjson não serializa nativamente (Decimal sai como string, igual ao Pydantic)"""
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Tipo não serializável em JSON: {type(value).__name__}")
+
+
+class FastJSONResponse(ORJSONResponse):
+    """
+    Resposta JSON serializada direto pelo orjson, sem passar por response_model/jsonable_encoder.
+    Para listas grandes já montadas como dicts (datetime, date, Enum e Decimal suportados).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+def _iter_json_array(items: Iterable[Any]) -> Iterator[bytes]:
+    """Serializa os itens um a um como um array JSON (b'[', item, b',', item, ..., b']')"""
+    yield b"["
+    separator = b""
+    for item in items:
+        yield separator + orjson.dumps(item, default=_default, option=_ORJSON_OPTIONS)
+        separator = b","
+    yield b"]"
+
+
+def _collecting(chunks: Iterator[bytes], on_complete: Callable[[bytes], None]) -> Iterator[bytes]:
+    """Repassa os blocos e, se o corpo for gerado por inteiro, entrega-o montado a on_complete"""
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    on_complete(b"".join(parts))
+
+
+class StreamingJSONArrayResponse(StreamingResponse):
+    """
+    Array JSON enviado em streaming: cada item é serializado pelo orjson assim que é gerado.
+    O iterável é consumido depois que a sessão já foi fechada, então não pode depender de lazy load.
+    on_complete (opcional) recebe o corpo completo ao final, por exemplo para guardá-lo em cache.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Any],
+        on_complete: Optional[Callable[[bytes], None]] = None,
+        **kwargs: Any
+    ) -> None:
+        chunks = _iter_json_array(items)
+        if on_complete is not None:
+            chunks = _collecting(chunks, on_complete)
+        super().__init__(chunks, media_type="application/json", **kwargs)
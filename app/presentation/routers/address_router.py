@@ -6,7 +6,7 @@ from typing import List, Optional
 from app.infrastructure.configs.database_config import Session
 from app.infrastructure.configs.session_config import get_session
 # Repositories
-from app.infrastructure.repositories.impl.address_repository_impl import AddressRepositoryImpl
+from app.infrastructure.configs.repository_config import address_repository
 
 address_router = APIRouter(
     prefix="/enderecos",
@@ -37,7 +37,7 @@ async def list_enderecos(
 ) -> List[dict]:
     """Lista endereços com filtros opcionais"""
     try:
-        address_repo = AddressRepositoryImpl()
+        address_repo = address_repository
         
         if empresa_id:
             enderecos = address_repo.get_by_company(empresa_id, session)
@@ -89,7 +89,7 @@ async def get_endereco(
 ) -> dict:
     """Busca endereço por ID"""
     try:
-        address_repo = AddressRepositoryImpl()
+        address_repo = address_repository
         endereco = address_repo.get_by_id(endereco_id, session)
         
         if not endereco:
@@ -125,7 +125,7 @@ async def list_enderecos_by_empresa(
 ) -> List[dict]:
     """Lista endereços de uma empresa"""
     try:
-        address_repo = AddressRepositoryImpl()
+        address_repo = address_repository
         enderecos = address_repo.get_by_company(empresa_id, session)
         
         return [
@@ -159,7 +159,7 @@ async def get_endereco_principal(
 ) -> dict:
     """Busca endereço principal da empresa"""
     try:
-        address_repo = AddressRepositoryImpl()
+        address_repo = address_repository
         endereco = address_repo.get_primary_address(empresa_id, session)
         
         if not endereco:
@@ -195,7 +195,7 @@ async def list_enderecos_by_cep(
 ) -> List[dict]:
     """Lista endereços por CEP"""
     try:
-        address_repo = AddressRepositoryImpl()
+        address_repo = address_repository
         enderecos = address_repo.get_by_cep(cep, session)
         
         return [
@@ -229,7 +229,7 @@ async def list_enderecos_by_cidade(
 ) -> List[dict]:
     """Lista endereços por cidade"""
     try:
-        address_repo = AddressRepositoryImpl()
+        address_repo = address_repository
         enderecos = address_repo.get_by_city(cidade, session)
         
         return [
@@ -263,7 +263,7 @@ async def list_enderecos_by_estado(
 ) -> List[dict]:
     """Lista endereços por estado"""
     try:
-        address_repo = AddressRepositoryImpl()
+        address_repo = address_repository
         enderecos = address_repo.get_by_state(uf.upper(), session)
         
         return [
@@ -1,6 +1,6 @@
 """Router para operações de Categorias"""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request
 from typing import List, Optional
 from loguru import logger
 
@@ -18,6 +18,9 @@ from app.application.usecases.impl.delete_subcategory_use_case import DeleteSubc
 from app.presentation.routers.request.category_request import CategoryRequest, SubcategoryRequest
 from app.presentation.routers.response.category_response import CategoryResponse, SubcategoryResponse
 
+# Cache HTTP
+from app.infrastructure.utils.http_cache import cached_json_response, PRIVATE_CACHE_CONTROL
+
 # Exceptions
 from app.domain.exceptions.category_exceptions import (
     CategoryNotFoundException,
@@ -74,6 +77,7 @@ async def create_category(
     description="Lista todas as categorias com suas subcategorias"
 )
 async def list_categories(
+    request: Request,
     skip: int = Query(0, ge=0, description="Número de registros para pular"),
     limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros"),
     search_name: Optional[str] = Query(None, description="Buscar por nome"),
@@ -88,7 +92,8 @@ async def list_categories(
             "limit": limit,
             "search_name": search_name
         }
-        return use_case.execute(request_data, session=session)
+        # ETag + Cache-Control: repetições dentro do max-age nem chegam à API; depois disso, 304 sem corpo
+        return cached_json_response(request, use_case.execute(request_data, session=session))
     except HTTPException:
         raise
     except Exception as e:
@@ -105,6 +110,7 @@ async def list_categories(
     description="Busca uma categoria específica pelo ID"
 )
 async def get_category(
+    request: Request,
     category_id: int = Path(..., description="ID da categoria"),
     session: Session = Depends(get_session),
     current_user = Depends(verify_user_permission(role=RoleEnum.ADMIN))
@@ -113,7 +119,10 @@ async def get_category(
     try:
         logger.info(f'=== Getting category: {category_id} ===')
         use_case: GetCategoryUseCase = GetCategoryUseCase()
-        return use_case.execute(category_id, session=session)
+        # Rota autenticada: sem cache compartilhado, mas revalidação via ETag
+        return cached_json_response(
+            request, use_case.execute(category_id, session=session), cache_control=PRIVATE_CACHE_CONTROL
+        )
     except CategoryNotFoundException as e:
         raise HTTPException(status_code=404, detail=e.message)
     except HTTPException:
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from typing import List, Optional
 from loguru import logger
@@ -44,7 +45,8 @@ async def create_company(
     try:
         logger.info('=== Criando empresa ===')
         use_case: CreateCompanyUseCase = CreateCompanyUseCase()
-        return use_case.execute(request, session=session)
+        # Hash bcrypt (senha e CNPJ) e envio do email são bloqueantes: roda fora do event loop
+        return await run_in_threadpool(use_case.execute, request, session=session)
     except CompanyAlreadyExistsException as e:
         raise HTTPException(status_code=422, detail=e.message)
 
@@ -15,6 +15,7 @@ from app.application.usecases.impl.delete_coupon_use_case import DeleteCouponUse
 # Request/Response Models
 from app.presentation.routers.request.coupon_request import CouponRequest, UpdateCouponRequest
 from app.presentation.routers.response.coupon_response import CouponResponse, ValidateCouponResponse
+from app.infrastructure.utils.json_response import FastJSONResponse
 
 # Configs
 from app.infrastructure.configs.database_config import Session
@@ -80,7 +81,8 @@ async def list_coupons(
             'active_only': active_only,
             'search_codigo': search_codigo
         }
-        return use_case.execute(request_dict, session)
+        # Dicts no formato de CouponResponse: serializa direto com orjson
+        return FastJSONResponse(use_case.execute(request_dict, session))
     except HTTPException:
         raise
     except Exception as e:
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 
 from app.application.usecases.impl.valid_token_use_case import ValidTokenUseCase
@@ -26,8 +27,13 @@ async def validate_token_router(
 @email_token_router.patch("/resend")
 async def resend_token_router(
     request: ResendTokenRequest,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session)
 ):
     use_case = ResendTokenUseCase()
-    response = use_case.execute(request, session=session)
+    # Geração do token e acesso ao banco são bloqueantes: roda fora do event loop.
+    # O envio SMTP fica para depois da resposta (background task)
+    response = await run_in_threadpool(
+        use_case.execute, request, session=session, background_tasks=background_tasks
+    )
     return JSONResponse(content=response, status_code=200)
\ No newline at end of file
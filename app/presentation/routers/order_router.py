@@ -1,6 +1,7 @@
 """Router para operações de Orders - Refatorado com Clean Architecture e SOLID"""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Path
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from typing import Any, Dict, List
 from loguru import logger
@@ -23,6 +24,7 @@ from app.presentation.routers.request.order_request import (
     SendOrderEmailRequest
 )
 from app.presentation.routers.response.order_response import OrderResponse
+from app.infrastructure.utils.json_response import FastJSONResponse
 from app.domain.models.enumerations.order_status_enumerations import OrderStatusEnum
 from app.domain.models.enumerations.role_enumerations import RoleEnum
 
@@ -77,7 +79,8 @@ async def list_orders(
         use_case: ListOrdersUseCase = ListOrdersUseCase()
         orders_data = use_case.execute(request.model_dump(), session)
         orders_data = _enrich_orders_with_items(orders_data, session)
-        return [OrderResponse(**order) for order in orders_data]
+        # Dicts já no formato de OrderResponse: serializa direto com orjson
+        return FastJSONResponse(orders_data)
     except HTTPException:
         raise
     except Exception as e:
@@ -111,7 +114,8 @@ async def list_orders_recentes(
         orders_data = use_case.execute(request.model_dump(), session)
         orders_data = [o for o in orders_data if o.get("id_cliente") == current_user.id]
         orders_data = _enrich_orders_with_items(orders_data, session)
-        return [OrderResponse(**order) for order in orders_data]
+        # Dicts já no formato de OrderResponse: serializa direto com orjson
+        return FastJSONResponse(orders_data)
     except HTTPException:
         raise
     except Exception as e:
@@ -144,7 +148,8 @@ async def list_orders_by_cliente(
         request = ListOrdersByClienteRequest(cliente_id=current_user.id)
         orders_data = list_use_case.execute(request.model_dump(), session)
         orders_data = _enrich_orders_with_items(orders_data, session)
-        return [OrderResponse(**order) for order in orders_data]
+        # Dicts já no formato de OrderResponse: serializa direto com orjson
+        return FastJSONResponse(orders_data)
     except HTTPException:
         raise
     except Exception as e:
@@ -170,16 +175,16 @@ async def list_orders_by_status(
     - Dependency Inversion: Depende de abstrações (use case) não de implementações
     """
     try:
-        try:
-            status_enum = OrderStatusEnum(status)
-        except ValueError:
+        status_enum = OrderStatusEnum._value2member_map_.get(status)
+        if status_enum is None:
             raise HTTPException(status_code=422, detail="Status inválido")
         use_case: ListOrdersUseCase = ListOrdersUseCase()
         request_dict = {"cliente_id": current_user.id}
         orders_data = use_case.execute(request_dict, session)
         orders_data = [o for o in orders_data if o.get("status") == status_enum.value]
         orders_data = _enrich_orders_with_items(orders_data, session)
-        return [OrderResponse(**order) for order in orders_data]
+        # Dicts já no formato de OrderResponse: serializa direto com orjson
+        return FastJSONResponse(orders_data)
     except HTTPException:
         raise
     except Exception as e:
@@ -194,6 +199,7 @@ async def list_orders_by_status(
 )
 async def send_order_email(
     request: SendOrderEmailRequest,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
     current_user = Depends(verify_user_permission())
 ):
@@ -238,7 +244,11 @@ async def send_order_email(
             ]
         )
         
-        result = use_case.execute(use_case_request, session)
+        # Acesso ao banco é bloqueante: roda fora do event loop.
+        # O envio SMTP fica para depois da resposta (background task)
+        result = await run_in_threadpool(
+            use_case.execute, use_case_request, session, background_tasks=background_tasks
+        )
         
         return JSONResponse(
             status_code=200,
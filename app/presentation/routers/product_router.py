@@ -4,7 +4,7 @@ import tempfile
 import os
 import threading
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, status, Query, Path, Body, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from typing import Any, List, Optional
 from loguru import logger
 
@@ -21,6 +21,7 @@ from app.application.usecases.impl.delete_product_images_use_case import DeleteP
 
 # Services
 from app.application.service.job_service import JobService, JobStatus
+from app.application.service.product_list_cache_service import ProductListCacheService
 
 
 # Services
@@ -38,6 +39,7 @@ from app.presentation.routers.request.product_request import UpdateProductReques
 from app.presentation.routers.request.product_image_request import DeleteProductImagesRequest
 from app.presentation.routers.response.product_response import ProductResponse
 from app.presentation.routers.response.cart_prices_response import CartPricesResponse
+from app.infrastructure.utils.json_response import StreamingJSONArrayResponse
 from app.presentation.routers.response.product_image_response import (
     ProductImageResponse,
     DeleteProductImagesResponse,
@@ -177,8 +179,22 @@ async def list_products(
             'skip': skip,
             'limit': limit
         }
+        # Mesmos filtros dentro do TTL: devolve o JSON já serializado, sem consultar o banco
+        list_cache = ProductListCacheService()
+        cache_key = list_cache.key(request_data)
+        cached_body = list_cache.get(cache_key)
+        if cached_body is not None:
+            return Response(content=cached_body, media_type="application/json")
+
+        # Geração lida antes da consulta: se houver commit de escrita no meio, o corpo não é guardado
+        cache_generation = list_cache.generation()
         products_data = use_case.execute(request_data, session)
-        return [ProductResponse(**product) for product in products_data]
+        # Dicts já no formato de ProductResponse (aliases 30_dias/60_dias), gerados um a um
+        # e serializados com orjson em streaming; o corpo completo vai para o cache ao final
+        return StreamingJSONArrayResponse(
+            products_data,
+            on_complete=lambda body: list_cache.store(cache_key, body, cache_generation)
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -191,7 +207,7 @@ async def list_products(
     description="Busca um produto específico pelo ID com preços calculados por estado",
     response_model=ProductResponse
 )
-async def get_product(
+def get_product(
     product_id: int = Path(..., description="ID do produto"),
     estado: str = Query(..., description="Estado para cálculo de descontos (ex: SP, MG, ES)"),
     session: Session = Depends(get_session)
@@ -314,13 +330,15 @@ async def add_product_images(
 async def delete_product_images(
     product_id: int = Path(..., description="ID do produto"),
     body: DeleteProductImagesRequest = Body(...),
+    background_tasks: BackgroundTasks = BackgroundTasks(),
     session: Session = Depends(get_session),
     current_user=Depends(verify_user_permission(role=RoleEnum.ADMIN))
 ) -> Any:
     """Remove uma ou mais imagens do produto."""
     try:
+        # Arquivos do storage são removidos em background, depois do commit da sessão
         result = DeleteProductImagesUseCase().execute(
-            {"product_id": product_id, "image_ids": body.image_ids},
+            {"product_id": product_id, "image_ids": body.image_ids, "background_tasks": background_tasks},
             session
         )
         return result
@@ -2,11 +2,13 @@
 
 from datetime import datetime
 from typing import List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class SubcategoryResponse(BaseModel):
     """Response model for subcategory"""
+    model_config = ConfigDict(from_attributes=True)
+
     id_subcategoria: int
     nome: str
     id_categoria: int
@@ -16,6 +18,8 @@ class SubcategoryResponse(BaseModel):
 
 class CategoryResponse(BaseModel):
     """Response model for category"""
+    model_config = ConfigDict(from_attributes=True)
+
     id_categoria: int
     nome: str
     created_at: datetime
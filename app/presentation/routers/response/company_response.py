@@ -1,12 +1,15 @@
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
+from app.domain.models.enumerations.role_enumerations import RoleEnum
 from app.infrastructure.configs.base_response import BaseResponseModel
 
 
 class AddressResponse(BaseModel):
     """DTO para resposta de endereço"""
+    model_config = ConfigDict(from_attributes=True)
+
     id_endereco: int
     cep: str
     numero: str
@@ -19,6 +22,8 @@ class AddressResponse(BaseModel):
 
 class ContactResponse(BaseModel):
     """DTO para resposta de contato"""
+    model_config = ConfigDict(from_attributes=True)
+
     id_contato: int
     nome: str
     telefone: Optional[str] = None
@@ -32,7 +37,7 @@ class CompanyResponse(BaseResponseModel):
     cnpj: str
     razao_social: str
     nome_fantasia: str
-    perfil: str
+    perfil: RoleEnum  # use_enum_values: serializado como o valor ("admin"/"cliente")
     ativo: bool
     created_at: datetime
     updated_at: datetime
@@ -38,6 +38,9 @@ SQLALCHEMY_POOL_PRE_PING = _get_bool("SQLALCHEMY_POOL_PRE_PING", True)
 
 SQLALCHEMY_SHOW_SQL = _get_bool("SQLALCHEMY_SHOW_SQL", False)
 
+# Cache de SQL compilado do SQLAlchemy (entradas por engine; o padrão da lib é 500)
+SQLALCHEMY_QUERY_CACHE_SIZE = _get_int("SQLALCHEMY_QUERY_CACHE_SIZE", 1200)
+
 # ============================================================================
 # JWT
 # ============================================================================
@@ -55,6 +58,10 @@ MAIL_FROM = os.getenv("MAIL_FROM", "")
 MAIL_PORT = _get_int("MAIL_PORT", 587)
 MAIL_SERVER = os.getenv("MAIL_SERVER", "")
 
+# Pool de conexões SMTP (fallback): conexões simultâneas e envios por conexão antes de reabrir
+MAIL_SMTP_POOL_SIZE = _get_int("MAIL_SMTP_POOL_SIZE", 5)
+MAIL_SMTP_MAX_MESSAGES_PER_CONNECTION = _get_int("MAIL_SMTP_MAX_MESSAGES_PER_CONNECTION", 100)
+
 # ============================================================================
 # MINIO — STORAGE S3-COMPATÍVEL
 # ============================================================================
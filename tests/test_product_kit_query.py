@@ -0,0 +1,82 @@
+"""
+Consulta de kits (ProductRepositoryImpl.get_by_id_with_kit) contra o schema real,
+onde produtos.cod_kit é integer e produtos.codigo é varchar (ver database_backup.sql).
+
+Requer PostgreSQL: defina TEST_DATABASE_URL. As tabelas são criadas num schema
+temporário, removido ao final.
+"""
+import importlib
+import os
+import uuid
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL (PostgreSQL) não configurado")
+
+# envs.py exige a URI do banco no import dos módulos da aplicação
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", TEST_DATABASE_URL or "postgresql://localhost/unused")
+
+
+@pytest.fixture
+def session():
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import Session
+
+    # Registra no Base.metadata os mesmos modelos que a aplicação carrega (via repositórios)
+    importlib.import_module("app.infrastructure.configs.repository_config")
+    from app.infrastructure.configs.base_mixin import Base
+
+    schema = f"test_kit_{uuid.uuid4().hex[:8]}"
+    engine = create_engine(TEST_DATABASE_URL).execution_options(schema_translate_map={None: schema})
+    with engine.begin() as conn:
+        conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+        # idx_categoria_nome_lower_trgm (category_model) usa gin_trgm_ops, como na migration 3f9a1c7d2b64
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        Base.metadata.create_all(conn)
+        # Reproduz o tipo da coluna em produção
+        conn.execute(text(f'ALTER TABLE "{schema}".produtos ALTER COLUMN cod_kit TYPE integer USING cod_kit::integer'))
+
+    db_session = Session(bind=engine)
+    try:
+        yield db_session
+    finally:
+        db_session.close()
+        with engine.begin() as conn:
+            conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        engine.dispose()
+
+
+def test_get_by_id_with_kit_with_integer_cod_kit(session):
+    from decimal import Decimal
+
+    from app.domain.models.category_model import Category
+    from app.domain.models.product_model import Product
+    from app.infrastructure.repositories.impl.product_repository_impl import ProductRepositoryImpl
+
+    category = Category("Kits")
+    session.add(category)
+    session.flush()
+
+    base = Product("9090", "Kit base", category.id_categoria, None, Decimal("10.00"), 1)
+    item_1 = Product("9091", "Item 1", category.id_categoria, None, Decimal("5.00"), 1, cod_kit="9090")
+    item_2 = Product("9092", "Item 2", category.id_categoria, None, Decimal("5.00"), 1, cod_kit="9090")
+    other = Product("7070", "Avulso", category.id_categoria, None, Decimal("1.00"), 1)
+    session.add_all([base, item_1, item_2, other])
+    session.flush()
+
+    repository = ProductRepositoryImpl()
+
+    product, kit_products = repository.get_by_id_with_kit(base.id_produto, session)
+    assert product.id_produto == base.id_produto
+    assert [p.codigo for p in kit_products] == ["9091", "9092"]
+
+    # Item de kit (cod_kit preenchido) não busca itens
+    product, kit_products = repository.get_by_id_with_kit(item_1.id_produto, session)
+    assert product.id_produto == item_1.id_produto
+    assert kit_products == []
+
+    product, kit_products = repository.get_by_id_with_kit(-1, session)
+    assert product is None
+    assert kit_products == []